@@ -7,207 +7,2333 @@ Python 3.8+
 """
 
 import customtkinter as ctk
+import argparse
+import copy
+import functools
 import json
-from typing import Dict, Any, List, Tuple
+import queue
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+import re
+import sys
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import messagebox
 
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: as rampas de cor caem para Python puro
+    np = None
+
+from showcase_sections import (SECTION_LAYOUT, SECTION_TITLES, SELECTED_RADIO, WidgetSpec, section_frame_spec,
+                               section_specs)
+from theme_compiler import (ThemeError, compile_theme, content_hash, diff_themes, load_compiled_theme,
+                            resolve_mode_tables)
+
 # Configuração inicial do CustomTkinter
 ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("blue")
+
+# Tema distribuído junto com o showcase
+THEME_PATH = Path(__file__).with_name("NEON_TRON.json")
+
+# Tema embutido usado como base para as chaves que o CTk exige e o JSON omite
+BASE_CTK_THEME = "blue"
+
+# Cores como o theme_compiler as normaliza (#RRGGBB maiúsculo)
+HEX_RGB_PATTERN = re.compile(r"#[0-9A-F]{6}")
+
+# Mensagem do ValueError do CTk para argumentos que o widget não aceita
+# (os demais ValueError do configure() são sobre o valor, não sobre a chave)
+UNSUPPORTED_ARGUMENT_PATTERN = re.compile(r"not (?:a )?supported argument")
+
+# Tipos de tema derivados: widgets de um tipo que o CTk desenha com outras
+# chaves do tema, como {derivado: (tipo base, {chave: chave de origem})}.
+# Um CTkFrame criado dentro de outro frame usa top_fg_color como fg_color.
+DERIVED_WIDGET_TYPES: Dict[str, Tuple[str, Dict[str, str]]] = {
+    "CTkFrame:top": ("CTkFrame", {"fg_color": "top_fg_color"}),
+}
+
+
+def _load_base_theme() -> Dict[str, Any]:
+    """Lê o tema embutido BASE_CTK_THEME pelo próprio CTk (com o filtro de plataforma)"""
+    ctk.set_default_color_theme(BASE_CTK_THEME)
+    return copy.deepcopy(ctk.ThemeManager.theme)
+
+
+# Lido uma única vez: trocas e recargas de tema só copiam o dicionário
+_BASE_THEME = _load_base_theme()
+
+
+def install_default_theme(theme_data: Dict[str, Any]) -> None:
+    """
+    Instala o tema como tema padrão do CustomTkinter
+    
+    As chaves que o CTk exige e o tema não define (ex: CTkFont,
+    CTkScrollableFrame, CTkButton.border_color) vêm do tema embutido
+    BASE_CTK_THEME, lido na importação, sem acesso a arquivo aqui.
+    Deve ser chamado antes de criar qualquer widget, que assim já nasce
+    com as cores do tema.
+    """
+    merged = copy.deepcopy(_BASE_THEME)
+    for widget_type, config in theme_data.items():
+        merged.setdefault(widget_type, {}).update(config)
+    ctk.ThemeManager.theme = merged
+
+
+def derive_widget_types(tables: Tuple[Dict[str, Dict[str, Any]], ...],
+                        deltas: Tuple[Dict[str, Dict[str, Any]], ...]) -> None:
+    """
+    Acrescenta às tabelas por modo e aos deltas as entradas de DERIVED_WIDGET_TYPES
+    
+    Cada tipo derivado recebe a configuração do tipo base com as chaves
+    renomeadas; as chaves de origem (ex: top_fg_color) ficam de fora.
+    """
+    for derived, (base, renamed) in DERIVED_WIDGET_TYPES.items():
+        for table in tables:
+            config = table.get(base)
+            if config is not None:
+                entry = {key: value for key, value in config.items() if key not in renamed.values()}
+                entry.update({key: config[source] for key, source in renamed.items() if source in config})
+                table[derived] = entry
+        if derived not in tables[0] or derived not in tables[1]:
+            continue
+        for mode, delta in enumerate(deltas):
+            mine, other = tables[mode][derived], tables[1 - mode][derived]
+            changed = {key: value for key, value in mine.items() if other.get(key) != value}
+            if changed:
+                delta[derived] = changed
+            else:
+                delta.pop(derived, None)
+
+
+def theme_value_matches(value: Any, theme_value: Any) -> bool:
+    """Se value é o valor do tema, como par (light, dark) ou já resolvido para um dos modos"""
+    if isinstance(value, list):
+        value = tuple(value)
+    if isinstance(theme_value, list):
+        theme_value = tuple(theme_value)
+    if value == theme_value:
+        return True
+    return isinstance(theme_value, tuple) and len(theme_value) == 2 and value in theme_value
+
+
+class ThemeProfiler:
+    """
+    Contadores e cronômetros das passadas de tema
+    
+    Desligado por padrão; com enabled = False o custo no caminho quente é
+    uma única verificação de atributo. Pode ser ligado e desligado a
+    qualquer momento e exportado como JSON.
+    """
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.reset()
+        
+    def reset(self) -> None:
+        """Zera todos os contadores"""
+        self.configure_calls = 0
+        self.key_failures: Dict[str, int] = {}
+        self.type_stats: Dict[str, List[float]] = {}  # tipo -> [widgets, segundos]
+        self.sections: Dict[str, List[float]] = {}  # nome -> [chamadas, segundos, máximo]
+        
+    def record_apply(self, widget_type: str, seconds: float, calls: int, failed_keys: List[str]) -> None:
+        """Registra a aplicação do tema a um widget"""
+        self.configure_calls += calls
+        for key in failed_keys:
+            name = f"{widget_type}.{key}"
+            self.key_failures[name] = self.key_failures.get(name, 0) + 1
+        stats = self.type_stats.setdefault(widget_type, [0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+        
+    def record_section(self, name: str, seconds: float) -> None:
+        """Registra a duração de uma etapa (ex: toggle_mode, update_idletasks)"""
+        stats = self.sections.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+        
+    def export(self) -> Dict[str, Any]:
+        """Retorna o perfil em um dicionário serializável em JSON (tempos em ms)"""
+        return {
+            "configure_calls": self.configure_calls,
+            "key_failures": dict(sorted(self.key_failures.items(), key=lambda item: -item[1])),
+            "widget_types": {
+                widget_type: {
+                    "widgets": count,
+                    "total_ms": seconds * 1000.0,
+                    "mean_us": seconds * 1e6 / count if count else 0.0,
+                }
+                for widget_type, (count, seconds) in sorted(self.type_stats.items(), key=lambda item: -item[1][1])
+            },
+            "sections": {
+                name: {"calls": calls, "total_ms": seconds * 1000.0, "max_ms": peak * 1000.0}
+                for name, (calls, seconds, peak) in self.sections.items()
+            },
+        }
+        
+    def export_json(self, path: Path, **extra: Any) -> None:
+        """Grava o perfil em um arquivo JSON, acrescido das seções extras informadas"""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({**self.export(), **extra}, file, indent=2)
+
+
+class RedrawBatch:
+    """
+    Adia os redesenhos de widgets CTk e redesenha cada um uma única vez
+    
+    Enquanto um widget está adiado, as chamadas a _draw() apenas o marcam
+    como sujo. Em flush(), o método original é restaurado e cada widget
+    sujo é redesenhado uma vez.
+    """
+    
+    def __init__(self):
+        self._patched: Dict[Any, bool] = {}  # widget -> precisa atualizar cores
+        self._dirty: Dict[Any, bool] = {}
+        
+    def defer(self, widget: Any) -> None:
+        """Passa a adiar os redesenhos do widget até o flush()"""
+        if widget in self._patched or not hasattr(widget, "_draw"):
+            return
+        self._patched[widget] = False
+        dirty = self._dirty
+        
+        def deferred_draw(no_color_updates: bool = False):
+            dirty[widget] = dirty.get(widget, False) or not no_color_updates
+            
+        # Atributo de instância sobrepõe o método da classe
+        widget._draw = deferred_draw
+        
+    def dirty_count(self) -> int:
+        """Quantidade de widgets com redesenho pendente"""
+        return len(self._dirty)
+        
+    def flush(self) -> None:
+        """Restaura os widgets e redesenha cada widget sujo exatamente uma vez"""
+        self._restore()
+        dirty, self._dirty = self._dirty, {}
+        for widget, update_colors in dirty.items():
+            try:
+                widget._draw(no_color_updates=not update_colors)
+            except Exception:
+                # Widget destruído durante o bloco
+                pass
+                
+    def discard(self) -> None:
+        """Restaura os widgets sem redesenhá-los; o redesenho fica a cargo de quem chamou"""
+        self._restore()
+        self._dirty = {}
+        
+    def _restore(self) -> None:
+        for widget in self._patched:
+            try:
+                del widget._draw
+            except AttributeError:
+                pass
+        self._patched = {}
+
+
+class ThemeManager:
+    """Gerenciador de temas customizados para CustomTkinter"""
+    
+    def __init__(self, theme_data: Dict[str, Any], native_modes: bool = False,
+                 compiled: Dict[str, Any] = None, profiler: ThemeProfiler = None):
+        """
+        Args:
+            theme_data: Tema no formato {tipo_widget: {chave: valor ou [light, dark]}}
+            native_modes: Aplica as cores como tuplas (light, dark) e deixa o
+                próprio CustomTkinter resolver o modo; a alternância passa a ser
+                só set_appearance_mode(), sem nenhuma passada sobre os widgets.
+            compiled: Artefato do theme_compiler para theme_data, cujas tabelas
+                são usadas diretamente em vez de resolvidas de novo
+            profiler: Instrumentação das passadas (padrão: um ThemeProfiler desligado)
+        """
+        self.theme_data = theme_data
+        self.native_modes = native_modes
+        self.profiler = profiler if profiler is not None else ThemeProfiler()
+        self.current_mode = 1  # 0 = light, 1 = dark
+        self._mode_tables: Tuple[Dict[str, Dict[str, Any]], ...] = ({}, {})
+        self._delta_tables: Tuple[Dict[str, Dict[str, Any]], ...] = ({}, {})
+        # Tabelas e deltas por modo do artefato, usados por color_pairs()
+        self._resolved: Optional[Tuple[List[Dict[str, Dict[str, Any]]], List[Dict[str, Dict[str, Any]]]]] = None
+        # Chaves recusadas por tipo de widget, aprendidas na primeira falha
+        self._rejected: Dict[str, set] = {}
+        # Valores recusados por tipo e chave (a chave continua sendo aplicada)
+        self._invalid_values: Dict[str, Dict[str, str]] = {}
+        self._batch: Optional[RedrawBatch] = None
+        # Janelas (CTk/CTkToplevel) cobertas por broadcast()
+        self._windows: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self.compile(compiled)
+        
+    @classmethod
+    def from_compiled(cls, compiled: Dict[str, Any], native_modes: bool = False,
+                      profiler: ThemeProfiler = None) -> "ThemeManager":
+        """Cria o gerenciador a partir de um artefato do theme_compiler"""
+        return cls(compiled["theme"], native_modes=native_modes, compiled=compiled, profiler=profiler)
+        
+    def compile(self, compiled: Dict[str, Any] = None) -> None:
+        """
+        Pré-compila o tema em tabelas de kwargs prontos por modo e tipo de widget
+        
+        Deve ser chamado novamente sempre que theme_data for alterado.
+        
+        Args:
+            compiled: Artefato do theme_compiler já resolvido para theme_data
+        """
+        self._resolved = (compiled["modes"], compiled["deltas"]) if compiled is not None else None
+        if self.native_modes:
+            # A mesma tabela de tuplas serve aos dois modos e não há delta
+            native = {
+                widget_type: {
+                    key: tuple(value) if isinstance(value, list) and len(value) == 2 else value
+                    for key, value in config.items()
+                }
+                for widget_type, config in self.theme_data.items()
+            }
+            self._mode_tables = (native, native)
+            self._delta_tables = ({}, {})
+            derive_widget_types(self._mode_tables, self._delta_tables)
+        else:
+            tables, deltas = self._resolved if self._resolved is not None else resolve_mode_tables(self.theme_data)
+            # Cópias rasas: as entradas por tipo são substituídas, nunca alteradas
+            self._mode_tables = tuple(dict(table) for table in tables)
+            self._delta_tables = tuple(dict(delta) for delta in deltas)
+            derive_widget_types(self._mode_tables, self._delta_tables)
+            
+        for widget_type in self._rejected:
+            self._drop_rejected(widget_type)
+        
+    def reload(self, compiled: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """
+        Troca o tema por um artefato recompilado do theme_compiler
+        
+        Returns:
+            Pares (tipo de widget, chave) que mudaram em relação ao tema
+            anterior, incluindo os tipos derivados (DERIVED_WIDGET_TYPES)
+        """
+        changed = diff_themes(self.theme_data, compiled["theme"])
+        for derived, (base, renamed) in DERIVED_WIDGET_TYPES.items():
+            sources = {source: key for key, source in renamed.items()}
+            changed += [(derived, sources.get(key, key)) for widget_type, key in list(changed)
+                        if widget_type == base and key not in renamed]
+        self.theme_data = compiled["theme"]
+        self.compile(compiled)
+        return changed
+    
+    def get_widget_config(self, widget_type: str, mode: int = None) -> Dict[str, Any]:
+        """
+        Retorna os kwargs compilados de um tipo de widget
+        
+        Args:
+            widget_type: Tipo do widget (ex: CTkButton, CTkLabel)
+            mode: 0 = light, 1 = dark (padrão: modo atual)
+        """
+        if mode is None:
+            mode = self.current_mode
+        return self._mode_tables[mode].get(widget_type, {})
+        
+    def changed_widget_types(self) -> List[str]:
+        """Retorna os tipos de widget que possuem alguma diferença entre light e dark"""
+        return list(self._delta_tables[0])
+        
+    def apply_theme_to_widget(self, widget: Any, widget_type: str,
+                              exclude: Tuple[str, ...] = ()) -> bool:
+        """
+        Aplica as configurações do tema a um widget específico
+        
+        Usa a tabela pré-compilada do modo atual e um único configure(),
+        de modo que o widget é redesenhado uma só vez.
+        
+        Args:
+            widget: Widget CustomTkinter para aplicar o tema
+            widget_type: Tipo do widget (ex: CTkButton, CTkLabel)
+            exclude: Chaves do tema que não devem ser aplicadas
+            
+        Returns:
+            True se algo foi aplicado (e o widget, redesenhado)
+        """
+        return self._configure(widget, widget_type, self._mode_tables[self.current_mode].get(widget_type), exclude)
+        
+    def apply_delta_to_widget(self, widget: Any, widget_type: str,
+                              exclude: Tuple[str, ...] = ()) -> bool:
+        """
+        Aplica ao widget apenas os valores que diferem entre os dois modos
+        
+        Pressupõe que o widget já recebeu o tema completo do modo anterior.
+        
+        Args:
+            widget: Widget CustomTkinter já tematizado
+            widget_type: Tipo do widget (ex: CTkButton, CTkLabel)
+            exclude: Chaves do tema que não devem ser aplicadas
+            
+        Returns:
+            True se algo foi aplicado (e o widget, redesenhado)
+        """
+        return self._configure(widget, widget_type, self._delta_tables[self.current_mode].get(widget_type), exclude)
+        
+    def apply_keys_to_widget(self, widget: Any, widget_type: str, keys: Iterable[str],
+                             exclude: Tuple[str, ...] = ()) -> None:
+        """
+        Aplica ao widget só as chaves dadas, com os valores do modo atual
+        
+        Chaves que não existem mais no tema são ignoradas: o widget mantém
+        o valor atual até ser recriado.
+        """
+        table = self._mode_tables[self.current_mode].get(widget_type, {})
+        self._configure(widget, widget_type, {key: table[key] for key in keys if key in table}, exclude)
+        
+    def apply_config_to_widget(self, widget: Any, widget_type: str, kwargs: Dict[str, Any],
+                               exclude: Tuple[str, ...] = ()) -> None:
+        """
+        Aplica valores arbitrários do tema (ex: quadros de uma transição) a um widget
+        
+        Passa pelo mesmo caminho das passadas de tema: lote de redesenho,
+        instrumentação e aprendizado de chaves recusadas.
+        """
+        rejected = self._rejected.get(widget_type)
+        if rejected:
+            kwargs = {key: value for key, value in kwargs.items() if key not in rejected}
+        self._configure(widget, widget_type, kwargs, exclude)
+        
+    def color_pairs(self) -> List[Tuple[str, str, str, str]]:
+        """
+        Cores hexadecimais do tema que diferem entre light e dark
+        
+        Returns:
+            Lista de (tipo de widget, chave, cor light, cor dark), sem as
+            chaves recusadas pelos widgets
+        """
+        # Com o artefato, as tabelas já vieram resolvidas do worker (ver compile)
+        tables, deltas = self._resolved if self._resolved is not None else resolve_mode_tables(self.theme_data)
+        deltas = tuple(dict(delta) for delta in deltas)
+        derive_widget_types(tuple(dict(table) for table in tables), deltas)
+        # Chaves de origem dos tipos derivados (ex: CTkFrame.top_fg_color) não são opções do widget
+        sources = {base: set(renamed.values()) for base, renamed in DERIVED_WIDGET_TYPES.values()}
+        pairs = []
+        for widget_type, dark_config in deltas[1].items():
+            rejected = self._rejected.get(widget_type, set()) | sources.get(widget_type, set())
+            for key, dark in dark_config.items():
+                light = deltas[0][widget_type][key]
+                if key in rejected or not (isinstance(light, str) and isinstance(dark, str)):
+                    continue
+                if HEX_RGB_PATTERN.fullmatch(light) and HEX_RGB_PATTERN.fullmatch(dark):
+                    pairs.append((widget_type, key, light, dark))
+        return pairs
+        
+    @contextmanager
+    def batch(self, widgets: Iterable[Any] = ()) -> Iterator[RedrawBatch]:
+        """
+        Adia os redesenhos durante o bloco; cada widget sujo é redesenhado uma vez no fim
+        
+        Widgets tematizados por este gerenciador dentro do bloco são adiados
+        automaticamente. Para edições programáticas, passe os widgets em
+        `widgets` ou chame defer() no lote retornado antes de configurá-los.
+        Blocos aninhados compartilham o lote mais externo.
+        
+        Exemplo:
+            with theme_manager.batch(widgets) as batch:
+                for widget in widgets:
+                    widget.configure(fg_color=..., border_width=...)
+        """
+        if self._batch is not None:
+            for widget in widgets:
+                self._batch.defer(widget)
+            yield self._batch
+            return
+            
+        batch = self._batch = RedrawBatch()
+        try:
+            for widget in widgets:
+                batch.defer(widget)
+            yield batch
+        finally:
+            self._batch = None
+            batch.flush()
+            
+    def rejected_keys_report(self) -> Dict[str, List[str]]:
+        """Chaves do tema recusadas pelo configure() de cada tipo de widget"""
+        return {widget_type: sorted(keys) for widget_type, keys in self._rejected.items() if keys}
+        
+    def invalid_values_report(self) -> Dict[str, Dict[str, str]]:
+        """Valores do tema recusados pelo configure(), com a mensagem do CTk, por tipo e chave"""
+        return {widget_type: dict(sorted(keys.items())) for widget_type, keys in self._invalid_values.items()}
+        
+    def _configure(self, widget: Any, widget_type: str, kwargs: Dict[str, Any],
+                   exclude: Tuple[str, ...] = ()) -> bool:
+        """
+        Aplica kwargs com um único configure()
+        
+        Se o widget recusar o lote, aplica chave a chave uma única vez e
+        registra as chaves recusadas (ValueError do CTk de argumento não
+        suportado), que deixam de ser enviadas a este tipo de widget daí em
+        diante. Um valor inaceitável só é reportado (invalid_values_report):
+        a chave continua válida para os outros valores.
+        
+        Returns:
+            False se não havia nada a aplicar
+        """
+        if exclude and kwargs:
+            kwargs = {key: value for key, value in kwargs.items() if key not in exclude}
+        if not kwargs:
+            return False
+            
+        if self._batch is not None:
+            self._batch.defer(widget)
+            
+        profiler = self.profiler
+        if not profiler.enabled:
+            self._push(widget, widget_type, kwargs)
+            return True
+            
+        start = time.perf_counter()
+        calls, failed_keys = self._push(widget, widget_type, kwargs)
+        profiler.record_apply(widget_type, time.perf_counter() - start, calls, failed_keys)
+        return True
+        
+    def _push(self, widget: Any, widget_type: str, kwargs: Dict[str, Any]) -> Tuple[int, List[str]]:
+        """
+        Executa os configure() de _configure
+        
+        Returns:
+            (chamadas a configure, chaves que falharam)
+        """
+        try:
+            widget.configure(**kwargs)
+            return 1, []
+        except Exception:
+            rejected = []
+            failed = []
+            for key, value in kwargs.items():
+                try:
+                    widget.configure(**{key: value})
+                except ValueError as error:
+                    if UNSUPPORTED_ARGUMENT_PATTERN.search(str(error)):
+                        rejected.append(key)
+                    else:
+                        # Ex: tupla de cores com "transparent"; a chave em si é aceita
+                        self._invalid_values.setdefault(widget_type, {})[key] = str(error)
+                        failed.append(key)
+                except Exception:
+                    # Ex: widget já destruído; não diz nada sobre a chave
+                    failed.append(key)
+            if rejected:
+                self._rejected.setdefault(widget_type, set()).update(rejected)
+                self._drop_rejected(widget_type)
+            return 1 + len(kwargs), rejected + failed
+            
+    def _drop_rejected(self, widget_type: str) -> None:
+        """Remove as chaves recusadas das tabelas e deltas de um tipo de widget"""
+        rejected = self._rejected[widget_type]
+        for tables in (self._mode_tables, self._delta_tables):
+            for table in tables:
+                if widget_type not in table:
+                    continue
+                kwargs = {key: value for key, value in table[widget_type].items() if key not in rejected}
+                if kwargs or tables is self._mode_tables:
+                    table[widget_type] = kwargs
+                else:
+                    # Sem delta restante, o tipo é ignorado na alternância
+                    del table[widget_type]
+    
+    def toggle_mode(self, skip_redraw: Iterable[Any] = ()) -> str:
+        """
+        Alterna entre modo light e dark
+        
+        Em native_modes isto é tudo o que a troca exige: o CustomTkinter
+        redesenha os widgets a partir das tuplas já aplicadas.
+        
+        Args:
+            skip_redraw: Widgets que o set_appearance_mode() não deve
+                redesenhar, porque quem chama vai redesenhá-los depois (ex:
+                a passada fatiada do IncrementalThemeApplier). Ignorado
+                dentro de um batch(), que já adia os redesenhos.
+        """
+        self.current_mode = 1 - self.current_mode
+        mode = "light" if self.current_mode == 0 else "dark"
+        
+        suppressed = RedrawBatch()
+        if self._batch is None:
+            for widget in skip_redraw:
+                suppressed.defer(widget)
+                
+        # set_appearance_mode redesenha todos os widgets CTk de uma vez
+        start = time.perf_counter()
+        try:
+            ctk.set_appearance_mode(mode)
+        finally:
+            suppressed.discard()
+        if self.profiler.enabled:
+            self.profiler.record_section("toggle_mode", time.perf_counter() - start)
+        return mode
+    
+    def track_window(self, window: Any) -> None:
+        """Inclui uma janela (CTk ou CTkToplevel) nas passadas de broadcast()"""
+        self._windows.add(window)
+        
+    def windows(self) -> List[Any]:
+        """Janelas rastreadas ainda abertas"""
+        alive = []
+        for window in list(self._windows):
+            try:
+                if window.winfo_exists():
+                    alive.append(window)
+            except Exception:
+                pass
+        return alive
+    
+    def broadcast(self, registry: "WidgetRegistry", toggle: bool = False,
+                  keys_by_type: Dict[str, Iterable[str]] = None) -> Optional[str]:
+        """
+        Aplica uma troca de modo e/ou de tema a todas as janelas em uma única passada
+        
+        Os widgets de todas as janelas entram no mesmo lote de redesenho, e
+        um único update_idletasks() processa as janelas juntas (elas dividem
+        o mesmo interpretador Tcl), em vez de um update() por janela.
+        
+        Args:
+            registry: Registro com os widgets das janelas rastreadas
+            toggle: Alterna o modo (ver toggle_mode)
+            keys_by_type: Chaves a reaplicar por tipo, com os valores do modo
+                atual (ex: após reload() ou ao fim de uma transição)
+        
+        Returns:
+            O novo modo, se toggle
+        """
+        start = time.perf_counter()
+        mode = None
+        # set_appearance_mode redesenha todos os widgets; se eles ainda vão
+        # receber outros valores, são adiados de antemão para que cada um seja
+        # redesenhado uma única vez, já com os valores finais
+        touched_again = keys_by_type or not self.native_modes
+        deferred = (widget for _, widget in registry) if toggle and touched_again else ()
+        with self.batch(deferred):
+            if toggle:
+                mode = self.toggle_mode()
+                if not self.native_modes:
+                    changed_types = set(self.changed_widget_types())
+                    for widget_type in registry.types():
+                        if widget_type not in changed_types:
+                            continue
+                        for widget in registry.widgets_of_type(widget_type):
+                            self.apply_delta_to_widget(widget, widget_type, registry.preserved_keys(widget))
+            for widget_type, keys in (keys_by_type or {}).items():
+                keys = list(keys)
+                for widget in registry.widgets_of_type(widget_type):
+                    self.apply_keys_to_widget(widget, widget_type, keys, registry.preserved_keys(widget))
+                    
+        windows = self.windows()
+        if windows:
+            windows[0].update_idletasks()
+        if self.profiler.enabled:
+            self.profiler.record_section("broadcast", time.perf_counter() - start)
+        return mode
+
+
+class WidgetRegistry:
+    """
+    Registro de widgets agrupados por tipo de tema
+    
+    Guarda apenas referências fracas: widgets destruídos e liberados
+    desaparecem do registro sozinhos, sem varreduras de limpeza. Com
+    track_creation(), cada widget é registrado no momento em que é criado
+    (seções sob demanda, diálogos, linhas de listas...), sem depender de
+    um scan() posterior. Frames aninhados, que o CTk desenha com
+    top_fg_color, ficam no tipo derivado "CTkFrame:top" (ver
+    DERIVED_WIDGET_TYPES) e mantêm o contraste nas trocas de modo e de tema.
+    """
+    
+    # Tipos que podem conter outros widgets do usuário
+    CONTAINER_TYPES = ("CTk", "CTkToplevel", "CTkFrame")
+    
+    # Registros alimentados na criação dos widgets e __init__ próprios originais
+    # das classes CTk envolvidas (None quando a classe herdava o __init__)
+    _creation_targets: "weakref.WeakSet[WidgetRegistry]" = weakref.WeakSet()
+    _original_inits: Dict[type, Optional[Callable[..., None]]] = {}
+    
+    def __init__(self, known_types: Iterable[str]):
+        self.known_types = set(known_types)
+        self._by_type: Dict[str, "weakref.WeakSet[Any]"] = {}
+        # Tipo com que cada widget foi registrado (pode ser um tipo derivado)
+        self._types: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+        self._preserved: "weakref.WeakKeyDictionary[Any, Tuple[str, ...]]" = weakref.WeakKeyDictionary()
+        # Widgets cujas chaves próprias ainda não foram calculadas (ver preserved_keys)
+        self._pending: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._type_cache: Dict[type, Optional[str]] = {}
+        
+    def resolve_type(self, widget: Any) -> Optional[str]:
+        """Deriva o tipo de tema a partir da classe (ou superclasses) do widget"""
+        cls = type(widget)
+        if cls not in self._type_cache:
+            self._type_cache[cls] = next(
+                (base.__name__ for base in cls.__mro__ if base.__name__ in self.known_types),
+                None
+            )
+        return self._type_cache[cls]
+        
+    def register(self, widget: Any, widget_type: str = None) -> Optional[str]:
+        """
+        Registra um widget para receber o tema
+        
+        Args:
+            widget: Widget CustomTkinter
+            widget_type: Tipo de tema (padrão: derivado da classe)
+            
+        Returns:
+            O tipo registrado, ou None se o widget não tiver tema. Pode ser
+            um tipo derivado (ver derive_type)
+        """
+        if widget_type is None:
+            widget_type = self.resolve_type(widget)
+            if widget_type is None:
+                return None
+        widget_type = self.derive_type(widget, widget_type)
+        
+        previous = self._types.get(widget)
+        if previous is not None and previous != widget_type:
+            self._by_type[previous].discard(widget)
+        self._types[widget] = widget_type
+        self._by_type.setdefault(widget_type, weakref.WeakSet()).add(widget)
+        
+        # As chaves próprias só são calculadas quando uma passada as pede;
+        # widgets reaproveitados pelo WidgetFactory voltam a ficar pendentes,
+        # para que valham as opções da nova spec
+        self._preserved.pop(widget, None)
+        self._pending.add(widget)
+        return widget_type
+        
+    def custom_keys(self, widget: Any, widget_type: str) -> Tuple[str, ...]:
+        """
+        Chaves do tema que o widget recebeu com valor próprio na criação
+        
+        Ex: fg_color="transparent", as cores de um botão de destaque ou a
+        borda de um frame. Essas chaves ficam fora de todas as passadas de
+        tema (preserved_keys), inclusive da recarga do tema. Compara com o
+        tema padrão atual do CTk, então vale até a primeira passada ou
+        troca de tema depois do registro.
+        """
+        theme = ctk.ThemeManager.theme
+        if widget_type in DERIVED_WIDGET_TYPES:
+            base = DERIVED_WIDGET_TYPES[widget_type][0]
+            table = {base: theme.get(base, {})}
+            derive_widget_types((table, table), ({}, {}))
+            config = table[widget_type]
+        else:
+            config = theme.get(widget_type, {})
+            
+        custom = []
+        for key, theme_value in config.items():
+            try:
+                value = widget.cget(key)
+            except (ValueError, tk.TclError):
+                # Chave que o tipo não aceita (ex: CTkFrame.top_fg_color)
+                continue
+            except Exception:
+                # Ex: widget já destruído
+                return ()
+            if not theme_value_matches(value, theme_value):
+                custom.append(key)
+        return tuple(custom)
+        
+    def unregister(self, widget: Any) -> None:
+        """Tira um widget do registro (ex: ao voltar para o pool do WidgetFactory)"""
+        widget_type = self._types.pop(widget, None)
+        if widget_type is not None:
+            self._by_type[widget_type].discard(widget)
+        self._preserved.pop(widget, None)
+        self._pending.discard(widget)
+        
+    def derive_type(self, widget: Any, widget_type: str) -> str:
+        """
+        Tipo derivado (DERIVED_WIDGET_TYPES) que o widget segue no tema
+        
+        Um widget pertence ao tipo derivado quando o CTk resolveu as chaves
+        renomeadas a partir das chaves de origem (ex: o fg_color de um frame
+        aninhado é o top_fg_color do tema padrão). Caso contrário, widget_type.
+        """
+        for derived, (base, renamed) in DERIVED_WIDGET_TYPES.items():
+            if base != widget_type:
+                continue
+            config = ctk.ThemeManager.theme.get(base, {})
+            try:
+                if all(source in config
+                       and theme_value_matches(widget.cget(key), config[source])
+                       and not theme_value_matches(widget.cget(key), config.get(key))
+                       for key, source in renamed.items()):
+                    return derived
+            except (ValueError, tk.TclError):
+                pass
+        return widget_type
+        
+    def track_creation(self) -> None:
+        """
+        Passa a registrar os widgets dos tipos conhecidos assim que são criados
+        
+        Envolve o __init__ das classes CTk correspondentes até que o último
+        registro chame stop_tracking(); o registro acontece ao fim do
+        construtor, com o widget já configurado.
+        Filhos internos de widgets compostos ficam de fora, como em walk().
+        """
+        WidgetRegistry._creation_targets.add(self)
+        for widget_type in self.known_types:
+            cls = getattr(ctk, widget_type, None)
+            if isinstance(cls, type) and issubclass(cls, tk.Misc) and cls not in self._original_inits:
+                self._wrap_init(cls)
+                
+    def stop_tracking(self) -> None:
+        """
+        Deixa de receber os widgets criados daqui em diante
+        
+        Quando nenhum registro acompanha mais a criação, as classes CTk
+        voltam aos __init__ originais.
+        """
+        WidgetRegistry._creation_targets.discard(self)
+        if WidgetRegistry._creation_targets:
+            return
+        for widget_class, own_init in WidgetRegistry._original_inits.items():
+            if own_init is None:
+                del widget_class.__init__
+            else:
+                widget_class.__init__ = own_init
+        WidgetRegistry._original_inits.clear()
+        
+    @classmethod
+    def _wrap_init(cls, widget_class: type) -> None:
+        cls._original_inits[widget_class] = widget_class.__dict__.get("__init__")
+        original = widget_class.__init__
+        targets = cls._creation_targets
+        
+        def __init__(widget, *args, **kwargs):
+            original(widget, *args, **kwargs)
+            # Em subclasses, o registro se repete ao fim de cada construtor
+            # envolvido; register() é idempotente e o último vence
+            for registry in list(targets):
+                registry._on_created(widget)
+                
+        widget_class.__init__ = __init__
+        
+    def _on_created(self, widget: Any) -> None:
+        master = getattr(widget, "master", None)
+        if master is not None:
+            master_type = self.resolve_type(master)
+            if master_type is not None and master_type not in self.CONTAINER_TYPES:
+                # Ex: scrollbars de um CTkTextbox, tematizadas pelo próprio widget
+                return
+        self.register(widget)
+        
+    def scan(self, root: Any) -> int:
+        """
+        Registra root e todos os widgets descendentes ainda não registrados
+        
+        Não desce nos filhos internos de widgets compostos (ex: as
+        scrollbars de um CTkTextbox), que são tematizados pelo próprio widget.
+        
+        Returns:
+            Quantidade de widgets registrados nesta varredura
+        """
+        count = 0
+        for widget_type, widget in self.walk(root):
+            if widget not in self._types:
+                self.register(widget, widget_type)
+                count += 1
+        return count
+        
+    def walk(self, root: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Percorre root e descendentes com tipo de tema, como em scan(), sem registrar
+        
+        Widgets já registrados vêm com o tipo do registro (ex: "CTkFrame:top").
+        """
+        pending = [root]
+        while pending:
+            widget = pending.pop()
+            widget_type = self.resolve_type(widget)
+            if widget_type is not None:
+                yield self._types.get(widget, widget_type), widget
+            if widget_type is None or widget_type in self.CONTAINER_TYPES:
+                pending.extend(widget.winfo_children())
+        
+    def types(self) -> List[str]:
+        """Tipos com pelo menos um widget registrado"""
+        return [widget_type for widget_type, widgets in self._by_type.items() if widgets]
+        
+    def widgets_of_type(self, widget_type: str) -> List[Any]:
+        """Widgets vivos de um tipo"""
+        return list(self._by_type.get(widget_type, ()))
+        
+    def preserved_keys(self, widget: Any) -> Tuple[str, ...]:
+        """
+        Chaves do tema que não devem ser aplicadas a este widget (ver custom_keys)
+        
+        Calculadas na primeira chamada após o registro, antes de a passada
+        que as pediu configurar o widget.
+        """
+        if widget in self._pending:
+            self._pending.discard(widget)
+            custom = self.custom_keys(widget, self._types[widget])
+            if custom:
+                self._preserved[widget] = custom
+        return self._preserved.get(widget, ())
+        
+    def resolve_pending(self) -> None:
+        """Calcula as chaves próprias ainda pendentes; chamado antes de o tema padrão do CTk mudar"""
+        for widget in list(self._pending):
+            self.preserved_keys(widget)
+        
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        for widget_type, widgets in list(self._by_type.items()):
+            for widget in list(widgets):
+                yield widget_type, widget
+                
+    def __len__(self) -> int:
+        return sum(len(widgets) for widgets in self._by_type.values())
+
+
+class IncrementalThemeApplier:
+    """
+    Aplica o tema em fatias agendadas com after(), sem congelar a interface
+    
+    Cada fatia roda no máximo frame_budget_ms e devolve o controle ao loop
+    de eventos. Widgets visíveis são tematizados primeiro, e um novo start()
+    substitui a passada que ainda estiver em andamento.
+    """
+    
+    def __init__(self, root: Any, theme_manager: ThemeManager, registry: WidgetRegistry,
+                 frame_budget_ms: float = 8.0):
+        self.root = root
+        self.theme_manager = theme_manager
+        self.registry = registry
+        self.frame_budget = frame_budget_ms / 1000.0
+        self._queue: Deque[Tuple[str, Any]] = deque()
+        self._job: Optional[str] = None
+        self._generation = 0
+        self._delta_only = False
+        self._redraw = False
+        self._on_done: Optional[Callable[[], None]] = None
+        self._started = 0.0
+        
+    @property
+    def running(self) -> bool:
+        """Indica se há uma passada em andamento"""
+        return self._job is not None
+        
+    def start(self, delta_only: bool = False, on_done: Callable[[], None] = None,
+              redraw: bool = False) -> None:
+        """
+        Inicia uma nova passada, cancelando a anterior
+        
+        Args:
+            delta_only: Aplica apenas as chaves que mudam entre light e dark
+            on_done: Chamado quando a passada termina (não é chamado se for substituída)
+            redraw: Redesenha também os widgets que a passada não altera, após
+                um toggle_mode(skip_redraw=...) que não os redesenhou
+        """
+        # Uma passada completa interrompida deixa widgets sem o tema base,
+        # então a passada que a substitui também precisa ser completa; o
+        # mesmo vale para os redesenhos ainda pendentes.
+        if self.running:
+            delta_only = delta_only and self._delta_only
+            redraw = redraw or self._redraw
+        self.cancel()
+        
+        if delta_only and not redraw:
+            changed_types = set(self.theme_manager.changed_widget_types())
+            widget_types = [t for t in self.registry.types() if t in changed_types]
+        else:
+            widget_types = self.registry.types()
+            
+        visible: List[Tuple[str, Any]] = []
+        hidden: List[Tuple[str, Any]] = []
+        for widget_type in widget_types:
+            for widget in self.registry.widgets_of_type(widget_type):
+                try:
+                    viewable = widget.winfo_viewable()
+                except Exception:
+                    continue
+                (visible if viewable else hidden).append((widget_type, widget))
+                
+        self._queue = deque(visible)
+        self._queue.extend(hidden)
+        self._delta_only = delta_only
+        self._redraw = redraw
+        self._on_done = on_done
+        self._started = time.perf_counter()
+        self._generation += 1
+        self._job = self.root.after(0, self._step, self._generation)
+        
+    def cancel(self) -> None:
+        """Cancela a passada em andamento, se houver"""
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                pass
+        self._job = None
+        self._queue.clear()
+        
+    def _step(self, generation: int) -> None:
+        """Processa uma fatia da fila dentro do orçamento de tempo"""
+        if generation != self._generation:
+            return
+            
+        apply = (self.theme_manager.apply_delta_to_widget if self._delta_only
+                 else self.theme_manager.apply_theme_to_widget)
+        preserved_keys = self.registry.preserved_keys
+        queue = self._queue
+        deadline = time.perf_counter() + self.frame_budget
+        
+        redraw = self._redraw
+        while queue and time.perf_counter() < deadline:
+            widget_type, widget = queue.popleft()
+            if not apply(widget, widget_type, preserved_keys(widget)) and redraw:
+                # Nada a aplicar, mas as cores (light, dark) próprias do widget mudam de modo
+                draw = getattr(widget, "_draw", None)
+                if draw is not None:
+                    try:
+                        draw()
+                    except Exception:
+                        pass
+            
+        if queue:
+            # after(1) em vez de after(0) deixa o Tk processar eventos e redesenhos
+            self._job = self.root.after(1, self._step, generation)
+            return
+            
+        self._job = None
+        profiler = self.theme_manager.profiler
+        if profiler.enabled:
+            profiler.record_section("incremental_pass", time.perf_counter() - self._started)
+        on_done, self._on_done = self._on_done, None
+        if on_done is not None:
+            on_done()
+
+
+class ModeTransition:
+    """
+    Transição animada entre light e dark com rampas de cor pré-calculadas
+    
+    Para cada par (light, dark) de cor do tema, a rampa de interpolação é
+    calculada uma única vez (vetorizada com NumPy, quando disponível). Cada
+    quadro só escolhe a linha da rampa pelo tempo decorrido e envia aos
+    widgets as cores que mudaram desde o último quadro exibido, dentro de
+    um lote de redesenho. Quadros atrasados são pulados, nunca enfileirados.
+    """
+    
+    def __init__(self, root: Any, theme_manager: ThemeManager, registry: WidgetRegistry,
+                 duration_ms: int = 250, fps: int = 60):
+        self.root = root
+        self.theme_manager = theme_manager
+        self.registry = registry
+        self.duration = duration_ms / 1000.0
+        self.frame_interval_ms = max(1, round(1000 / fps))
+        self.steps = max(1, round(duration_ms * fps / 1000))
+        self._job: Optional[str] = None
+        self._generation = 0
+        self._on_done: Optional[Callable[[str], None]] = None
+        self.rebuild()
+        
+    @property
+    def running(self) -> bool:
+        """Indica se há uma transição em andamento"""
+        return self._job is not None
+    
+    def rebuild(self) -> None:
+        """Recalcula as rampas; deve ser chamado sempre que o tema mudar"""
+        self.finish()
+        self._pairs = self.theme_manager.color_pairs()
+        self._ramp = self.build_ramp([pair[2] for pair in self._pairs],
+                                     [pair[3] for pair in self._pairs], self.steps)
+        
+    @staticmethod
+    def build_ramp(light: List[str], dark: List[str], steps: int) -> List[Tuple[str, ...]]:
+        """
+        Interpola cada par de cores em steps + 1 quadros
+        
+        Returns:
+            Quadros de light (índice 0) a dark (índice steps), cada um com
+            uma cor #RRGGBB por par
+        """
+        if not light:
+            return [()] * (steps + 1)
+        
+        if np is not None:
+            start = np.array([[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in light], dtype=np.float64)
+            end = np.array([[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in dark], dtype=np.float64)
+            t = np.linspace(0.0, 1.0, steps + 1)[:, None, None]
+            rgb = np.rint(start + (end - start) * t).astype(np.uint8)
+            hex_digits = np.array([f"{value:02X}" for value in range(256)])
+            frames = np.char.add(np.char.add(np.char.add("#", hex_digits[rgb[..., 0]]),
+                                             hex_digits[rgb[..., 1]]), hex_digits[rgb[..., 2]])
+            return [tuple(frame) for frame in frames.tolist()]
+        
+        channels = [
+            (tuple(int(a[i:i + 2], 16) for i in (1, 3, 5)), tuple(int(b[i:i + 2], 16) for i in (1, 3, 5)))
+            for a, b in zip(light, dark)
+        ]
+        frames = []
+        for step in range(steps + 1):
+            t = step / steps
+            frames.append(tuple(
+                "#%02X%02X%02X" % tuple(round(x + (y - x) * t) for x, y in zip(start, end))
+                for start, end in channels
+            ))
+        return frames
+    
+    def start(self, on_done: Callable[[str], None] = None) -> None:
+        """
+        Anima a troca para o outro modo
+        
+        Uma transição já em andamento é concluída imediatamente antes.
+        
+        Args:
+            on_done: Recebe o novo modo ("light" ou "dark") ao fim da transição
+        """
+        if self.running:
+            self.finish()
+            
+        # Rampa percorrida no sentido da troca
+        self._frames = self._ramp if self.theme_manager.current_mode == 0 else self._ramp[::-1]
+        self._shown = self._frames[0]
+        self._on_done = on_done
+        self._started = time.perf_counter()
+        self._generation += 1
+        self._job = self.root.after(self.frame_interval_ms, self._frame, self._generation)
+        
+    def cancel(self) -> None:
+        """Interrompe a transição sem concluir a troca de modo"""
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                pass
+        self._job = None
+        
+    def finish(self) -> None:
+        """Conclui a transição em andamento imediatamente"""
+        if self.running:
+            self.cancel()
+            self._complete()
+            
+    def _frame(self, generation: int) -> None:
+        if generation != self._generation:
+            return
+        
+        frame_start = time.perf_counter()
+        step = min(self.steps, int((frame_start - self._started) / self.duration * self.steps))
+        if step >= self.steps:
+            self._job = None
+            self._complete()
+            return
+        
+        # Com o loop atrasado, step salta direto para o quadro do tempo atual
+        self._push(self._frames[step])
+        
+        # Limita a taxa de quadros descontando o tempo gasto neste quadro
+        spent_ms = (time.perf_counter() - frame_start) * 1000.0
+        delay = max(1, int(self.frame_interval_ms - spent_ms))
+        self._job = self.root.after(delay, self._frame, generation)
+        
+    def _push(self, colors: Tuple[str, ...]) -> None:
+        """Envia aos widgets só as cores diferentes das exibidas"""
+        changed: Dict[str, Dict[str, str]] = {}
+        for (widget_type, key, _, _), color, shown in zip(self._pairs, colors, self._shown):
+            if color != shown:
+                changed.setdefault(widget_type, {})[key] = color
+        self._shown = colors
+        if not changed:
+            return
+        
+        manager = self.theme_manager
+        with manager.batch():
+            for widget_type, kwargs in changed.items():
+                for widget in self.registry.widgets_of_type(widget_type):
+                    manager.apply_config_to_widget(widget, widget_type, kwargs,
+                                                   self.registry.preserved_keys(widget))
+                    
+    def _complete(self) -> None:
+        """Troca o modo de fato e devolve aos widgets os valores finais do tema"""
+        manager = self.theme_manager
+        keys: Dict[str, List[str]] = {}
+        if manager.native_modes:
+            # Os quadros substituíram as tuplas por cores fixas; as tuplas voltam
+            # para que o CustomTkinter siga resolvendo o modo sozinho
+            for widget_type, key, _, _ in self._pairs:
+                keys.setdefault(widget_type, []).append(key)
+        # Fora de native_modes, a própria alternância reaplica os deltas
+        mode = manager.broadcast(self.registry, toggle=True, keys_by_type=keys)
+        
+        if self._on_done is not None:
+            self._on_done(mode)
+
+
+class ThemeWatcher:
+    """
+    Observa o arquivo do tema por polling com after() e recarrega quando o conteúdo muda
+    
+    A cada intervalo só o stat() do arquivo é consultado. O conteúdo é lido
+    quando mtime ou tamanho mudam, e recompilado só quando o hash também
+    muda (salvar sem alterar nada não dispara recarga). Um tema inválido é
+    reportado a on_error e o tema anterior continua em uso.
+    """
+    
+    def __init__(self, root: Any, path: Path, on_change: Callable[[Dict[str, Any]], None],
+                 on_error: Callable[[Exception], None] = None, interval_ms: int = 500,
+                 current_hash: str = None):
+        """
+        Args:
+            root: Widget usado para agendar o polling
+            path: Arquivo JSON do tema
+            on_change: Recebe o artefato recompilado (ver theme_compiler.compile_theme)
+            on_error: Recebe o erro de um tema inválido (padrão: stderr)
+            interval_ms: Intervalo entre verificações
+            current_hash: Hash do conteúdo já carregado, para não recarregá-lo
+        """
+        self.root = root
+        self.path = Path(path)
+        self.on_change = on_change
+        self.on_error = on_error if on_error is not None else self._report
+        self.interval_ms = interval_ms
+        self._hash = current_hash
+        self._signature = self._stat()
+        self._job: Optional[str] = None
+        
+    def start(self) -> None:
+        if self._job is None:
+            self._job = self.root.after(self.interval_ms, self._poll)
+            
+    def watch(self, path: Path, current_hash: str = None) -> None:
+        """Passa a observar outro arquivo (ex: após trocar de tema)"""
+        self.path = Path(path)
+        self._hash = current_hash
+        self._signature = self._stat()
+        
+    def stop(self) -> None:
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+            
+    def check(self) -> bool:
+        """
+        Verifica o arquivo uma vez
+        
+        Returns:
+            True se o tema foi recarregado
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        
+        try:
+            raw = self.path.read_bytes()
+        except OSError:
+            # Ex: editor no meio de um save via rename; tenta de novo no próximo ciclo
+            return False
+        self._signature = signature
+        
+        digest = content_hash(raw)
+        if digest == self._hash:
+            return False
+        # O hash é guardado mesmo se o tema for inválido, para reportar o erro uma só vez
+        self._hash = digest
+        
+        try:
+            compiled = compile_theme(raw, str(self.path))
+        except ThemeError as error:
+            self.on_error(error)
+            return False
+        self.on_change(compiled)
+        return True
+    
+    def _poll(self) -> None:
+        try:
+            self.check()
+        finally:
+            self._job = self.root.after(self.interval_ms, self._poll)
+            
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    @staticmethod
+    def _report(error: Exception) -> None:
+        print(f"Tema não recarregado, mantendo o anterior: {error}", file=sys.stderr)
+
+
+class ThemeLoader:
+    """
+    Carrega e compila temas em uma thread, fora do loop do Tk
+    
+    Leitura do arquivo, parse, validação e resolução das tabelas por modo
+    rodam no worker (ver theme_compiler.load_compiled_theme). O resultado
+    volta por uma fila consultada com after(), e os callbacks, que fazem os
+    configure(), rodam sempre na thread do Tk. Um novo load() substitui o
+    anterior: o trabalho ainda não iniciado é pulado e resultados atrasados
+    são descartados.
+    """
+    
+    # Marca do worker para um carregamento substituído antes de começar
+    SUPERSEDED = object()
+    
+    def __init__(self, root: Any = None, poll_ms: int = 16):
+        """
+        Args:
+            root: Widget usado para agendar a consulta à fila; pode ser
+                definido depois, se submit() for usado antes da janela existir
+            poll_ms: Intervalo de consulta à fila enquanto há carregamentos pendentes
+        """
+        self.root = root
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="theme-loader")
+        self._results: "queue.Queue[Tuple[int, Any, Callable, Callable]]" = queue.Queue()
+        self._generation = 0
+        self._in_flight = 0
+        self._job: Optional[str] = None
+        
+    @property
+    def loading(self) -> bool:
+        """Indica se há um carregamento em andamento"""
+        return self._in_flight > 0
+    
+    def submit(self, path: Path) -> "Future[Dict[str, Any]]":
+        """Compila o tema no worker e devolve o Future, sem passar pela fila"""
+        return self._executor.submit(load_compiled_theme, path)
+    
+    def load(self, path: Path, on_loaded: Callable[[Dict[str, Any]], None],
+             on_error: Callable[[Exception], None] = None) -> None:
+        """
+        Carrega um tema em segundo plano, substituindo o carregamento anterior
+        
+        Args:
+            path: Arquivo JSON do tema
+            on_loaded: Recebe o artefato compilado, na thread do Tk
+            on_error: Recebe o erro do carregamento (ex: tema inválido), na thread do Tk (padrão: stderr)
+        """
+        self._generation += 1
+        self._in_flight += 1
+        self._executor.submit(self._work, Path(path), self._generation, on_loaded,
+                              on_error if on_error is not None else self._report)
+        if self._job is None:
+            self._job = self.root.after(self.poll_ms, self._poll)
+            
+    def cancel(self) -> None:
+        """Descarta os carregamentos pendentes"""
+        self._generation += 1
+        
+    def shutdown(self) -> None:
+        """Cancela os pendentes e encerra o worker sem esperar"""
+        self.cancel()
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        self._executor.shutdown(wait=False)
+        
+    def _work(self, path: Path, generation: int, on_loaded: Callable, on_error: Callable) -> None:
+        """Executado no worker: nunca toca em widgets"""
+        if generation != self._generation:
+            result: Any = self.SUPERSEDED
+        else:
+            try:
+                result = load_compiled_theme(path)
+            except Exception as error:
+                # Qualquer falha precisa chegar à fila: sem resultado, o
+                # carregamento ficaria pendente e _poll() nunca pararia
+                result = error
+        self._results.put((generation, result, on_loaded, on_error))
+        
+    def _poll(self) -> None:
+        self._job = None
+        while True:
+            try:
+                generation, result, on_loaded, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._in_flight -= 1
+            if generation != self._generation or result is self.SUPERSEDED:
+                continue
+            if isinstance(result, Exception):
+                on_error(result)
+            else:
+                on_loaded(result)
+                
+        if self._in_flight > 0:
+            self._job = self.root.after(self.poll_ms, self._poll)
+            
+    @staticmethod
+    def _report(error: Exception) -> None:
+        print(f"Tema não carregado, mantendo o atual: {error}", file=sys.stderr)
+
+
+class PooledFont(ctk.CTkFont):
+    """
+    CTkFont compartilhado pelo FontPool
+    
+    O CTk entrega a cada widget uma tupla escalada, e o Tk cria uma fonte
+    para cada uma. Aqui, cada fator de escala tem uma única fonte nomeada
+    do Tk, e os widgets recebem o nome dela. Numa mudança de DPI, cada
+    widget ainda é notificado pelo CTk e reatribui a fonte, mas a fonte
+    escalada é criada uma vez por fonte e fator, não uma vez por widget.
+    Em configure(), as fontes escaladas são alteradas no lugar, e o Tk
+    atualiza de uma vez todos os widgets que as usam.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._scaled_fonts: Dict[float, tkfont.Font] = {}
+        super().__init__(*args, **kwargs)
+        
+    def create_scaled_tuple(self, font_scaling: float) -> str:
+        # O CTk só repassa o retorno como font= aos widgets do Tk, que aceitam o nome
+        scaled = self._scaled_fonts.get(font_scaling)
+        if scaled is None:
+            scaled = self._scaled_fonts[font_scaling] = tkfont.Font(**self._scaled_options(font_scaling))
+        return scaled.name
+    
+    def configure(self, **kwargs):
+        # As fontes escaladas mudam antes de os widgets serem notificados
+        callbacks, self._size_configure_callback_list = self._size_configure_callback_list, []
+        try:
+            super().configure(**kwargs)
+        finally:
+            self._size_configure_callback_list = callbacks
+        for font_scaling, scaled in self._scaled_fonts.items():
+            scaled.configure(**self._scaled_options(font_scaling))
+        for callback in callbacks:
+            callback()
+            
+    def _scaled_options(self, font_scaling: float) -> Dict[str, Any]:
+        options = {key: self.cget(key) for key in ("family", "weight", "slant", "underline", "overstrike")}
+        options["size"] = round(-abs(self._size) * font_scaling)
+        return options
+
+
+class FontPool:
+    """
+    Pool de CTkFont compartilhados, com contagem de referências
+    
+    Fontes com os mesmos atributos são uma única fonte nomeada do Tk,
+    em vez de uma por widget.
+    """
+    
+    def __init__(self):
+        self._fonts: Dict[Tuple[Any, ...], PooledFont] = {}
+        self._refcounts: Dict[Tuple[Any, ...], int] = {}
+        # Referências tomadas por dono, liberáveis antes da coleta (ver release_owner)
+        self._owned: "weakref.WeakKeyDictionary[Any, List[weakref.finalize]]" = weakref.WeakKeyDictionary()
+        
+    def get(self, family: str = None, size: int = None, weight: str = None,
+            slant: str = "roman", underline: bool = False, overstrike: bool = False,
+            owner: Any = None) -> ctk.CTkFont:
+        """
+        Retorna a fonte compartilhada com estes atributos
+        
+        Args:
+            family, size, weight: Padrão do tema (CTkFont) quando None
+            slant, underline, overstrike: Como em ctk.CTkFont
+            owner: Dono da referência (widget, seção...); ela é liberada quando
+                o dono for coletado ou em release_owner(). Sem dono, cabe a
+                quem chamou liberar a fonte com release()
+        """
+        defaults = ctk.ThemeManager.theme["CTkFont"]
+        key = (
+            defaults["family"] if family is None else family,
+            defaults["size"] if size is None else size,
+            defaults["weight"] if weight is None else weight,
+            slant, bool(underline), bool(overstrike)
+        )
+        
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = PooledFont(*key)
+            self._refcounts[key] = 0
+        self._refcounts[key] += 1
+        
+        if owner is not None:
+            self._owned.setdefault(owner, []).append(weakref.finalize(owner, self._release_key, key))
+        return font
+        
+    def release(self, font: ctk.CTkFont) -> None:
+        """Libera uma referência obtida com get()"""
+        for key, pooled in self._fonts.items():
+            if pooled is font:
+                self._release_key(key)
+                return
+                
+    def release_owner(self, owner: Any) -> None:
+        """Libera já as referências tomadas com get(owner=owner), sem esperar a coleta do dono"""
+        for finalizer in self._owned.pop(owner, ()):
+            finalizer()
+            
+    def _release_key(self, key: Tuple[Any, ...]) -> None:
+        if key not in self._refcounts:
+            return
+        self._refcounts[key] -= 1
+        if self._refcounts[key] <= 0:
+            # Sem referências, a fonte nomeada do Tk é apagada ao ser coletada
+            del self._refcounts[key]
+            del self._fonts[key]
+            
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+
+class ProfilerOverlay(ctk.CTkFrame):
+    """Painel sobreposto à janela com o resumo do ThemeProfiler, atualizado periodicamente"""
+    
+    REFRESH_MS = 500
+    
+    def __init__(self, master: Any, profiler: ThemeProfiler, font: ctk.CTkFont):
+        super().__init__(master, border_width=1)
+        self.profiler = profiler
+        self._label = ctk.CTkLabel(self, text="", font=font, justify="left", anchor="w")
+        self._label.pack(padx=12, pady=8)
+        self._job: Optional[str] = None
+        
+    def show(self) -> None:
+        """Exibe o painel no canto inferior direito"""
+        self.place(relx=1.0, rely=1.0, x=-30, y=-30, anchor="se")
+        self.lift()
+        self._refresh()
+        
+    def hide(self) -> None:
+        """Oculta o painel e para as atualizações"""
+        if self._job is not None:
+            self.after_cancel(self._job)
+            self._job = None
+        self.place_forget()
+        
+    def _refresh(self) -> None:
+        self._label.configure(text=self.format_report(self.profiler.export()))
+        self._job = self.after(self.REFRESH_MS, self._refresh)
+        
+    @staticmethod
+    def format_report(report: Dict[str, Any]) -> str:
+        """Resume o perfil exportado em poucas linhas de texto"""
+        lines = [
+            "PERFIL DO TEMA  (F12 oculta, Ctrl+F12 exporta)",
+            f"configure(): {report['configure_calls']}   falhas: {sum(report['key_failures'].values())}",
+            "",
+        ]
+        for name, stats in report["sections"].items():
+            lines.append(f"{name:<20} {stats['calls']:>4}x  total {stats['total_ms']:8.1f}ms  "
+                         f"max {stats['max_ms']:7.1f}ms")
+        for widget_type, stats in list(report["widget_types"].items())[:6]:
+            lines.append(f"{widget_type:<20} {stats['widgets']:>5} widgets  {stats['total_ms']:8.1f}ms  "
+                         f"({stats['mean_us']:.0f}us/widget)")
+        for name, count in list(report["key_failures"].items())[:3]:
+            lines.append(f"falha {name}: {count}")
+        return "\n".join(lines)
 
 
-class ThemeManager:
-    """Gerenciador de temas customizados para CustomTkinter"""
+class EventLoopMonitor:
+    """
+    Heartbeat via after() que mede o atraso do loop de eventos do Tk
     
-    def __init__(self, theme_data: Dict[str, Any]):
-        self.theme_data = theme_data
-        self.current_mode = 1  # 0 = light, 1 = dark
+    A cada batida, o atraso é a diferença entre o horário agendado e o
+    horário em que o callback realmente rodou. Atrasos acima de stall_ms
+    são atribuídos ao callback rastreado (track) mais lento executado
+    desde a batida anterior ou, se nenhum rodou, ao último evento anotado
+    (note), como um redimensionamento.
+    """
+    
+    # Limites superiores (ms) das faixas do histograma
+    HISTOGRAM_BOUNDS = (1, 2, 4, 8, 16, 33, 66, 100, 250, 500, 1000)
+    
+    def __init__(self, root: Any, interval_ms: int = 50, window: int = 600, stall_ms: float = 100.0):
+        """
+        Args:
+            root: Janela cujo loop de eventos é monitorado
+            interval_ms: Intervalo entre batidas
+            window: Quantidade de amostras na janela móvel
+            stall_ms: Atraso a partir do qual a batida conta como travamento
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._stalls: Deque[Tuple[float, str, float]] = deque(maxlen=50)
+        self._slowest: Tuple[Optional[str], float] = (None, 0.0)
+        self._last_event: Optional[str] = None
+        self._expected = 0.0
+        self._job: Optional[str] = None
+        
+    def start(self) -> None:
+        """Inicia as batidas"""
+        if self._job is None:
+            self._expected = time.perf_counter() + self.interval_ms / 1000.0
+            self._job = self.root.after(self.interval_ms, self._beat)
+            
+    def stop(self) -> None:
+        """Interrompe as batidas"""
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+            
+    def track(self, name: str, callback: Callable[..., Any]) -> Callable[..., Any]:
+        """Envolve um callback para que seus tempos sejam atribuídos nos travamentos"""
+        def tracked(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return tracked
+        
+    def record(self, name: str, seconds: float) -> None:
+        """Registra a duração de um callback executado desde a última batida"""
+        if seconds > self._slowest[1]:
+            self._slowest = (name, seconds)
+            
+    def note(self, name: str) -> None:
+        """Anota um evento sem duração mensurável (ex: redimensionamento)"""
+        self._last_event = name
+        
+    def _beat(self) -> None:
+        now = time.perf_counter()
+        lag_ms = max(0.0, (now - self._expected) * 1000.0)
+        self._samples.append(lag_ms)
+        
+        if lag_ms >= self.stall_ms:
+            name, seconds = self._slowest
+            if name is None:
+                name, seconds = self._last_event or "desconhecido", 0.0
+            self._stalls.append((lag_ms, name, seconds * 1000.0))
+            
+        self._slowest = (None, 0.0)
+        self._last_event = None
+        self._expected = now + self.interval_ms / 1000.0
+        self._job = self.root.after(self.interval_ms, self._beat)
+        
+    def stats(self) -> Dict[str, Any]:
+        """Percentis do atraso na janela móvel e os travamentos mais recentes"""
+        samples = sorted(self._samples)
+        if not samples:
+            return {"p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0, "stalls": []}
+        return {
+            "p50_ms": samples[len(samples) // 2],
+            "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            "max_ms": samples[-1],
+            "stalls": [
+                {"lag_ms": lag, "callback": name, "callback_ms": duration}
+                for lag, name, duration in self._stalls
+            ],
+        }
+        
+    def histogram(self) -> Dict[str, int]:
+        """Contagem de amostras por faixa de atraso"""
+        counts = {f"<{bound}ms": 0 for bound in self.HISTOGRAM_BOUNDS}
+        counts[f">={self.HISTOGRAM_BOUNDS[-1]}ms"] = 0
+        labels = list(counts)
+        for lag in self._samples:
+            index = next((i for i, bound in enumerate(self.HISTOGRAM_BOUNDS) if lag < bound), len(labels) - 1)
+            counts[labels[index]] += 1
+        return counts
+
+
+class CoalescedCallback:
+    """
+    Callback que agrupa chamadas em rajada; a última chamada sempre vence
+    
+    Criado por CoalescingDispatcher.wrap(). Cada chamada só guarda os
+    argumentos; a execução é agendada com after() conforme a política.
+    """
+    
+    def __init__(self, root: Any, callback: Callable[..., Any], policy: str, interval_ms: float):
+        self.root = root
+        self.callback = callback
+        self.policy = policy
+        self.interval = interval_ms / 1000.0
+        self.calls = 0
+        self.runs = 0
+        self._args: Tuple[Any, ...] = ()
+        self._kwargs: Dict[str, Any] = {}
+        self._job: Optional[str] = None
+        self._last_run = float("-inf")
+        
+    @property
+    def pending(self) -> bool:
+        """Indica se há uma execução agendada"""
+        return self._job is not None
+    
+    def __call__(self, *args, **kwargs) -> None:
+        self.calls += 1
+        self._args, self._kwargs = args, kwargs
+        
+        if self.policy == "debounce":
+            # Cada chamada adia a execução até a rajada terminar
+            self.cancel()
+            self._job = self.root.after(int(self.interval * 1000), self.run)
+        elif self._job is None:
+            # frame/throttle: a primeira chamada roda no próximo ciclo, as
+            # seguintes esperam o intervalo desde a última execução
+            wait = self._last_run + self.interval - time.perf_counter()
+            self._job = self.root.after(int(max(0.0, wait) * 1000), self.run)
+            
+    def run(self) -> None:
+        """Executa agora com os últimos argumentos recebidos"""
+        self._job = None
+        self._last_run = time.perf_counter()
+        self.runs += 1
+        self.callback(*self._args, **self._kwargs)
         
-    def apply_theme_to_widget(self, widget: Any, widget_type: str) -> None:
+    def flush(self) -> None:
+        """Executa imediatamente a chamada pendente, se houver"""
+        if self._job is not None:
+            self.cancel()
+            self.run()
+            
+    def cancel(self) -> None:
+        """Descarta a chamada pendente, se houver"""
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+
+
+class CoalescingDispatcher:
+    """
+    Camada de despacho para callbacks disparados na taxa dos eventos de entrada
+    
+    Políticas (ver wrap()):
+        frame: no máximo uma execução por quadro (1000 / fps ms)
+        throttle: no máximo uma execução a cada interval_ms
+        debounce: uma execução interval_ms após a última chamada da rajada
+    
+    Exemplo:
+        slider.configure(command=dispatcher.wrap(update_label))
+    """
+    
+    POLICIES = ("frame", "throttle", "debounce")
+    
+    def __init__(self, root: Any, fps: int = 60):
+        self.root = root
+        self.frame_ms = 1000.0 / fps
+        self._callbacks: "weakref.WeakSet[CoalescedCallback]" = weakref.WeakSet()
+        
+    def wrap(self, callback: Callable[..., Any], policy: str = "frame",
+             interval_ms: float = None) -> CoalescedCallback:
         """
-        Aplica as configurações do tema a um widget específico
+        Envolve um callback na política dada
         
         Args:
-            widget: Widget CustomTkinter para aplicar o tema
-            widget_type: Tipo do widget (ex: CTkButton, CTkLabel)
+            callback: Função chamada com os argumentos da última chamada
+            policy: "frame", "throttle" ou "debounce"
+            interval_ms: Intervalo de throttle/debounce (ignorado em "frame")
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"política desconhecida: {policy!r} (use {', '.join(self.POLICIES)})")
+        if policy == "frame":
+            interval_ms = self.frame_ms
+        elif interval_ms is None:
+            raise ValueError(f"a política {policy!r} exige interval_ms")
+        coalesced = CoalescedCallback(self.root, callback, policy, interval_ms)
+        self._callbacks.add(coalesced)
+        return coalesced
+    
+    def flush(self) -> None:
+        """Executa imediatamente todas as chamadas pendentes"""
+        for coalesced in list(self._callbacks):
+            coalesced.flush()
+            
+    def cancel(self) -> None:
+        """Descarta todas as chamadas pendentes"""
+        for coalesced in list(self._callbacks):
+            coalesced.cancel()
+            
+    def stats(self) -> Dict[str, int]:
+        """Chamadas recebidas e execuções efetivas, somadas entre os callbacks"""
+        callbacks = list(self._callbacks)
+        return {
+            "calls": sum(coalesced.calls for coalesced in callbacks),
+            "runs": sum(coalesced.runs for coalesced in callbacks),
+        }
+
+
+class LazySection:
+    """
+    Seção recolhível declarada no grid, construída só quando é aberta pela primeira vez
+    
+    Recolhida, a seção é apenas um cabeçalho clicável com o título; nada do
+    conteúdo existe ainda. Aberta, o builder cria a seção real na mesma
+    célula. Uma seção que já começa aberta é construída no primeiro <Map>
+    da célula (ou em build()); uma recolhida, só quando o cabeçalho é
+    clicado ou build() é chamado. Recolher só tira a seção do grid, e
+    reabrir não a constrói de novo. rebuild() troca a seção construída por
+    uma nova chamada ao builder.
+    """
+    
+    def __init__(self, parent: Any, row: int, col: int, builder: Callable[[], None],
+                 on_built: Callable[[List[Any]], None] = None, colspan: int = 1,
+                 title: str = "", expanded: bool = True):
+        """
+        Args:
+            parent: Frame com o grid
+            row, col, colspan: Célula da seção
+            builder: Cria a seção na célula (ex: create_buttons_section_compact)
+            on_built: Recebe os widgets criados pelo builder na célula
+            title: Texto do cabeçalho da seção recolhida
+            expanded: Começa aberta (construída ao ficar visível) ou recolhida
+        """
+        self.parent = parent
+        self.row = row
+        self.col = col
+        self.builder = builder
+        self.on_built = on_built
+        self.title = title
+        self.expanded = expanded
+        self.built = False
+        self.widgets: List[Any] = []
+        self.header: Optional[Any] = None
+        self.placeholder: Optional[Any] = None
+        self._cell = dict(row=row, column=col, columnspan=colspan, padx=10, pady=10)
+        self._scheduled = False
+        
+        if expanded:
+            self.placeholder = ctk.CTkFrame(parent, fg_color="transparent")
+            self.placeholder.grid(sticky="nsew", **self._cell)
+            self.placeholder.bind("<Map>", self._on_map, add="+")
+        else:
+            self._show_header()
+            
+    def _on_map(self, event=None) -> None:
+        # Constrói fora do tratamento do evento, deixando a janela terminar de mapear
+        if not self._scheduled and not self.built and self.expanded:
+            self._scheduled = True
+            self.placeholder.after_idle(self._build_if_expanded)
+            
+    def _build_if_expanded(self) -> None:
+        if self.expanded:
+            self.build()
+            
+    def build(self) -> None:
+        """Constrói a seção, se ainda não foi construída, e a abre"""
+        if not self.built:
+            self.built = True
+            self.builder()
+            created = [
+                widget for widget in self.parent.grid_slaves(row=self.row, column=self.col)
+                if widget is not self.placeholder and widget is not self.header
+            ]
+            if self.placeholder is not None:
+                self.placeholder.destroy()
+                self.placeholder = None
+            self.widgets = created
+            if self.on_built is not None:
+                self.on_built(created)
+        self.expand()
+        
+    def expand(self) -> None:
+        """Abre a seção, construindo-a na primeira vez"""
+        if not self.built:
+            self.build()
+            return
+        self.expanded = True
+        if self.header is not None:
+            self.header.grid_remove()
+        for widget in self.widgets:
+            widget.grid()
+            
+    def collapse(self) -> None:
+        """Recolhe a seção ao cabeçalho, mantendo os widgets já construídos"""
+        self.expanded = False
+        for widget in self.widgets:
+            widget.grid_remove()
+        if self.placeholder is not None:
+            self.placeholder.grid_remove()
+        self._show_header()
+        
+    def toggle(self) -> None:
+        """Abre a seção recolhida ou recolhe a aberta"""
+        if self.expanded:
+            self.collapse()
+        else:
+            self.expand()
+            
+    def rebuild(self, release: Callable[[List[Any]], None] = None) -> None:
+        """
+        Reconstrói a seção na mesma célula, mantendo-a aberta ou recolhida
+        
+        Args:
+            release: Recebe os widgets atuais da seção (ex:
+                WidgetFactory.release); por padrão eles são destruídos
         """
-        if widget_type not in self.theme_data:
+        if not self.built:
+            self.build()
             return
+        widgets, self.widgets = self.widgets, []
+        if release is None:
+            for widget in widgets:
+                widget.destroy()
+        else:
+            release(widgets)
+        expanded = self.expanded
+        self.built = False
+        self.build()
+        if not expanded:
+            self.collapse()
+            
+    def _show_header(self) -> None:
+        if self.header is None:
+            self.header = ctk.CTkButton(self.parent, text=f"▸  {self.title}", anchor="w", command=self.expand)
+            self.header.grid(sticky="new", **self._cell)
+        else:
+            self.header.grid()
+
+
+class WidgetFactory:
+    """
+    Instancia WidgetSpecs, reaproveitando widgets liberados do mesmo tipo e pai
+    
+    Widgets novos são registrados e tematizados na criação. Em release(),
+    widgets do factory saem da tela e do registro e vão para um pool por
+    (pai, tipo), sem receber as passadas de tema enquanto esperam; o
+    próximo build() sob o mesmo pai os reconfigura, registra e tematiza de
+    novo em vez de criar outros.
+    As opções que a spec anterior definiu e a nova omite voltam ao padrão
+    do tipo, lido de um widget de referência que nunca é exibido. Um
+    rebuild da mesma spec recebe os widgets na ordem em que foram liberados,
+    então cada widget volta ao seu lugar sem opções a reconfigurar.
+    """
+    
+    def __init__(self, theme_manager: ThemeManager, registry: WidgetRegistry):
+        self.theme_manager = theme_manager
+        self.registry = registry
+        self.created = 0
+        self.reused = 0
+        self._pool: "weakref.WeakKeyDictionary[Any, Dict[str, List[Any]]]" = weakref.WeakKeyDictionary()
+        # Opções aplicadas por widget criado pelo factory
+        self._applied: "weakref.WeakKeyDictionary[Any, Tuple[str, ...]]" = weakref.WeakKeyDictionary()
+        self._reference: Dict[str, Any] = {}
+        
+    def build(self, parent: Any, specs: Iterable[WidgetSpec], refs: Dict[str, Any] = None) -> List[Any]:
+        """
+        Instancia as specs (e seus filhos) sob parent
+        
+        Args:
+            refs: Recebe, por WidgetSpec.name, os widgets das specs com nome
+            
+        Returns:
+            Os widgets de primeiro nível, na ordem das specs
+        """
+        # Widgets reconfigurados são redesenhados uma vez, ao fim
+        with self.theme_manager.batch():
+            return [self._build(parent, spec, refs) for spec in specs]
+        
+    def release(self, widgets: Iterable[Any]) -> None:
+        """
+        Tira os widgets da tela e os devolve ao pool, com os filhos
+        
+        Widgets que não foram criados pelo factory são destruídos.
+        """
+        for widget in widgets:
+            if widget not in self._applied:
+                widget.destroy()
+                continue
+            widget_type = type(widget).__name__
+            if self.registry.resolve_type(widget) in WidgetRegistry.CONTAINER_TYPES:
+                # Filhos internos (canvas, tk.Entry...) não são widgets CTk
+                self.release([child for child in widget.winfo_children()
+                              if isinstance(child, ctk.CTkBaseClass)])
+            manager = widget.winfo_manager()
+            if manager:
+                getattr(widget, f"{manager}_forget")()
+            self.registry.unregister(widget)
+            self._pool.setdefault(widget.master, {}).setdefault(widget_type, []).append(widget)
             
-        config = self.theme_data[widget_type]
+    def clear(self) -> None:
+        """
+        Destrói os widgets guardados no pool e os widgets de referência
+        
+        Chamado quando o tema muda: os widgets no pool e os valores padrão
+        dos widgets de referência ainda são os do tema anterior.
+        """
+        for by_type in list(self._pool.values()):
+            for widgets in by_type.values():
+                for widget in widgets:
+                    widget.destroy()
+        for reference in self._reference.values():
+            reference.destroy()
+        self._pool = weakref.WeakKeyDictionary()
+        self._reference = {}
+        
+    def pooled(self) -> int:
+        """Quantidade de widgets disponíveis para reaproveitamento"""
+        return sum(len(widgets) for by_type in self._pool.values() for widgets in by_type.values())
+    
+    def __contains__(self, widget: Any) -> bool:
+        """Se o widget foi criado por este factory"""
+        return widget in self._applied
+    
+    def _build(self, parent: Any, spec: WidgetSpec, refs: Optional[Dict[str, Any]]) -> Any:
+        options = {key: value for key, value in (spec.options or {}).items() if value is not None}
+        widget = self._reuse(parent, spec.widget_type, options)
+        if widget is None:
+            widget = getattr(ctk, spec.widget_type)(parent, **options)
+            self.created += 1
+        self._applied[widget] = tuple(options)
         
-        for key, value in config.items():
+        # Registro recalcula as chaves preservadas (ex: fg_color="transparent");
+        # widgets reaproveitados perderam as passadas enquanto estavam no pool
+        widget_type = self.registry.register(widget)
+        if widget_type is not None and not self.theme_manager.native_modes:
+            self.theme_manager.apply_theme_to_widget(widget, widget_type, self.registry.preserved_keys(widget))
+        
+        manager, kwargs = spec.layout
+        getattr(widget, manager)(**kwargs)
+        self._set_value(widget, spec.widget_type, spec.value, options)
+        if spec.name is not None and refs is not None:
+            refs[spec.name] = widget
+        for child in spec.children:
+            self._build(widget, child, refs)
+        return widget
+    
+    def _reuse(self, parent: Any, widget_type: str, options: Dict[str, Any]) -> Optional[Any]:
+        pool = self._pool.get(parent, {}).get(widget_type)
+        while pool:
+            widget = pool.pop(0)
+            if not widget.winfo_exists():
+                continue
+            stale = [key for key in self._applied.get(widget, ()) if key not in options]
             try:
-                if isinstance(value, list) and len(value) == 2:
-                    # Valores com modo light/dark
-                    widget.configure(**{key: value[self.current_mode]})
-                else:
-                    # Valores únicos
-                    widget.configure(**{key: value})
-            except:
-                # Ignora configurações incompatíveis
+                with self.theme_manager.batch((widget,)):
+                    widget.configure(**dict(self._defaults(parent, widget_type, stale), **options))
+            except (ValueError, tk.TclError):
+                # Opção só aceita no construtor: este widget não serve para a spec
+                widget.destroy()
+                continue
+            self.reused += 1
+            return widget
+        return None
+    
+    def _defaults(self, parent: Any, widget_type: str, keys: List[str]) -> Dict[str, Any]:
+        """Valores padrão de um tipo para as chaves dadas"""
+        if not keys:
+            return {}
+        reference = self._reference.get(widget_type)
+        if reference is None or not reference.winfo_exists():
+            # Filho da janela, fora de qualquer seção liberada ou reconstruída e
+            # fora das passadas de tema, para guardar os padrões do tipo
+            reference = self._reference[widget_type] = getattr(ctk, widget_type)(parent.winfo_toplevel())
+            self.registry.unregister(reference)
+        defaults = {}
+        for key in keys:
+            try:
+                defaults[key] = reference.cget(key)
+            except (ValueError, tk.TclError):
                 pass
+        return defaults
     
-    def toggle_mode(self) -> str:
-        """Alterna entre modo light e dark"""
-        self.current_mode = 1 - self.current_mode
-        mode = "light" if self.current_mode == 0 else "dark"
-        ctk.set_appearance_mode(mode)
-        return mode
+    @staticmethod
+    def _set_value(widget: Any, widget_type: str, value: Any, options: Dict[str, Any]) -> None:
+        """
+        Aplica WidgetSpec.value
+        
+        None desmarca checkbox/switch e esvazia entry/textbox; widgets com
+        set() (slider, menus...) mantêm a seleção atual. Um textbox com
+        state="disabled" nas opções (só leitura) recebe o texto mesmo assim.
+        """
+        if widget_type in ("CTkCheckBox", "CTkSwitch"):
+            if value:
+                widget.select()
+            else:
+                widget.deselect()
+        elif widget_type == "CTkEntry":
+            widget.delete(0, "end")
+            if value is not None:
+                widget.insert(0, value)
+        elif widget_type == "CTkTextbox":
+            read_only = options.get("state") == "disabled"
+            if read_only:
+                widget.configure(state="normal")
+            widget.delete("1.0", "end")
+            if value is not None:
+                widget.insert("1.0", value)
+            if read_only:
+                widget.configure(state="disabled")
+        elif value is not None and widget_type in ("CTkProgressBar", "CTkSlider", "CTkSegmentedButton",
+                                                    "CTkOptionMenu", "CTkComboBox"):
+            widget.set(value)
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Lista virtualizada que recicla as linhas visíveis durante a rolagem
+    
+    Só existem widgets para as linhas que cabem na área visível (mais uma,
+    para a rolagem parcial). Cada linha é um frame criado por row_factory e
+    reaproveitado em anel: o item de índice i sempre ocupa a linha
+    i % len(rows), então rolar uma linha religa apenas a linha que entrou,
+    e as demais só são reposicionadas. Memória e custo de rolagem dependem
+    da altura da lista, não do número de itens.
+    """
+    
+    WHEEL_ROWS = 3
+    
+    def __init__(self, master: Any, row_count: int, row_factory: Callable[[Any], Any],
+                 row_binder: Callable[[Any, int], None], row_height: int = 32,
+                 on_rows_created: Callable[[List[Any]], None] = None,
+                 dispatcher: CoalescingDispatcher = None, **kwargs):
+        """
+        Args:
+            master: Widget pai
+            row_count: Número de itens da lista
+            row_factory: Cria os widgets de uma linha dentro do frame recebido
+                e devolve um handle com eles (ex: dict de widgets)
+            row_binder: Liga o handle de uma linha ao item de índice dado
+            row_height: Altura fixa de cada linha
+            on_rows_created: Recebe os frames de linhas recém-criadas, para
+                tema (ex: ThemeShowcaseFullHD._adopt_section)
+            dispatcher: Agrupa os redimensionamentos (padrão: um próprio)
+        """
+        super().__init__(master, **kwargs)
+        self.row_count = row_count
+        self.row_factory = row_factory
+        self.row_binder = row_binder
+        self.row_height = row_height
+        self.on_rows_created = on_rows_created
+        
+        # Topo da janela visível, em unidades do CTk (sem escala)
+        self.offset = 0.0
+        self._rows: List[Tuple[Any, Any]] = []
+        self._bound: List[Optional[int]] = []
+        self._placed: set = set()
+        self._viewport_height = 0.0
+        self._render_job: Optional[str] = None
+        
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        
+        # Arrastar a borda da janela gera um <Configure> por pixel
+        dispatcher = dispatcher if dispatcher is not None else CoalescingDispatcher(self)
+        self.body.bind("<Configure>", dispatcher.wrap(self._on_resize), add="+")
+        # A roda do mouse chega no widget sob o cursor, que pode ser qualquer linha
+        self._wheel_bindings = [
+            (sequence, self.bind_all(sequence, self._on_wheel, add="+"))
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>")
+        ]
+        
+    @property
+    def first_index(self) -> int:
+        """Índice do primeiro item visível"""
+        return int(self.offset // self.row_height)
+    
+    def set_row_count(self, row_count: int) -> None:
+        """Troca o número de itens, mantendo a posição quando possível"""
+        self.row_count = row_count
+        self._bound = [None] * len(self._rows)
+        self._scroll_to_offset(self.offset)
+        
+    def refresh(self) -> None:
+        """Religa todas as linhas visíveis (ex: após mudar os dados)"""
+        self._bound = [None] * len(self._rows)
+        self._schedule_render()
+        
+    def scroll_to(self, index: int) -> None:
+        """Rola até o item de índice dado ficar no topo"""
+        self._scroll_to_offset(index * self.row_height)
+        
+    def _max_offset(self) -> float:
+        return max(0.0, self.row_count * self.row_height - self._viewport_height)
+    
+    def _scroll_to_offset(self, offset: float) -> None:
+        self.offset = min(max(0.0, offset), self._max_offset())
+        self._schedule_render()
+        
+    def _on_scrollbar(self, action: str, value: Any, units: str = None) -> None:
+        if action == "moveto":
+            self._scroll_to_offset(float(value) * self.row_count * self.row_height)
+        elif action == "scroll":
+            step = self._viewport_height if units == "pages" else self.row_height
+            self._scroll_to_offset(self.offset + int(value) * step)
+            
+    def _on_wheel(self, event) -> None:
+        path, own = str(event.widget), str(self)
+        if path != own and not path.startswith(own + "."):
+            return
+        if event.num == 4:
+            direction = -1
+        elif event.num == 5:
+            direction = 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self._scroll_to_offset(self.offset + direction * self.WHEEL_ROWS * self.row_height)
+        
+    def _on_resize(self, event) -> None:
+        self._viewport_height = event.height / self.body._get_widget_scaling()
+        self._ensure_rows(int(self._viewport_height // self.row_height) + 2)
+        self._scroll_to_offset(self.offset)
+        
+    def _ensure_rows(self, count: int) -> None:
+        """Cria linhas até cobrir a área visível; linhas excedentes só ficam ocultas"""
+        created = []
+        while len(self._rows) < count:
+            frame = ctk.CTkFrame(self.body, height=self.row_height, corner_radius=0, fg_color="transparent")
+            handle = self.row_factory(frame)
+            self._rows.append((frame, handle))
+            created.append(frame)
+        if created:
+            # Mudar o tamanho do anel muda a linha de cada índice
+            self._bound = [None] * len(self._rows)
+            if self.on_rows_created is not None:
+                self.on_rows_created(created)
+                
+    def _schedule_render(self) -> None:
+        # Vários eventos de rolagem no mesmo ciclo geram uma única renderização
+        if self._render_job is None:
+            self._render_job = self.after_idle(self._render)
+            
+    def _render(self) -> None:
+        self._render_job = None
+        if not self._rows:
+            return
+        
+        total = self.row_count * self.row_height
+        if total > 0:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self._viewport_height) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+            
+        first = self.first_index
+        ring = len(self._rows)
+        visible = set()
+        for index in range(first, min(first + ring, self.row_count)):
+            slot = index % ring
+            visible.add(slot)
+            frame, handle = self._rows[slot]
+            if self._bound[slot] != index:
+                self.row_binder(handle, index)
+                self._bound[slot] = index
+            frame.place(x=0, y=index * self.row_height - self.offset, relwidth=1.0)
+            
+        for slot in self._placed - visible:
+            self._rows[slot][0].place_forget()
+            self._bound[slot] = None
+        self._placed = visible
+        
+    def destroy(self):
+        if self._render_job is not None:
+            self.after_cancel(self._render_job)
+            self._render_job = None
+        # unbind_all removeria também os handlers de outros widgets; remove só os próprios
+        for sequence, funcid in self._wheel_bindings:
+            script = self.tk.call("bind", "all", sequence)
+            kept = "\n".join(line for line in script.split("\n") if funcid not in line)
+            self.tk.call("bind", "all", sequence, kept)
+            self.deletecommand(funcid)
+        super().destroy()
 
 
 class ThemeShowcaseFullHD(ctk.CTk):
     """Aplicação otimizada para exibição em tela cheia Full HD"""
     
-    def __init__(self):
+    # Título e ícone de cada seção, no frame da seção e no cabeçalho recolhido
+    SECTION_TITLES = SECTION_TITLES
+    
+    # Seções abertas na inicialização (todas: o showcase cabe em uma tela); as
+    # abertas são construídas ao ficarem visíveis, as demais ao serem abertas
+    DEFAULT_EXPANDED = tuple(SECTION_TITLES)
+    
+    def __init__(self, native_modes: bool = True, theme_path: Path = THEME_PATH, profile: bool = False,
+                 hud: bool = False, transition_ms: int = 0, watch: bool = False,
+                 expanded_sections: Iterable[str] = None):
+        """
+        Args:
+            native_modes: Usa tuplas (light, dark) nativas do CustomTkinter
+                (ver ThemeManager); False volta às passadas de delta por widget.
+            theme_path: Arquivo JSON do tema
+            profile: Inicia com a instrumentação do tema ligada (F12 alterna)
+            hud: Mede o atraso do loop de eventos e o exibe no header
+            transition_ms: Duração da transição animada entre os modos (0 = instantânea)
+            watch: Recarrega o tema quando theme_path é editado (ver ThemeWatcher)
+            expanded_sections: Seções abertas na inicialização (padrão:
+                DEFAULT_EXPANDED); as recolhidas mostram só o cabeçalho
+        """
+        # O tema é compilado no worker enquanto o Tk inicializa (o artefato
+        # vem do cache enquanto o JSON não mudar). Ele precisa estar instalado
+        # antes do primeiro widget; só a própria janela nasce antes e recebe
+        # a cor do tema logo em seguida.
+        self.theme_loader = ThemeLoader()
+        pending = self.theme_loader.submit(theme_path)
+        
         super().__init__()
         
-        # Carrega o tema customizado
-        self.theme_data = {
-            "CTk": {"fg_color": ["#EAEAEA", "#000000"]},
-            "CTkToplevel": {"fg_color": ["#EAEAEA", "#000000"]},
-            "CTkFrame": {
-                "corner_radius": 6,
-                "border_width": 0,
-                "fg_color": ["#DCDCDC", "#0A0A0A"],
-                "top_fg_color": ["#C8C8C8", "#050505"],
-                "border_color": ["#B0B0B0", "#007080"]
-            },
-            "CTkButton": {
-                "corner_radius": 6,
-                "border_width": 0,
-                "fg_color": ["#00D1D1", "#00D1D1"],
-                "selected_fg_color": ["#00c6c7", "#00A0A0"],
-                "hover_color": ["#00A0A0", "#00A0A0"],
-                "text_color": ["#001010", "#001010"],
-                "text_color_disabled": ["#007080", "#007080"],
-                "fg_color_disabled": ["#A0E0E8", "#00404A"]
-            },
-            "CTkLabel": {
-                "corner_radius": 0,
-                "fg_color": "transparent",
-                "text_color": ["#424242", "#00D1D1"]
-            },
-            "CTkEntry": {
-                "corner_radius": 6,
-                "border_width": 1,
-                "fg_color": ["#FFFFFF", "#1A1A1A"],
-                "border_color": ["#B0B0B0", "#00D1D1"],
-                "text_color": ["#333333", "#E0E0E0"],
-                "placeholder_text_color": ["#9E9E9E", "#00A0A0"]
-            },
-            "CTkCheckBox": {
-                "corner_radius": 6,
-                "border_width": 2,
-                "fg_color": ["#757575", "#00D1D1"],
-                "border_color": ["#BDBDBD", "#00A0A0"],
-                "hover_color": ["#8A8A8A", "#00A0A0"],
-                "checkmark_color": ["#FFFFFF", "#001010"],
-                "text_color": ["#424242", "#00D1D1"],
-                "text_color_disabled": ["#BDBDBD", "#007080"]
-            },
-            "CTkSwitch": {
-                "corner_radius": 1000,
-                "border_width": 2,
-                "button_length": 0,
-                "fg_color": ["#D0D0D0", "#505050"],
-                "progress_color": ["#00c6c7", "#00D1D1"],
-                "button_color": ["#BDBDBD", "#A0D8E0"],
-                "button_hover_color": ["#ADADAD", "#00A0A0"],
-                "text_color": ["#424242", "#00D1D1"],
-                "text_color_disabled": ["#BDBDBD", "#007080"]
-            },
-            "CTkRadioButton": {
-                "corner_radius": 1000,
-                "border_width_checked": 6,
-                "border_width_unchecked": 2,
-                "fg_color": ["#757575", "#00D1D1"],
-                "border_color": ["#BDBDBD", "#00A0A0"],
-                "hover_color": ["#8A8A8A", "#00A0A0"],
-                "text_color": ["#424242", "#00D1D1"],
-                "text_color_disabled": ["#BDBDBD", "#007080"]
-            },
-            "CTkProgressBar": {
-                "corner_radius": 1000,
-                "border_width": 0,
-                "fg_color": ["#D0D0D0", "#505050"],
-                "progress_color": ["#757575", "#00D1D1"],
-                "border_color": ["#B0B0B0", "#007080"]
-            },
-            "CTkSlider": {
-                "corner_radius": 1000,
-                "button_corner_radius": 1000,
-                "border_width": 3,
-                "button_length": 0,
-                "fg_color": ["#D0D0D0", "#505050"],
-                "progress_color": ["#757575", "#00D1D1"],
-                "button_color": ["#757575", "#00D1D1"],
-                "button_hover_color": ["#8A8A8A", "#00A0A0"]
-            },
-            "CTkOptionMenu": {
-                "corner_radius": 6,
-                "fg_color": ["#C8C8C8", "#00D1D1"],
-                "button_color": ["#BDBDBD", "#00A0A0"],
-                "button_hover_color": ["#ADADAD", "#007080"],
-                "text_color": ["#333333", "#001010"],
-                "text_color_disabled": ["#9E9E9E", "#007080"]
-            },
-            "CTkComboBox": {
-                "corner_radius": 6,
-                "border_width": 1,
-                "fg_color": ["#FFFFFF", "#1A1A1A"],
-                "border_color": ["#B0B0B0", "#00D1D1"],
-                "button_color": ["#C8C8C8", "#00D1D1"],
-                "button_hover_color": ["#BDBDBD", "#00A0A0"],
-                "text_color": ["#333333", "#E0E0E0"],
-                "text_color_disabled": ["#9E9E9E", "#007080"]
-            },
-            "CTkScrollbar": {
-                "corner_radius": 1000,
-                "border_spacing": 4,
-                "fg_color": "transparent",
-                "button_color": ["#BDBDBD", "#505050"],
-                "button_hover_color": ["#ADADAD", "#00A0A0"]
-            },
-            "CTkSegmentedButton": {
-                "corner_radius": 6,
-                "border_width": 1,
-                "fg_color": ["#DCDCDC", "#1A1A1A"],
-                "selected_color": ["#00c6c7", "#00D1D1"],
-                "selected_hover_color": ["#00A0A0", "#00A0A0"],
-                "unselected_color": ["#DCDCDC", "#1A1A1A"],
-                "unselected_hover_color": ["#C8C8C8", "#2A2A2A"],
-                "text_color": ["#001010", "#001010"],
-                "text_color_disabled": ["#BDBDBD", "#007080"]
-            },
-            "CTkTextbox": {
-                "corner_radius": 6,
-                "border_width": 1,
-                "fg_color": ["#FFFFFF", "#0A0A0A"],
-                "border_color": ["#B0B0B0", "#00D1D1"],
-                "text_color": ["#333333", "#E0E0E0"],
-                "scrollbar_button_color": ["#BDBDBD", "#505050"],
-                "scrollbar_button_hover_color": ["#ADADAD", "#00A0A0"]
-            }
-        }
+        try:
+            compiled = pending.result()
+        except BaseException:
+            # Sem tema não há showcase, qualquer que seja a falha: a janela já
+            # criada e o worker não podem ficar para trás. O destroy() da
+            # própria classe depende do resto do __init__, então só o do CTk
+            # roda aqui; quem chamou relata o erro.
+            self.theme_loader.shutdown()
+            super().destroy()
+            raise
+        install_default_theme(compiled["theme"])
+        self.configure(fg_color=ctk.ThemeManager.theme["CTk"]["fg_color"])
+        self.theme_loader.root = self
+        self.theme_path = Path(theme_path)
         
-        self.theme_manager = ThemeManager(self.theme_data)
-        self.widgets_list: List[Tuple[str, Any]] = []
+        self.theme_data = compiled["theme"]
+        self.profiler = ThemeProfiler(enabled=profile)
+        self.theme_manager = ThemeManager.from_compiled(compiled, native_modes=native_modes,
+                                                        profiler=self.profiler)
+        self.registry = WidgetRegistry(self.theme_data)
+        self.registry.register(self)
+        self.registry.track_creation()
+        self.theme_manager.track_window(self)
+        self.theme_applier = IncrementalThemeApplier(self, self.theme_manager, self.registry)
+        self.mode_transition = (ModeTransition(self, self.theme_manager, self.registry, transition_ms)
+                                if transition_ms > 0 else None)
+        self.font_pool = FontPool()
+        self.loop_monitor = EventLoopMonitor(self) if hud else None
+        self.dispatcher = CoalescingDispatcher(self)
+        self.widget_factory = WidgetFactory(self.theme_manager, self.registry)
+        self.sections: Dict[str, LazySection] = {}
+        self.expanded_sections = set(self.DEFAULT_EXPANDED if expanded_sections is None else expanded_sections)
+        self._section_cells: Dict[Tuple[Any, int, int], LazySection] = {}
+        self.hud_label = None
+        self._hud_job: Optional[str] = None
         
         # Configuração da janela para Full HD
         self.title("NEON TRON CTK - Full HD")
         self.geometry("1920x1080")
-        self.state('zoomed')  # Inicia maximizado no Windows
-        
-        # Aplica tema à janela principal
-        self.theme_manager.apply_theme_to_widget(self, "CTk")
+        try:
+            self.state('zoomed')  # Inicia maximizado no Windows/macOS
+        except tk.TclError:
+            self.attributes('-zoomed', True)  # X11 não aceita o estado 'zoomed'
         
-        # Cria a interface otimizada
+        # Cria a interface otimizada. Os widgets já nascem com o tema padrão
+        # instalado, então não há passada inicial de tema: o registro (feito
+        # na criação de cada widget) só prepara as trocas de modo/tema posteriores.
         self.create_optimized_ui()
         
-        # Aplica tema inicial
-        self.apply_theme_to_all()
+        # Instrumentação: F12 liga/desliga e mostra o painel, Ctrl+F12 exporta
+        self.profiler_overlay: Optional[ProfilerOverlay] = None
+        self.bind("<F12>", lambda event: self.toggle_profiler())
+        self.bind("<Control-F12>", lambda event: self.export_profile())
+        if profile:
+            self.toggle_profiler(enabled=True)
+            
+        self.theme_watcher: Optional[ThemeWatcher] = None
+        if watch:
+            self.theme_watcher = ThemeWatcher(self, theme_path, self.reload_theme, current_hash=compiled["hash"])
+            self.theme_watcher.start()
+            
+        if self.loop_monitor is not None:
+            self.bind("<Configure>", self._on_configure, add="+")
+            self.loop_monitor.start()
+            self._refresh_hud()
         
     def create_optimized_ui(self):
         """Cria interface otimizada para visualização em tela única"""
@@ -215,7 +2341,6 @@ class ThemeShowcaseFullHD(ctk.CTk):
         # Container principal
         main_container = ctk.CTkFrame(self)
         main_container.pack(fill="both", expand=True, padx=20, pady=20)
-        self.widgets_list.append(("CTkFrame", main_container))
         
         # Header compacto
         self.create_compact_header(main_container)
@@ -223,7 +2348,6 @@ class ThemeShowcaseFullHD(ctk.CTk):
         # Grid principal 3x3 para organizar seções
         content_grid = ctk.CTkFrame(main_container)
         content_grid.pack(fill="both", expand=True, pady=10)
-        self.widgets_list.append(("CTkFrame", content_grid))
         
         # Configurar grid com pesos para distribuição uniforme
         for i in range(3):
@@ -231,351 +2355,440 @@ class ThemeShowcaseFullHD(ctk.CTk):
             content_grid.grid_rowconfigure(i, weight=1, uniform="row")
         
         # Criar seções organizadas no grid
-        self.create_buttons_section_compact(content_grid, 0, 0)
-        self.create_input_section_compact(content_grid, 0, 1)
-        self.create_selection_section_compact(content_grid, 0, 2)
-        self.create_sliders_section_compact(content_grid, 1, 0)
-        self.create_switches_section_compact(content_grid, 1, 1)
-        self.create_display_section_compact(content_grid, 1, 2)
-        self.create_advanced_section_compact(content_grid, 2, 0, colspan=3)
+        self.create_sections(content_grid)
+        
+    def create_sections(self, grid, first_row=0):
+        """
+        Declara as sete seções do showcase em três linhas do grid a partir de first_row
+        
+        As seções são construídas sob demanda (ver LazySection): as abertas
+        ao ficarem visíveis pela primeira vez, as recolhidas ao serem abertas
+        pelo cabeçalho, e qualquer uma via build_section()/build_all_sections().
+        """
+        suffix = "" if first_row == 0 else f"#{first_row // 3}"
+        builders = {
+            "buttons": self.create_buttons_section_compact,
+            "input": self.create_input_section_compact,
+            "selection": self.create_selection_section_compact,
+            "sliders": self.create_sliders_section_compact,
+            "switches": self.create_switches_section_compact,
+            "display": self.create_display_section_compact,
+            "advanced": self.create_advanced_section_compact,
+        }
+        
+        for name, (row, col, colspan) in SECTION_LAYOUT.items():
+            row = first_row + row
+            # Só o builder da seção larga (advanced) aceita colspan
+            extra = {"colspan": colspan} if colspan > 1 else {}
+            builder = functools.partial(builders[name], grid, row, col, **extra)
+            title, icon = self.SECTION_TITLES[name]
+            section = LazySection(grid, row, col, builder, self._adopt_section, colspan,
+                                  title=f"{icon} {title}", expanded=name in self.expanded_sections)
+            self.sections[name + suffix] = self._section_cells[grid, row, col] = section
+            
+    def build_section(self, name):
+        """Constrói (se preciso) e abre imediatamente uma seção declarada em create_sections()"""
+        self.sections[name].build()
+        
+    def build_all_sections(self):
+        """Constrói as seções ainda pendentes e abre todas"""
+        for section in self.sections.values():
+            section.build()
+            
+    def rebuild_section(self, name):
+        """Reconstrói uma seção, reaproveitando os widgets do WidgetFactory"""
+        section = self.sections[name]
+        
+        def release(widgets):
+            # As fontes da construção anterior são tomadas de novo pelo builder
+            self.widget_factory.release(widgets)
+            self.font_pool.release_owner(section)
+            
+        section.rebuild(release)
+            
+    def _adopt_section(self, widgets):
+        """Aplica o modo atual aos widgets de uma seção recém-construída"""
+        # Os widgets já foram registrados na criação (ver WidgetRegistry.track_creation);
+        # com tuplas nativas os widgets já nascem no modo atual
+        if self.theme_manager.native_modes:
+            return
+        with self.theme_manager.batch():
+            for root in widgets:
+                for widget_type, widget in self.registry.walk(root):
+                    # Widgets do factory já foram tematizados na criação
+                    if widget not in self.widget_factory:
+                        self.theme_manager.apply_theme_to_widget(widget, widget_type,
+                                                                 self.registry.preserved_keys(widget))
         
     def create_compact_header(self, parent):
         """Header compacto com título e controle de tema"""
         header_frame = ctk.CTkFrame(parent, height=60)
         header_frame.pack(fill="x", pady=(0, 10))
         header_frame.pack_propagate(False)
-        self.widgets_list.append(("CTkFrame", header_frame))
         
         # Título
         title = ctk.CTkLabel(
             header_frame,
             text="🎨 NEON TRON CTK - Full HD",
-            font=ctk.CTkFont(size=32, weight="bold")
+            font=self.font_pool.get(size=32, weight="bold", owner=header_frame)
         )
         title.pack(side="left", padx=20)
-        self.widgets_list.append(("CTkLabel", title))
         
         # Controle de tema
         theme_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
         theme_frame.pack(side="right", padx=20)
-        self.widgets_list.append(("CTkFrame", theme_frame))
+        
+        # HUD de atraso do loop de eventos, ao lado do controle de tema
+        if self.loop_monitor is not None:
+            self.hud_label = ctk.CTkLabel(
+                theme_frame,
+                text="",
+                font=self.font_pool.get(family="Courier", size=12, owner=theme_frame)
+            )
+            self.hud_label.pack(side="left", padx=20)
         
         self.theme_label = ctk.CTkLabel(
             theme_frame,
             text="Modo Escuro",
-            font=ctk.CTkFont(size=16)
+            font=self.font_pool.get(size=16, owner=theme_frame)
         )
         self.theme_label.pack(side="left", padx=10)
-        self.widgets_list.append(("CTkLabel", self.theme_label))
         
-        theme_switch = ctk.CTkSwitch(
+        # Cliques em rajada viram uma única troca, para o estado final do switch
+        self.theme_switch = ctk.CTkSwitch(
             theme_frame,
             text="",
-            command=self.toggle_theme,
+            command=self.dispatcher.wrap(self.tracked("toggle_theme", self._on_theme_switch)),
             width=60,
             height=30
         )
-        theme_switch.pack(side="left")
-        theme_switch.select()
-        self.widgets_list.append(("CTkSwitch", theme_switch))
+        self.theme_switch.pack(side="left")
+        self.theme_switch.select()
         
-    def create_section_frame(self, parent, row, col, title, icon="", colspan=1):
-        """Cria um frame de seção padronizado"""
-        section_frame = ctk.CTkFrame(parent)
-        section_frame.grid(row=row, column=col, columnspan=colspan, 
-                          padx=10, pady=10, sticky="nsew")
-        self.widgets_list.append(("CTkFrame", section_frame))
-        
-        # Título da seção
-        title_frame = ctk.CTkFrame(section_frame, height=40)
-        title_frame.pack(fill="x", padx=15, pady=(10, 5))
-        self.widgets_list.append(("CTkFrame", title_frame))
-        
-        title_label = ctk.CTkLabel(
-            title_frame,
-            text=f"{icon} {title}",
-            font=ctk.CTkFont(size=18, weight="bold")
-        )
-        title_label.pack(side="left")
-        self.widgets_list.append(("CTkLabel", title_label))
+    def section_font(self, parent, row, col):
+        """
+        Função de fontes para as specs da seção nesta célula
         
-        # Content frame
-        content_frame = ctk.CTkFrame(section_frame, fg_color="transparent")
-        content_frame.pack(fill="both", expand=True, padx=15, pady=10)
+        As referências ficam com a LazySection da célula (ou com o grid, fora
+        de uma), e rebuild_section() as libera antes de construir de novo.
+        """
+        return functools.partial(self.font_pool.get, owner=self._section_cells.get((parent, row, col), parent))
         
-        return content_frame
+    def create_section_frame(self, parent, row, col, title, icon="", colspan=1):
+        """Cria um frame de seção padronizado, com o botão de recolher quando é uma LazySection"""
+        section = self._section_cells.get((parent, row, col))
+        refs = {}
+        self.widget_factory.build(parent, [
+            section_frame_spec(title, icon, self.section_font(parent, row, col),
+                               ("grid", dict(row=row, column=col, columnspan=colspan, padx=10, pady=10,
+                                             sticky="nsew")),
+                               collapse=section.collapse if section is not None else None),
+        ], refs)
+        return refs["content"]
         
     def create_buttons_section_compact(self, parent, row, col):
         """Seção de botões compacta"""
-        content = self.create_section_frame(parent, row, col, "Botões", "🔘")
-        
-        buttons = [
-            ("Normal", None, "normal", 0, 0),
-            ("Hover Me", None, "normal", 0, 1),
-            ("Desabilitado", None, "disabled", 1, 0),
-            ("🚀 Ícone", None, "normal", 1, 1),
-            ("Grande", ctk.CTkFont(size=16), "normal", 2, 0),
-            ("Pequeno", ctk.CTkFont(size=11), "normal", 2, 1)
-        ]
-        
-        for text, font, state, r, c in buttons:
-            btn = ctk.CTkButton(
-                content, text=text, font=font, state=state,
-                width=140, height=35
-            )
-            btn.grid(row=r, column=c, padx=5, pady=5, sticky="ew")
-            self.widgets_list.append(("CTkButton", btn))
+        content = self.create_section_frame(parent, row, col, *self.SECTION_TITLES["buttons"])
+        self.widget_factory.build(content, section_specs("buttons", self.section_font(parent, row, col)))
             
     def create_input_section_compact(self, parent, row, col):
         """Seção de inputs compacta"""
-        content = self.create_section_frame(parent, row, col, "Entrada", "✏️")
-        
-        # Entry
-        entry1 = ctk.CTkEntry(content, placeholder_text="Digite algo...", width=280)
-        entry1.pack(pady=5)
-        self.widgets_list.append(("CTkEntry", entry1))
-        
-        # Entry preenchido
-        entry2 = ctk.CTkEntry(content, width=280)
-        entry2.insert(0, "Texto preenchido")
-        entry2.pack(pady=5)
-        self.widgets_list.append(("CTkEntry", entry2))
-        
-        # ComboBox
-        combo = ctk.CTkComboBox(
-            content,
-            values=["Opção 1", "Opção 2", "Opção 3"],
-            width=280
-        )
-        combo.pack(pady=5)
-        self.widgets_list.append(("CTkComboBox", combo))
-        
-        # TextBox menor
-        textbox = ctk.CTkTextbox(content, width=280, height=120)
-        textbox.insert("1.0", "Área de texto multilinha\ncom tema customizado\naplicado!")
-        textbox.pack(pady=5)
-        self.widgets_list.append(("CTkTextbox", textbox))
+        content = self.create_section_frame(parent, row, col, *self.SECTION_TITLES["input"])
+        self.widget_factory.build(content, section_specs("input", self.section_font(parent, row, col)))
         
     def create_selection_section_compact(self, parent, row, col):
         """Seção de seleção compacta"""
-        content = self.create_section_frame(parent, row, col, "Seleção", "☑️")
-        
-        # Checkboxes
-        check_frame = ctk.CTkFrame(content, fg_color="transparent")
-        check_frame.pack(side="left", fill="both", expand=True)
-        
-        checks = [
-            ("Marcado", True, "normal"),
-            ("Desmarcado", False, "normal"),
-            ("Desabilitado", True, "disabled")
-        ]
-        
-        for text, checked, state in checks:
-            cb = ctk.CTkCheckBox(check_frame, text=text, state=state)
-            if checked:
-                cb.select()
-            cb.pack(pady=5, anchor="w")
-            self.widgets_list.append(("CTkCheckBox", cb))
-        
-        # Radio buttons
-        radio_frame = ctk.CTkFrame(content, fg_color="transparent")
-        radio_frame.pack(side="right", fill="both", expand=True)
-        
-        radio_var = tk.IntVar(value=1)
-        for i, text in enumerate(["Opção 1", "Opção 2", "Opção 3"], 1):
-            rb = ctk.CTkRadioButton(radio_frame, text=text, variable=radio_var, value=i)
-            rb.pack(pady=5, anchor="w")
-            self.widgets_list.append(("CTkRadioButton", rb))
-            
-        # Option Menu
-        option_menu = ctk.CTkOptionMenu(
-            content,
-            values=["Menu 1", "Menu 2", "Menu 3"],
-            width=280
-        )
-        option_menu.pack(pady=10)
-        self.widgets_list.append(("CTkOptionMenu", option_menu))
+        content = self.create_section_frame(parent, row, col, *self.SECTION_TITLES["selection"])
+        radio_var = tk.IntVar(value=SELECTED_RADIO)
+        self.widget_factory.build(content, section_specs("selection", self.section_font(parent, row, col), radio_var))
         
     def create_sliders_section_compact(self, parent, row, col):
         """Seção de sliders e progress bars"""
-        content = self.create_section_frame(parent, row, col, "Controles", "🎚️")
+        content = self.create_section_frame(parent, row, col, *self.SECTION_TITLES["sliders"])
+        refs = {}
+        self.widget_factory.build(content, section_specs("sliders", self.section_font(parent, row, col)), refs)
         
-        # Progress bars com diferentes valores
-        for i, value in enumerate([0.3, 0.6, 0.9]):
-            pb = ctk.CTkProgressBar(content, width=280)
-            pb.set(value)
-            pb.pack(pady=8)
-            self.widgets_list.append(("CTkProgressBar", pb))
-            
-        # Sliders
         for i in range(2):
-            slider_frame = ctk.CTkFrame(content, fg_color="transparent")
-            slider_frame.pack(pady=8, fill="x")
-            
-            slider = ctk.CTkSlider(slider_frame, from_=0, to=100, width=230)
-            slider.set(25 + i * 50)
-            slider.pack(side="left")
-            self.widgets_list.append(("CTkSlider", slider))
-            
-            value_label = ctk.CTkLabel(slider_frame, text=f"{25 + i * 50}")
-            value_label.pack(side="left", padx=10)
-            self.widgets_list.append(("CTkLabel", value_label))
-            
-            def update_label(val, label=value_label):
+            # O arraste dispara um comando por pixel; o rótulo só é atualizado uma vez por quadro
+            def update_label(val, label=refs[f"slider_{i}_value"]):
                 label.configure(text=f"{int(val)}")
-            slider.configure(command=update_label)
+            refs[f"slider_{i}"].configure(command=self.dispatcher.wrap(self.tracked("update_label", update_label)))
             
     def create_switches_section_compact(self, parent, row, col):
         """Seção de switches"""
-        content = self.create_section_frame(parent, row, col, "Switches", "🔀")
-        
-        switches_config = [
-            ("Notificações", True, "normal"),
-            ("Som do Sistema", False, "normal"),
-            ("Modo Noturno Auto", True, "normal"),
-            ("Sincronização", False, "normal"),
-            ("Desabilitado", False, "disabled")
-        ]
-        
-        for text, selected, state in switches_config:
-            switch = ctk.CTkSwitch(content, text=text, state=state)
-            if selected:
-                switch.select()
-            switch.pack(pady=8, anchor="w")
-            self.widgets_list.append(("CTkSwitch", switch))
+        content = self.create_section_frame(parent, row, col, *self.SECTION_TITLES["switches"])
+        self.widget_factory.build(content, section_specs("switches", self.section_font(parent, row, col)))
             
     def create_display_section_compact(self, parent, row, col):
         """Seção de display e frames especiais"""
-        content = self.create_section_frame(parent, row, col, "Display", "🖼️")
-        
-        # Segmented button
-        seg_button = ctk.CTkSegmentedButton(
-            content,
-            values=["Tab 1", "Tab 2", "Tab 3"],
-            width=280
-        )
-        seg_button.pack(pady=10)
-        seg_button.set("Tab 2")
-        self.widgets_list.append(("CTkSegmentedButton", seg_button))
-        
-        # Frame com borda
-        bordered_frame = ctk.CTkFrame(
-            content,
-            border_width=2,
-            border_color=["#B0B0B0", "#007080"],
-            height=100
-        )
-        bordered_frame.pack(fill="x", pady=10)
-        bordered_frame.pack_propagate(False)
-        self.widgets_list.append(("CTkFrame", bordered_frame))
-        
-        border_label = ctk.CTkLabel(
-            bordered_frame,
-            text="Frame com Borda\nCustomizada",
-            font=ctk.CTkFont(size=14)
-        )
-        border_label.pack(expand=True)
-        self.widgets_list.append(("CTkLabel", border_label))
-        
-        # Labels com diferentes estilos
-        for text, size in [("Label Normal", 14), ("Label Grande", 18), ("Label Pequeno", 11)]:
-            label = ctk.CTkLabel(content, text=text, font=ctk.CTkFont(size=size))
-            label.pack(pady=5)
-            self.widgets_list.append(("CTkLabel", label))
+        content = self.create_section_frame(parent, row, col, *self.SECTION_TITLES["display"])
+        refs = {}
+        self.widget_factory.build(content, section_specs("display", self.section_font(parent, row, col)), refs)
+        refs["bordered_frame"].pack_propagate(False)
             
     def create_advanced_section_compact(self, parent, row, col, colspan):
         """Seção avançada ocupando toda a largura inferior"""
-        content = self.create_section_frame(parent, row, col, "Showcase Avançado", "⚡", colspan)
-        
-        # Criar três colunas
-        for i in range(3):
-            column = ctk.CTkFrame(content, fg_color="transparent")
-            column.pack(side="left", fill="both", expand=True, padx=10)
-            
-            if i == 0:
-                # Coluna 1: Combinações de widgets
-                combo_label = ctk.CTkLabel(column, text="Formulário Demo", font=ctk.CTkFont(size=14, weight="bold"))
-                combo_label.pack(pady=5)
-                self.widgets_list.append(("CTkLabel", combo_label))
-                
-                form_frame = ctk.CTkFrame(column)
-                form_frame.pack(fill="x", pady=5)
-                self.widgets_list.append(("CTkFrame", form_frame))
-                
-                # Mini formulário
-                fields = ["Nome:", "Email:", "Senha:"]
-                for idx, field in enumerate(fields):
-                    label = ctk.CTkLabel(form_frame, text=field, width=80)
-                    label.grid(row=idx, column=0, padx=5, pady=5, sticky="e")
-                    self.widgets_list.append(("CTkLabel", label))
-                    
-                    entry = ctk.CTkEntry(form_frame, width=180)
-                    if field == "Senha:":
-                        entry.configure(show="*")
-                    entry.grid(row=idx, column=1, padx=5, pady=5)
-                    self.widgets_list.append(("CTkEntry", entry))
-                    
-            elif i == 1:
-                # Coluna 2: Estados e variações
-                states_label = ctk.CTkLabel(column, text="Estados dos Widgets", font=ctk.CTkFont(size=14, weight="bold"))
-                states_label.pack(pady=5)
-                self.widgets_list.append(("CTkLabel", states_label))
-                
-                # Botões em diferentes estados
-                btn_states = [
-                    ("✓ Sucesso", "#2ECC71"),
-                    ("⚠ Aviso", "#F39C12"),
-                    ("✗ Erro", "#E74C3C")
-                ]
-                
-                for text, color in btn_states:
-                    btn = ctk.CTkButton(column, text=text, fg_color=color, hover_color=color, width=200)
-                    btn.pack(pady=5)
-                    self.widgets_list.append(("CTkButton", btn))
-                    
-            else:
-                # Coluna 3: Informações do tema
-                info_label = ctk.CTkLabel(column, text="Informações do Tema", font=ctk.CTkFont(size=14, weight="bold"))
-                info_label.pack(pady=5)
-                self.widgets_list.append(("CTkLabel", info_label))
-                
-                info_text = ctk.CTkTextbox(column, width=250, height=150)
-                info_text.insert("1.0", 
-                    "🎨 Tema Customizado Aplicado\n\n"
-                    "✓ Cores principais: #00D1D1\n"
-                    "✓ Modo Light/Dark dinâmico\n"
-                    "✓ Bordas arredondadas: 6px\n"
-                    "✓ Hover effects customizados\n"
-                    "✓ Estados disabled incluídos\n\n"
-                    "Todos os widgets CTk suportados!"
-                )
-                info_text.configure(state="disabled")
-                info_text.pack(pady=5)
-                self.widgets_list.append(("CTkTextbox", info_text))
+        content = self.create_section_frame(parent, row, col, *self.SECTION_TITLES["advanced"], colspan)
+        self.widget_factory.build(content, section_specs("advanced", self.section_font(parent, row, col)))
                 
     def toggle_theme(self):
         """Alterna entre modo claro e escuro"""
-        mode = self.theme_manager.toggle_mode()
+        if self.mode_transition is not None:
+            self.mode_transition.start(on_done=self._on_mode_changed)
+            return
+        
+        if self.theme_manager.native_modes:
+            # Uma passada e um único flush para todas as janelas abertas
+            mode = self.theme_manager.broadcast(self.registry, toggle=True)
+        else:
+            # Passada fatiada sobre todas as janelas: a interface continua responsiva
+            # durante a troca. O set_appearance_mode não redesenha os widgets
+            # registrados; cada um é redesenhado uma única vez, na sua fatia.
+            mode = self.theme_manager.toggle_mode(skip_redraw=[widget for _, widget in self.registry])
+            self.theme_applier.start(delta_only=True, redraw=True)
+        self._on_mode_changed(mode)
+            
+    def set_mode(self, mode):
+        """Leva a interface ao modo dado ("light" ou "dark"), se ainda não estiver nele"""
+        target = 0 if mode == "light" else 1
+        current = self.theme_manager.current_mode
+        # Durante uma transição, o modo que vale é o de destino
+        if self.mode_transition is not None and self.mode_transition.running:
+            current = 1 - current
+        if current != target:
+            self.toggle_theme()
+            
+    def _on_theme_switch(self):
+        self.set_mode("dark" if self.theme_switch.get() else "light")
+        
+    def _on_mode_changed(self, mode):
+        """Atualiza o header após a troca de modo"""
         self.theme_label.configure(text="Modo Claro" if mode == "light" else "Modo Escuro")
-        self.apply_theme_to_all()
         
-    def apply_theme_to_all(self):
-        """Aplica o tema a todos os widgets"""
-        for widget_type, widget in self.widgets_list:
-            try:
-                self.theme_manager.apply_theme_to_widget(widget, widget_type)
-            except:
-                pass
+    def open_stress_window(self, row_count: int = 100_000):
+        """Abre uma janela com uma VirtualList de row_count linhas (modo de estresse)"""
+        window = ctk.CTkToplevel(self)
+        window.title(f"NEON TRON CTK - {row_count:,} linhas".replace(",", "."))
+        window.geometry("900x700")
+        
+        # Os dados ficam fora dos widgets; as linhas só exibem o índice atual
+        enabled = bytearray(row_count)
+        checked = bytearray(row_count)
+        values: Dict[int, str] = {}
+        font = self.font_pool.get(size=12, owner=window)
+        
+        def create_row(frame):
+            row = {"index": 0}
+            
+            def store(event=None):
+                enabled[row["index"]] = row["switch"].get()
+                checked[row["index"]] = row["check"].get()
+                values[row["index"]] = row["entry"].get()
                 
-        self.theme_manager.apply_theme_to_widget(self, "CTk")
-        self.update()
+            row["label"] = ctk.CTkLabel(frame, width=160, anchor="w", font=font)
+            row["label"].pack(side="left", padx=(10, 5))
+            row["switch"] = ctk.CTkSwitch(frame, text="", width=50, command=store)
+            row["switch"].pack(side="left", padx=5)
+            row["check"] = ctk.CTkCheckBox(frame, text="Ativo", width=80, font=font, command=store)
+            row["check"].pack(side="left", padx=5)
+            row["entry"] = ctk.CTkEntry(frame, height=26, font=font)
+            row["entry"].pack(side="left", fill="x", expand=True, padx=(5, 10))
+            row["entry"].bind("<KeyRelease>", store)
+            return row
+        
+        def bind_row(row, index):
+            row["index"] = index
+            row["label"].configure(text=f"Dispositivo {index:06d}")
+            for key, state in (("switch", enabled), ("check", checked)):
+                if state[index]:
+                    row[key].select()
+                else:
+                    row[key].deselect()
+            row["entry"].delete(0, "end")
+            row["entry"].insert(0, values.get(index, f"10.0.{index // 256 % 256}.{index % 256}"))
+            
+        virtual_list = VirtualList(window, row_count, create_row, bind_row, row_height=34,
+                                   on_rows_created=self._adopt_section, dispatcher=self.dispatcher)
+        virtual_list.pack(fill="both", expand=True, padx=10, pady=10)
+        self.adopt_window(window)
+        return window
+        
+    def adopt_window(self, window):
+        """
+        Inclui uma janela extra (CTkToplevel) nas trocas de modo e de tema
+        
+        Os widgets já criados nela são registrados e recebem o modo atual;
+        a partir daí, a janela é atualizada na mesma passada que as demais.
+        """
+        self.theme_manager.track_window(window)
+        self._adopt_section([window])
+        
+    def switch_theme(self, path, on_error=None):
+        """
+        Troca de tema sem bloquear a interface
+        
+        O arquivo é carregado e compilado no ThemeLoader; ao fim, só as
+        chaves que mudaram são aplicadas (ver reload_theme). Uma troca
+        solicitada antes da anterior terminar a substitui.
+        """
+        def loaded(compiled):
+            self.theme_path = Path(path)
+            if self.theme_watcher is not None:
+                self.theme_watcher.watch(self.theme_path, compiled["hash"])
+            self.reload_theme(compiled)
+        self.theme_loader.load(path, loaded, on_error)
+        
+    def reload_theme(self, compiled):
+        """
+        Aplica um tema recompilado só aos pares (tipo, chave) que mudaram
+        
+        Tipos de widget novos no tema valem apenas para widgets criados depois.
+        Chaves que um widget recebeu com valor próprio na criação (ex: as
+        cores dos botões de destaque) não são tocadas; ver
+        WidgetRegistry.custom_keys.
+        """
+        # O tema padrão do CTk também muda, para os widgets criados daqui em diante;
+        # o pool do factory e seus widgets de referência ficaram no tema anterior.
+        # As chaves próprias pendentes são comparadas ainda com o tema anterior.
+        self.registry.resolve_pending()
+        install_default_theme(compiled["theme"])
+        self.widget_factory.clear()
+        changed = self.theme_manager.reload(compiled)
+        self.theme_data = compiled["theme"]
+        if self.mode_transition is not None:
+            self.mode_transition.rebuild()
+            
+        keys_by_type: Dict[str, List[str]] = {}
+        for widget_type, key in changed:
+            keys_by_type.setdefault(widget_type, []).append(key)
+            
+        # Todas as janelas abertas recebem a mudança na mesma passada
+        self.theme_manager.broadcast(self.registry, keys_by_type=keys_by_type)
+        
+    def destroy(self):
+        # Nada agendado pode rodar depois que o interpretador Tcl for destruído
+        self.registry.stop_tracking()
+        self.theme_loader.shutdown()
+        if self.theme_watcher is not None:
+            self.theme_watcher.stop()
+        if self.loop_monitor is not None:
+            self.loop_monitor.stop()
+        if self._hud_job is not None:
+            self.after_cancel(self._hud_job)
+            self._hud_job = None
+        if self.profiler_overlay is not None:
+            self.profiler_overlay.hide()
+        self.theme_applier.cancel()
+        if self.mode_transition is not None:
+            self.mode_transition.cancel()
+        self.dispatcher.cancel()
+        super().destroy()
+        
+    def tracked(self, name: str, callback: Callable[..., Any]) -> Callable[..., Any]:
+        """Callback rastreado pelo monitor do loop de eventos, quando o HUD está ativo"""
+        if self.loop_monitor is None:
+            return callback
+        return self.loop_monitor.track(name, callback)
+        
+    def _on_configure(self, event):
+        """Anota redimensionamentos da janela para atribuição de travamentos"""
+        if event.widget is self:
+            self.loop_monitor.note("resize")
+            
+    def _refresh_hud(self):
+        """Atualiza o HUD com os percentis de atraso do loop de eventos"""
+        stats = self.loop_monitor.stats()
+        text = f"lag p50 {stats['p50_ms']:.0f}ms  p95 {stats['p95_ms']:.0f}ms  max {stats['max_ms']:.0f}ms"
+        if stats["stalls"]:
+            last = stats["stalls"][-1]
+            text += f"\núltimo travamento {last['lag_ms']:.0f}ms: {last['callback']}"
+        self.hud_label.configure(text=text)
+        self._hud_job = self.after(500, self._refresh_hud)
+        
+    def toggle_profiler(self, enabled: bool = None):
+        """Liga/desliga a instrumentação do tema e o painel correspondente"""
+        self.profiler.enabled = not self.profiler.enabled if enabled is None else enabled
+        if self.profiler_overlay is None:
+            self.profiler_overlay = ProfilerOverlay(self, self.profiler,
+                                                    self.font_pool.get(family="Courier", size=12, owner=self))
+        if self.profiler.enabled:
+            self.profiler_overlay.show()
+        else:
+            self.profiler_overlay.hide()
+            
+    def export_profile(self, path: Path = Path("theme_profile.json")):
+        """Exporta o perfil atual, com as chaves e valores recusados do tema, em JSON"""
+        self.profiler.export_json(path, rejected_keys=self.theme_manager.rejected_keys_report(),
+                                  invalid_values=self.theme_manager.invalid_values_report())
+        
+    def apply_theme_to_all(self, delta_only: bool = False):
+        """
+        Aplica o tema a todos os widgets de forma síncrona
+        
+        Para trocas com a janela já visível, prefira theme_applier.start().
+        
+        Args:
+            delta_only: Aplica apenas as chaves que mudam entre light e dark.
+                Só é válido quando todos os widgets já receberam o tema completo.
+        """
+        if delta_only:
+            changed_types = set(self.theme_manager.changed_widget_types())
+            apply = self.theme_manager.apply_delta_to_widget
+        else:
+            changed_types = None
+            apply = self.theme_manager.apply_theme_to_widget
+            
+        # Uma passada síncrona torna redundante qualquer passada fatiada pendente
+        self.theme_applier.cancel()
+        
+        profiler = self.theme_manager.profiler
+        start = time.perf_counter()
+        
+        # Cada widget é redesenhado uma única vez, ao fim do bloco
+        with self.theme_manager.batch():
+            for widget_type in self.registry.types():
+                if changed_types is not None and widget_type not in changed_types:
+                    continue
+                for widget in self.registry.widgets_of_type(widget_type):
+                    apply(widget, widget_type, self.registry.preserved_keys(widget))
+                    
+        applied = time.perf_counter()
+        
+        # Só processa os redesenhos pendentes, sem reentrar no loop de eventos
+        self.update_idletasks()
+        
+        if profiler.enabled:
+            profiler.record_section("apply_theme_to_all", applied - start)
+            profiler.record_section("update_idletasks", time.perf_counter() - applied)
 
 
 def main():
     """Função principal do showcase"""
+    parser = argparse.ArgumentParser(description="NEON TRON CTK - showcase Full HD")
+    parser.add_argument("--profile", action="store_true",
+                        help="inicia com a instrumentação do tema ligada (F12 alterna)")
+    parser.add_argument("--hud", action="store_true",
+                        help="exibe o atraso do loop de eventos no header")
+    parser.add_argument("--transition-ms", type=int, default=250,
+                        help="duração da transição animada entre os modos (0 desliga)")
+    parser.add_argument("--watch", action="store_true",
+                        help="recarrega o tema a cada edição do NEON_TRON.json")
+    parser.add_argument("--collapse", action="store_true",
+                        help="abre só a primeira linha de seções; as demais ficam recolhidas até serem abertas")
+    parser.add_argument("--stress", type=int, nargs="?", const=100_000, metavar="LINHAS",
+                        help="abre também uma lista virtualizada com LINHAS linhas (padrão 100000)")
+    args = parser.parse_args()
+    
     try:
-        app = ThemeShowcaseFullHD()
+        expanded = (tuple(name for name, (row, _, _) in SECTION_LAYOUT.items() if row == 0)
+                    if args.collapse else None)
+        app = ThemeShowcaseFullHD(profile=args.profile, hud=args.hud, transition_ms=args.transition_ms,
+                                  watch=args.watch, expanded_sections=expanded)
+        if args.stress:
+            app.open_stress_window(args.stress)
         app.mainloop()
+    except (OSError, ThemeError) as e:
+        messagebox.showerror("Erro no tema", f"Não foi possível carregar o tema:\n{e}")
     except Exception as e:
         messagebox.showerror("Erro", f"Erro ao iniciar:\n{str(e)}")
 
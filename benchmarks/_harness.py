@@ -0,0 +1,173 @@
+"""
+Utilitários compartilhados pelos benchmarks do NeonTron CTK
+
+Carrega o script do showcase como módulo, garante um display (Xvfb em
+Linux sem interface gráfica) e oferece helpers de medição.
+"""
+
+import importlib.util
+import multiprocessing.util
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tkinter
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SHOWCASE_PATH = REPO_ROOT / "NeonTron CTK.py"
+
+_showcase: Optional[ModuleType] = None
+_xvfb: Optional[subprocess.Popen] = None
+
+
+def load_showcase(path: Path = SHOWCASE_PATH) -> ModuleType:
+    """
+    Importa "NeonTron CTK.py" (o nome com espaço impede um import normal)
+    
+    A janela do showcase passa a aceitar state("zoomed") no X11 (ver
+    allow_zoomed_on_x11), para que qualquer revisão abra sob o Xvfb.
+    
+    Args:
+        path: Script alternativo, ex: uma revisão antiga extraída do git;
+            os módulos ao lado dele têm precedência nos imports
+    """
+    global _showcase
+    if path != SHOWCASE_PATH:
+        return _exec_module(path)
+    if _showcase is None:
+        _showcase = _exec_module(path)
+    return _showcase
+
+
+def _exec_module(path: Path) -> ModuleType:
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location("neontron_ctk", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    allow_zoomed_on_x11(module.ctk.CTk)
+    return module
+
+
+def allow_zoomed_on_x11(window_class: type) -> None:
+    """
+    Faz state("zoomed") funcionar no X11, onde o Tk só aceita o atributo -zoomed
+    
+    Revisões antigas do showcase chamam state("zoomed") sem alternativa e
+    não abrem sob o Xvfb. Aplicado à classe da janela (ex: ctk.CTk) antes
+    de instanciá-la.
+    """
+    original = window_class.state
+    if getattr(original, "allows_zoomed", False):
+        return
+        
+    def state(window, newstate=None):
+        try:
+            return original(window, newstate)
+        except tkinter.TclError:
+            if newstate != "zoomed":
+                raise
+            window.attributes("-zoomed", True)
+            
+    state.allows_zoomed = True
+    window_class.state = state
+
+
+def ensure_display(display: str = ":99") -> None:
+    """
+    Garante um servidor X para o Tk
+    
+    Em Linux sem DISPLAY, inicia um Xvfb próprio que é encerrado junto
+    com o processo, inclusive em workers de multiprocessing. Um display já
+    ocupado por outro servidor é um erro, não é reaproveitado. Em
+    Windows/macOS não faz nada.
+    """
+    global _xvfb
+    if not sys.platform.startswith("linux") or os.environ.get("DISPLAY"):
+        return
+        
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise RuntimeError("DISPLAY não definido e Xvfb não encontrado no PATH")
+        
+    owner = _display_owner(display)
+    if owner is not None:
+        raise RuntimeError(f"O display {display} já está em uso pelo processo {owner} (Xvfb órfão?)")
+        
+    _xvfb = subprocess.Popen(
+        [xvfb, display, "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    os.environ["DISPLAY"] = display
+    
+    # Aguarda o socket do display ficar disponível
+    socket_path = Path("/tmp/.X11-unix") / f"X{display.lstrip(':')}"
+    deadline = time.monotonic() + 10
+    while not socket_path.exists():
+        if _xvfb.poll() is not None or time.monotonic() > deadline:
+            raise RuntimeError(f"Falha ao iniciar Xvfb em {display}")
+        time.sleep(0.05)
+        
+    # Workers de ProcessPoolExecutor saem por os._exit() e não rodam atexit;
+    # os finalizadores do multiprocessing rodam nos workers e no processo principal
+    multiprocessing.util.Finalize(None, _stop_xvfb, args=(_xvfb,), exitpriority=10)
+
+
+def _display_owner(display: str) -> Optional[int]:
+    """PID do servidor X vivo que detém o lock do display, se houver"""
+    try:
+        pid = int(Path(f"/tmp/.X{display.lstrip(':')}-lock").read_text().strip())
+    except (OSError, ValueError):
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return None
+    except PermissionError:
+        pass
+    return pid
+
+
+def _stop_xvfb(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def settle(app: Any) -> None:
+    """Processa eventos até não restar passada de tema nem redesenho pendente"""
+    applier = getattr(app, "theme_applier", None)
+    while applier is not None and applier.running:
+        app.update()
+    app.update_idletasks()
+
+
+def measure(fn: Callable[[], Any], repeat: int = 10, warmup: int = 1) -> Dict[str, float]:
+    """
+    Mede fn() repetidas vezes
+    
+    Returns:
+        Estatísticas em milissegundos (min, mediana, média, max)
+    """
+    for _ in range(warmup):
+        fn()
+        
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+        
+    return {
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "max_ms": max(samples),
+    }
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark de cold start: tempo até o primeiro idle da janela
+
+Cada amostra roda em um processo novo, medindo do início da importação
+do showcase (incluindo o customtkinter) até a janela construída ter
+processado seus eventos de mapeamento e redesenho pendentes.
+
+Uso:
+    python benchmarks/bench_startup.py [--runs 10] [--compare-rev baseline]
+
+Com --compare-rev, a mesma medição é feita com o script daquela revisão
+do git, para comparar antes e depois. Uma variante que não abre é
+reportada com o erro do processo filho, sem interromper as demais.
+"""
+
+import argparse
+import io
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from _harness import REPO_ROOT, SHOWCASE_PATH, ensure_display, load_showcase
+
+
+def child(script: Path) -> None:
+    """Executado no subprocesso: imprime o tempo até o primeiro idle em ms"""
+    start = time.perf_counter()
+    # load_showcase() também faz revisões sem a alternativa ao state("zoomed") abrirem no Xvfb
+    showcase = load_showcase(script)
+    app = showcase.ThemeShowcaseFullHD()
+    app.update()
+    elapsed = (time.perf_counter() - start) * 1000.0
+    app.destroy()
+    print(json.dumps({"first_idle_ms": elapsed}))
+
+
+def sample(script: Path, runs: int) -> Dict[str, Any]:
+    """
+    Roda o showcase em runs processos novos e resume os tempos
+    
+    Returns:
+        Estatísticas em ms ou, se o showcase falhar, {"error": última linha do stderr}
+    """
+    samples: List[float] = []
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, __file__, "--child", str(script)],
+            capture_output=True, text=True
+        )
+        if process.returncode != 0:
+            lines = process.stderr.strip().splitlines()
+            return {"error": lines[-1] if lines else f"código de saída {process.returncode}"}
+        samples.append(json.loads(process.stdout.strip().splitlines()[-1])["first_idle_ms"])
+    return {
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "max_ms": max(samples),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="processos medidos por variante")
+    parser.add_argument("--compare-rev", help="revisão do git usada como referência")
+    parser.add_argument("--child", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    ensure_display()
+    
+    if args.child:
+        child(args.child)
+        return 0
+        
+    results = {"current": sample(SHOWCASE_PATH, args.runs)}
+    
+    if args.compare_rev:
+        archive = subprocess.run(
+            ["git", "archive", "--format=tar", args.compare_rev],
+            cwd=REPO_ROOT, check=True, capture_output=True
+        ).stdout
+        # A revisão inteira vai para um diretório temporário, fora da árvore de
+        # trabalho: o script antigo fica ao lado do seu NEON_TRON.json e importa
+        # os seus próprios módulos (ver load_showcase)
+        checkout = Path(tempfile.mkdtemp(prefix="bench_startup_"))
+        try:
+            with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+                tar.extractall(checkout)
+            results[args.compare_rev] = sample(checkout / SHOWCASE_PATH.name, args.runs)
+        finally:
+            shutil.rmtree(checkout, ignore_errors=True)
+        if "error" not in results[args.compare_rev] and "error" not in results["current"]:
+            results["speedup"] = results[args.compare_rev]["median_ms"] / results["current"]["median_ms"]
+            
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    
+    failed = [name for name, result in results.items() if isinstance(result, dict) and "error" in result]
+    for name in failed:
+        print(f"ERRO {name}: {results[name]['error']}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark de latência da alternância light/dark
+
+Compara as estratégias de aplicação do tema no ThemeShowcaseFullHD:
+
+- full:   passada síncrona completa sobre todos os widgets (abordagem original)
+- delta:  passada fatiada aplicando apenas o delta light/dark
+- native: tuplas (light, dark) nativas, a troca é só set_appearance_mode()
+
+Uso:
+    python benchmarks/bench_toggle.py [--repeat 20]
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict
+
+from _harness import ensure_display, load_showcase, measure, settle
+
+
+def bench_strategy(strategy: str, repeat: int) -> Dict[str, Any]:
+    """Mede a latência de toggle_theme() até a interface estabilizar"""
+    showcase = load_showcase()
+    # O modo do CTk é global e a estratégia anterior pode tê-lo deixado em
+    # light; o ThemeManager de cada app sempre começa em dark
+    showcase.ctk.set_appearance_mode("dark")
+    app = showcase.ThemeShowcaseFullHD(native_modes=(strategy == "native"))
+    try:
+        app.build_all_sections()
+        settle(app)
+        
+        if strategy == "full":
+            def toggle():
+                app.theme_manager.toggle_mode()
+                app.apply_theme_to_all()
+        else:
+            def toggle():
+                app.toggle_theme()
+                settle(app)
+                
+        result = measure(toggle, repeat=repeat)
+        result["widgets"] = len(app.registry)
+        return result
+    finally:
+        app.destroy()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="alternâncias medidas por estratégia")
+    args = parser.parse_args()
+    
+    ensure_display()
+    
+    results = {strategy: bench_strategy(strategy, args.repeat) for strategy in ("full", "delta", "native")}
+    baseline = results["full"]["median_ms"]
+    for result in results.values():
+        result["speedup_vs_full"] = baseline / result["median_ms"] if result["median_ms"] else None
+        
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Suíte de benchmarks do NeonTron CTK
+
+Para cada tamanho alvo N (em widgets), instancia o showcase com cópias
+suficientes das sete seções e mede, em um processo novo por tamanho:
+
+- first_idle_ms:  construção da janela até o primeiro idle
+- all_sections_ms: construção das seções ainda pendentes (recolhidas ou fora da tela)
+- toggle_ms:      latência de toggle_theme() até a interface estabilizar
+- apply_us:       custo de apply_theme_to_widget por widget, por tipo
+- peak_rss_mb:    pico de memória residente do processo
+
+Roda em Linux sem interface gráfica via Xvfb (ver _harness.ensure_display).
+
+Uso:
+    python benchmarks/suite.py --save-baseline
+    python benchmarks/suite.py --tolerance 0.2
+    python benchmarks/suite.py --sizes 100 1000 --output results.json --baseline outra_baseline.json
+
+A baseline padrão é benchmarks/baseline.json, gravada com --save-baseline
+na máquina em que a suíte roda (os tempos não valem entre máquinas). Se
+ela existir, toda execução é comparada com ela, e o processo termina com
+código 1 se alguma métrica piorar além da tolerância. Sem baseline, a
+suíte só mede e avisa como criá-la.
+"""
+
+import argparse
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from _harness import ensure_display, load_showcase, measure, settle
+
+DEFAULT_SIZES = [100, 500, 1000, 2500, 5000, 10000]
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+# Métricas comparadas com a baseline (maior = pior)
+COMPARED_METRICS = ("first_idle_ms", "toggle_median_ms", "peak_rss_mb")
+
+
+def build_app(copies: int, native_modes: bool) -> Any:
+    """Cria o showcase com `copies` cópias das seções, empilhadas no grid"""
+    showcase = load_showcase()
+    ctk = showcase.ctk
+    
+    class ScaledShowcase(showcase.ThemeShowcaseFullHD):
+        def create_optimized_ui(self):
+            main_container = ctk.CTkFrame(self)
+            main_container.pack(fill="both", expand=True, padx=20, pady=20)
+            self.create_compact_header(main_container)
+            
+            content_grid = ctk.CTkFrame(main_container)
+            content_grid.pack(fill="both", expand=True, pady=10)
+            for i in range(3):
+                content_grid.grid_columnconfigure(i, weight=1, uniform="column")
+            for i in range(3 * copies):
+                content_grid.grid_rowconfigure(i, weight=1, uniform="row")
+            
+            for copy in range(copies):
+                self.create_sections(content_grid, first_row=3 * copy)
+    
+    return ScaledShowcase(native_modes=native_modes)
+
+
+def peak_rss_mb() -> float:
+    """Pico de memória residente do processo atual em MiB"""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é em KiB no Linux e em bytes no macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(copies: int, native_modes: bool, toggles: int) -> Dict[str, Any]:
+    """Executado no subprocesso: mede um tamanho e devolve as métricas"""
+    start = time.perf_counter()
+    app = build_app(copies, native_modes)
+    app.update()
+    first_idle_ms = (time.perf_counter() - start) * 1000.0
+    
+    # Seções fora da área visível só são construídas sob demanda
+    start = time.perf_counter()
+    app.build_all_sections()
+    settle(app)
+    all_sections_ms = (time.perf_counter() - start) * 1000.0
+    
+    def toggle():
+        app.toggle_theme()
+        settle(app)
+    
+    toggle_stats = measure(toggle, repeat=toggles)
+    
+    manager = app.theme_manager
+    apply_us: Dict[str, float] = {}
+    for widget_type in app.registry.types():
+        widgets = app.registry.widgets_of_type(widget_type)
+        begin = time.perf_counter()
+        for widget in widgets:
+            manager.apply_theme_to_widget(widget, widget_type, app.registry.preserved_keys(widget))
+        apply_us[widget_type] = (time.perf_counter() - begin) * 1e6 / len(widgets)
+    
+    result = {
+        "copies": copies,
+        "widgets": len(app.registry),
+        "first_idle_ms": first_idle_ms,
+        "all_sections_ms": all_sections_ms,
+        "toggle_median_ms": toggle_stats["median_ms"],
+        "toggle_max_ms": toggle_stats["max_ms"],
+        "apply_us": apply_us,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    app.destroy()
+    return result
+
+
+def spawn(copies: int, native_modes: bool, toggles: int) -> Dict[str, Any]:
+    command = [sys.executable, __file__, "--child", str(copies), "--toggles", str(toggles)]
+    if not native_modes:
+        command.append("--delta")
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Lista as regressões em relação à baseline, casando os resultados por tamanho alvo"""
+    reference = {entry["target"]: entry for entry in baseline["results"]}
+    regressions = []
+    for entry in results:
+        base = reference.get(entry["target"])
+        if base is None:
+            continue
+        for metric in COMPARED_METRICS:
+            before, after = base[metric], entry[metric]
+            if before > 0 and after > before * (1 + tolerance):
+                regressions.append(
+                    f"N={entry['target']} {metric}: {before:.1f} -> {after:.1f} (+{(after / before - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="tamanhos alvo em widgets")
+    parser.add_argument("--toggles", type=int, default=10, help="alternâncias medidas por tamanho")
+    parser.add_argument("--delta", action="store_true", help="usa passadas de delta em vez de tuplas nativas")
+    parser.add_argument("--output", type=Path, help="grava os resultados em JSON")
+    parser.add_argument("--baseline", type=Path,
+                        help=f"baseline para comparação (padrão: {DEFAULT_BASELINE.name}, se existir)")
+    parser.add_argument("--save-baseline", type=Path, nargs="?", const=DEFAULT_BASELINE, metavar="ARQUIVO",
+                        help=f"grava os resultados como nova baseline (padrão: {DEFAULT_BASELINE.name})")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="piora relativa tolerada (0.2 = 20%%)")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.baseline is not None and not args.baseline.exists():
+        parser.error(f"baseline {args.baseline} não existe; grave-a antes com --save-baseline")
+    
+    ensure_display()
+    native_modes = not args.delta
+    
+    if args.child is not None:
+        print(json.dumps(run_child(args.child, native_modes, args.toggles)))
+        return 0
+    
+    # Widgets por cópia das seções, medido uma vez para dimensionar as cópias
+    per_copy = spawn(1, native_modes, 1)["widgets"]
+    
+    results = []
+    for target in args.sizes:
+        copies = max(1, math.ceil(target / per_copy))
+        entry = spawn(copies, native_modes, args.toggles)
+        entry["target"] = target
+        results.append(entry)
+        print(f"N={target:>6} widgets={entry['widgets']:>6} first_idle={entry['first_idle_ms']:8.1f}ms "
+              f"toggle={entry['toggle_median_ms']:7.1f}ms rss={entry['peak_rss_mb']:6.1f}MiB", file=sys.stderr)
+    
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "strategy": "native" if native_modes else "delta",
+            "widgets_per_copy": per_copy,
+        },
+        "results": results,
+    }
+    
+    for path in (args.output, args.save_baseline):
+        if path is not None:
+            path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    
+    baseline_path = args.baseline
+    if baseline_path is None and args.save_baseline is None and DEFAULT_BASELINE.exists():
+        baseline_path = DEFAULT_BASELINE
+    if baseline_path is None:
+        if args.save_baseline is None:
+            print(f"Sem baseline para comparar: grave uma com --save-baseline ({DEFAULT_BASELINE})",
+                  file=sys.stderr)
+        return 0
+    
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    if baseline["meta"]["strategy"] != report["meta"]["strategy"]:
+        print(f"A baseline {baseline_path} mediu a estratégia {baseline['meta']['strategy']}; "
+              f"use a mesma (--delta) ou grave outra baseline", file=sys.stderr)
+        return 1
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSÃO {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Relatório de contraste (WCAG 2.x) dos temas NeonTron CTK
+
+Extrai de cada tipo de widget os pares de cor de frente/fundo (ex:
+text_color sobre fg_color, placeholder_text_color sobre o fundo do
+CTkEntry, text_color_disabled sobre fg_color_disabled) nos dois modos, a
+partir das tabelas do theme_compiler, e calcula a razão de contraste.
+Conversão de cor e luminância são vetorizadas com NumPy sobre lotes de
+arquivos; o resultado de cada arquivo é emitido assim que o lote dele
+termina, de modo que corpora com centenas de temas são processados em
+memória constante.
+
+Mínimos usados:
+    text      4.5  (WCAG AA, texto normal)
+    ui        3.0  (WCAG AA, componentes não textuais)
+    disabled  --min-disabled (padrão 3.0; o WCAG isenta controles
+              desabilitados, o mínimo é uma política do tema)
+
+Uso:
+    python contrast_report.py NEON_TRON.json temas/*.json
+    python contrast_report.py temas/*.json --format jsonl --strict > contraste.jsonl
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from theme_compiler import DEFAULT_CACHE_DIR, ThemeError, load_compiled_theme
+
+try:
+    import numpy as np
+except ImportError:  # O cálculo é vetorizado; main() avisa
+    np = None
+
+MODES = ("light", "dark")
+
+# Fundo de widgets transparentes ou sem fundo próprio (texto de checkbox, switch...)
+PARENT = ("CTkFrame", "fg_color")
+# O mesmo fundo dentro de um frame aninhado (ex: o título de uma seção do
+# showcase), que o CTk desenha com top_fg_color
+NESTED_PARENT = ("CTkFrame", "top_fg_color")
+
+# (tipo de widget, chave da frente, chaves candidatas do fundo, categoria)
+# A primeira chave de fundo presente no tema é usada; PARENT é o frame da seção.
+PAIRINGS: Tuple[Tuple[str, str, Tuple[Any, ...], str], ...] = (
+    ("CTkFrame", "border_color", ("fg_color",), "ui"),
+    ("CTkFrame", "border_color", ("top_fg_color",), "ui"),
+    ("CTkButton", "text_color", ("fg_color",), "text"),
+    ("CTkButton", "text_color", ("hover_color",), "text"),
+    ("CTkButton", "text_color_disabled", ("fg_color_disabled", "fg_color"), "disabled"),
+    ("CTkButton", "fg_color", (PARENT,), "ui"),
+    ("CTkLabel", "text_color", ("fg_color", PARENT), "text"),
+    ("CTkEntry", "text_color", ("fg_color",), "text"),
+    ("CTkEntry", "placeholder_text_color", ("fg_color",), "text"),
+    ("CTkEntry", "border_color", (PARENT,), "ui"),
+    ("CTkCheckBox", "text_color", (PARENT,), "text"),
+    ("CTkCheckBox", "text_color_disabled", (PARENT,), "disabled"),
+    ("CTkCheckBox", "checkmark_color", ("fg_color",), "ui"),
+    ("CTkCheckBox", "border_color", (PARENT,), "ui"),
+    ("CTkSwitch", "text_color", (PARENT,), "text"),
+    ("CTkSwitch", "text_color_disabled", (PARENT,), "disabled"),
+    ("CTkSwitch", "progress_color", (PARENT,), "ui"),
+    ("CTkRadioButton", "text_color", (PARENT,), "text"),
+    ("CTkRadioButton", "text_color_disabled", (PARENT,), "disabled"),
+    ("CTkRadioButton", "border_color", (PARENT,), "ui"),
+    ("CTkProgressBar", "progress_color", ("fg_color",), "ui"),
+    ("CTkSlider", "button_color", ("fg_color",), "ui"),
+    ("CTkOptionMenu", "text_color", ("fg_color",), "text"),
+    ("CTkOptionMenu", "text_color_disabled", ("fg_color",), "disabled"),
+    ("CTkComboBox", "text_color", ("fg_color",), "text"),
+    ("CTkComboBox", "text_color_disabled", ("fg_color",), "disabled"),
+    ("CTkComboBox", "border_color", (PARENT,), "ui"),
+    ("CTkSegmentedButton", "text_color", ("selected_color",), "text"),
+    ("CTkSegmentedButton", "text_color", ("unselected_color",), "text"),
+    ("CTkSegmentedButton", "text_color_disabled", ("unselected_color",), "disabled"),
+    ("CTkTextbox", "text_color", ("fg_color",), "text"),
+    ("CTkTextbox", "border_color", (PARENT,), "ui"),
+    ("CTkScrollbar", "button_color", ("fg_color", PARENT), "ui"),
+    ("DropdownMenu", "text_color", ("fg_color",), "text"),
+    ("DropdownMenu", "text_color", ("hover_color",), "text"),
+)
+# Cada par sobre PARENT é verificado também sobre NESTED_PARENT
+PAIRINGS += tuple(
+    (widget_type, foreground_key, tuple(NESTED_PARENT if key == PARENT else key for key in background_keys), category)
+    for widget_type, foreground_key, background_keys, category in PAIRINGS
+    if PARENT in background_keys
+)
+
+MINIMUMS = {"text": 4.5, "ui": 3.0, "disabled": 3.0}
+
+
+class ColorPair(NamedTuple):
+    """Um par frente/fundo extraído de um tema em um modo"""
+    widget_type: str
+    foreground_key: str
+    background_key: str
+    category: str
+    mode: str
+    foreground: str
+    background: str
+
+
+def _is_rgb(value: Any) -> bool:
+    """Cor #RRGGBB, como o theme_compiler normaliza; nomes do Tk e "transparent" ficam de fora"""
+    return isinstance(value, str) and len(value) == 7 and value.startswith("#")
+
+
+def extract_pairs(compiled: Dict[str, Any]) -> List[ColorPair]:
+    """Pares frente/fundo de um tema compilado, nos dois modos"""
+    pairs = []
+    for mode_index, mode in enumerate(MODES):
+        table = compiled["modes"][mode_index]
+        for widget_type, foreground_key, background_keys, category in PAIRINGS:
+            config = table.get(widget_type)
+            if not config or not _is_rgb(config.get(foreground_key)):
+                continue
+            for candidate in background_keys:
+                if isinstance(candidate, tuple):
+                    parent_type, key = candidate
+                    background, label = table.get(parent_type, {}).get(key), f"{parent_type}.{key}"
+                else:
+                    background, label = config.get(candidate), candidate
+                if _is_rgb(background):
+                    pairs.append(ColorPair(widget_type, foreground_key, label, category, mode,
+                                           config[foreground_key], background))
+                    break
+    return pairs
+
+
+def relative_luminance(colors: Sequence[str]) -> "np.ndarray":
+    """Luminância relativa (WCAG) de cores #RRGGBB, vetorizada"""
+    raw = bytes.fromhex("".join(color[1:] for color in colors))
+    srgb = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3) / 255.0
+    linear = np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+    return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def contrast_ratios(foregrounds: Sequence[str], backgrounds: Sequence[str]) -> "np.ndarray":
+    """Razões de contraste (1 a 21) entre os pares de cores, vetorizadas"""
+    if not foregrounds:
+        return np.empty(0)
+    luminance = relative_luminance(list(foregrounds) + list(backgrounds)).reshape(2, -1)
+    lighter, darker = luminance.max(axis=0), luminance.min(axis=0)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def _chunks(items: Sequence[Path], size: int) -> Iterator[Sequence[Path]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def analyze(paths: Sequence[Path], minimums: Dict[str, float], chunk_size: int = 64,
+            cache_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> Iterator[Dict[str, Any]]:
+    """
+    Analisa os temas em lotes e produz um resultado por arquivo, na ordem recebida
+    
+    Cada lote de chunk_size arquivos é calculado em uma única passada
+    vetorizada; os resultados do lote são emitidos antes do próximo começar.
+    """
+    for chunk in _chunks(paths, chunk_size):
+        loaded: List[Tuple[Path, Any]] = []
+        pairs: List[ColorPair] = []
+        for path in chunk:
+            try:
+                compiled = load_compiled_theme(path, cache_dir)
+            except (OSError, ThemeError) as error:
+                loaded.append((path, error))
+                continue
+            theme_pairs = extract_pairs(compiled)
+            loaded.append((path, (compiled["hash"], len(pairs), len(theme_pairs))))
+            pairs.extend(theme_pairs)
+        
+        ratios = contrast_ratios([pair.foreground for pair in pairs], [pair.background for pair in pairs])
+        required = np.array([minimums[pair.category] for pair in pairs])
+        passes = ratios >= required
+        
+        for path, info in loaded:
+            if isinstance(info, Exception):
+                yield {"file": str(path), "error": str(info)}
+                continue
+            digest, start, count = info
+            results = [
+                dict(pair._asdict(), ratio=round(float(ratios[index]), 2),
+                     minimum=minimums[pair.category], passes=bool(passes[index]))
+                for index, pair in enumerate(pairs[start:start + count], start)
+            ]
+            yield {
+                "file": str(path),
+                "hash": digest,
+                "pairs": results,
+                "failures": sum(not result["passes"] for result in results),
+            }
+
+
+def format_text(report: Dict[str, Any], show_all: bool = False) -> Iterable[str]:
+    """Linhas legíveis de um resultado de analyze()"""
+    if "error" in report:
+        yield f"ERRO {report['error']}"
+        return
+    yield f"{report['file']}: {len(report['pairs'])} pares, {report['failures']} abaixo do mínimo"
+    for pair in report["pairs"]:
+        if show_all or not pair["passes"]:
+            status = "ok  " if pair["passes"] else "FALHA"
+            yield (f"  {status} {pair['mode']:<5} {pair['widget_type']}.{pair['foreground_key']} "
+                   f"{pair['foreground']} sobre {pair['background_key']} {pair['background']}: "
+                   f"{pair['ratio']:.2f}:1 (mín. {pair['minimum']:g}, {pair['category']})")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("themes", nargs="+", type=Path, help="arquivos JSON de tema")
+    parser.add_argument("--format", choices=("text", "jsonl"), default="text", help="formato da saída")
+    parser.add_argument("--all", action="store_true", help="lista também os pares aprovados (text)")
+    parser.add_argument("--min-disabled", type=float, default=MINIMUMS["disabled"],
+                        help="contraste mínimo do texto desabilitado")
+    parser.add_argument("--chunk", type=int, default=64, help="arquivos por lote vetorizado")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="cache do theme_compiler")
+    parser.add_argument("--strict", action="store_true", help="termina com código 1 se algum par falhar")
+    args = parser.parse_args()
+    
+    if np is None:
+        print("ERRO o contrast_report requer o NumPy (pip install numpy)", file=sys.stderr)
+        return 2
+    
+    minimums = dict(MINIMUMS, disabled=args.min_disabled)
+    invalid = failures = 0
+    for report in analyze(args.themes, minimums, max(1, args.chunk), args.cache_dir):
+        if "error" in report:
+            invalid += 1
+        else:
+            failures += report["failures"]
+        if args.format == "jsonl":
+            print(json.dumps(report, ensure_ascii=False), flush=True)
+        else:
+            for line in format_text(report, args.all):
+                print(line, file=sys.stderr if line.startswith("ERRO") else sys.stdout, flush=True)
+    
+    return 1 if invalid or (args.strict and failures) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
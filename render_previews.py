@@ -0,0 +1,691 @@
+#!/usr/bin/env python3
+"""
+Renderizador offline de previews dos temas NeonTron CTK
+
+Gera um PNG do layout do showcase para cada combinação tema × modo, sem
+sessão interativa. Dois backends:
+
+    pillow: aproximação das formas dos widgets desenhada com o Pillow a
+            partir das tabelas do theme_compiler e das specs das seções
+            (showcase_sections); padrão, não exige display
+    xvfb:   o próprio ThemeShowcaseFullHD, em um Xvfb por processo,
+            capturado com ImageGrab (Linux)
+
+As combinações são distribuídas em um pool de processos. O manifest.json
+da pasta de saída guarda o hash do tema de cada PNG; saídas cujo tema não
+mudou são puladas. Ao final, index.html reúne a galeria.
+
+Uso:
+    python render_previews.py NEON_TRON.json temas/*.json --output previews
+    python render_previews.py temas/*.json --backend xvfb --workers 4 --force
+"""
+
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from showcase_sections import (SECTION_LAYOUT, SECTION_TITLES, SELECTED_RADIO, WidgetSpec, section_frame_spec,
+                               section_specs)
+from theme_compiler import DEFAULT_CACHE_DIR, ThemeError, load_compiled_theme
+
+try:
+    from PIL import Image, ImageColor, ImageDraw, ImageFont
+except ImportError:  # Os dois backends precisam do Pillow; main() avisa
+    Image = None
+
+# Versão do desenho; mudar invalida todas as saídas do manifesto
+RENDERER_VERSION = 2
+
+MODES = ("light", "dark")
+DEFAULT_SIZE = (1920, 1080)
+MANIFEST_NAME = "manifest.json"
+
+# Displays dos Xvfb dos workers: :100, :101, ...
+XVFB_DISPLAY_BASE = 100
+
+# Tamanho (largura, altura) dos widgets no CTk 5.x quando a spec não define
+DEFAULT_WIDGET_SIZES: Dict[str, Tuple[int, int]] = {
+    "CTkButton": (140, 28),
+    "CTkLabel": (0, 28),
+    "CTkEntry": (140, 28),
+    "CTkComboBox": (140, 28),
+    "CTkOptionMenu": (140, 28),
+    "CTkCheckBox": (100, 24),
+    "CTkRadioButton": (100, 22),
+    "CTkSwitch": (100, 24),
+    "CTkProgressBar": (200, 8),
+    "CTkSlider": (200, 16),
+    "CTkSegmentedButton": (140, 28),
+    "CTkTextbox": (200, 200),
+    "CTkFrame": (200, 200),
+}
+
+
+class RenderJob(NamedTuple):
+    """Uma combinação tema × modo a renderizar"""
+    name: str
+    theme_path: str
+    compiled: Dict[str, Any]
+    mode: str
+    output: str
+    backend: str
+    size: Tuple[int, int]
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, bold: bool = False) -> Any:
+    """Fonte TrueType comum no sistema, ou a fonte embutida do Pillow"""
+    names = ("DejaVuSans-Bold.ttf", "arialbd.ttf") if bold else ("DejaVuSans.ttf", "arial.ttf")
+    for name in names:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:  # Pillow < 10.1
+        return ImageFont.load_default()
+
+
+def _spec_font(size: int = None, weight: str = None, **kwargs: Any) -> Dict[str, Any]:
+    """Fonte das specs no Pillow: só o tamanho e o peso importam"""
+    return {"size": 13 if size is None else size, "bold": weight == "bold"}
+
+
+def _no_command() -> None:
+    """Comando das specs que pedem um (ex: o botão de recolher)"""
+
+
+def _pad(value: Any) -> Tuple[float, float]:
+    """padx/pady do Tk como (antes, depois)"""
+    if isinstance(value, (tuple, list)):
+        return float(value[0]), float(value[1])
+    return float(value or 0), float(value or 0)
+
+
+class PillowRenderer:
+    """
+    Desenha uma aproximação do layout do showcase com o Pillow
+    
+    As seções vêm das mesmas specs que o showcase instancia
+    (showcase_sections), dispostas por uma versão simplificada do pack e do
+    grid do Tk. As coordenadas são as do showcase em 1920x1080 e são
+    escaladas para o tamanho pedido. Chaves ausentes no tema usam valores
+    neutros.
+    """
+    
+    def __init__(self, compiled: Dict[str, Any], mode: str, size: Tuple[int, int] = DEFAULT_SIZE):
+        self.table = compiled["modes"][MODES.index(mode)]
+        self.mode = mode
+        self.scale = size[0] / DEFAULT_SIZE[0]
+        self.image = Image.new("RGB", size, self.color("CTk", "fg_color", "#000000"))
+        self.draw = ImageDraw.Draw(self.image)
+    
+    def value(self, widget_type: str, key: str, default: Any) -> Any:
+        return self.table.get(widget_type, {}).get(key, default)
+    
+    def color(self, widget_type: str, key: str, default: str, background: str = None,
+              options: Dict[str, Any] = None) -> str:
+        """
+        Cor do tema, ou a das opções da spec quando definida
+        
+        "transparent" vira a cor de fundo e cores que o Pillow não conhece, o padrão.
+        """
+        value = (options or {}).get(key)
+        if value is None:
+            value = self.value(widget_type, key, default)
+        elif isinstance(value, (list, tuple)):
+            value = value[MODES.index(self.mode)]
+        if value == "transparent":
+            return background if background is not None else default
+        try:
+            ImageColor.getrgb(value)
+        except (ValueError, TypeError, AttributeError):
+            return default
+        return value
+    
+    def _s(self, value: float) -> int:
+        return int(round(value * self.scale))
+    
+    def box(self, x0: float, y0: float, x1: float, y1: float, radius: float, fill: str,
+            outline: str = None, width: float = 0) -> None:
+        box = [self._s(x0), self._s(y0), self._s(x1), self._s(y1)]
+        radius = min(self._s(radius), (box[2] - box[0]) // 2, (box[3] - box[1]) // 2)
+        width = max(1, self._s(width)) if width else 0
+        self.draw.rounded_rectangle(box, radius=max(0, radius), fill=fill,
+                                    outline=outline if width else None, width=width)
+    
+    def text(self, x: float, y: float, text: str, fill: str, size: int = 13, bold: bool = False,
+             anchor: str = "lm") -> None:
+        self.draw.text((self._s(x), self._s(y)), text, fill=fill, anchor=anchor,
+                       font=_font(max(6, self._s(size)), bold))
+    
+    # Widgets
+    
+    def frame(self, x0: float, y0: float, x1: float, y1: float, key: str = "fg_color",
+              options: Dict[str, Any] = None) -> str:
+        options = options or {}
+        fill = self.color("CTkFrame", key, "#202020", options=options)
+        self.box(x0, y0, x1, y1, options.get("corner_radius", self.value("CTkFrame", "corner_radius", 6)), fill,
+                 self.color("CTkFrame", "border_color", fill, options=options),
+                 options.get("border_width", self.value("CTkFrame", "border_width", 0)))
+        return fill
+    
+    def label(self, x: float, y: float, text: str, background: str, size: int = 13, bold: bool = False,
+              anchor: str = "lm") -> None:
+        color = self.color("CTkLabel", "text_color", "#DCE4EE", background)
+        lines = text.split("\n")
+        for index, line in enumerate(lines):
+            offset = (index - (len(lines) - 1) / 2) * size * 1.3
+            self.text(x, y + offset, line, color, size, bold, anchor)
+    
+    def button(self, x: float, y: float, w: float, h: float, text: str, disabled: bool = False,
+               options: Dict[str, Any] = None, size: int = 13) -> None:
+        fill = self.color("CTkButton", "fg_color_disabled" if disabled else "fg_color", "#1F6AA5", options=options)
+        self.box(x, y, x + w, y + h, self.value("CTkButton", "corner_radius", 6), fill,
+                 self.color("CTkButton", "border_color", fill), self.value("CTkButton", "border_width", 0))
+        text_color = self.color("CTkButton", "text_color_disabled" if disabled else "text_color", "#DCE4EE")
+        self.text(x + w / 2, y + h / 2, text, text_color, size, anchor="mm")
+    
+    def entry(self, widget_type: str, x: float, y: float, w: float, h: float, text: str,
+              placeholder: bool = False) -> None:
+        fill = self.color(widget_type, "fg_color", "#343638")
+        self.box(x, y, x + w, y + h, self.value(widget_type, "corner_radius", 6), fill,
+                 self.color(widget_type, "border_color", "#565B5E"), self.value(widget_type, "border_width", 2))
+        key = "placeholder_text_color" if placeholder else "text_color"
+        self.text(x + 10, y + h / 2, text, self.color(widget_type, key, "#DCE4EE"))
+        if widget_type == "CTkComboBox":
+            self.box(x + w - h, y, x + w, y + h, self.value(widget_type, "corner_radius", 6),
+                     self.color(widget_type, "button_color", "#565B5E"))
+    
+    def option_menu(self, x: float, y: float, w: float, h: float, text: str) -> None:
+        radius = self.value("CTkOptionMenu", "corner_radius", 6)
+        self.box(x, y, x + w, y + h, radius, self.color("CTkOptionMenu", "fg_color", "#1F6AA5"))
+        self.box(x + w - h, y, x + w, y + h, radius, self.color("CTkOptionMenu", "button_color", "#144870"))
+        self.text(x + 10, y + h / 2, text, self.color("CTkOptionMenu", "text_color", "#DCE4EE"))
+    
+    def checkbox(self, x: float, y: float, text: str, checked: bool, background: str,
+                 disabled: bool = False) -> None:
+        size = 24
+        border = self.color("CTkCheckBox", "border_color", "#3E454A")
+        fill = self.color("CTkCheckBox", "fg_color", "#1F6AA5") if checked else background
+        self.box(x, y, x + size, y + size, self.value("CTkCheckBox", "corner_radius", 6), fill,
+                 border, self.value("CTkCheckBox", "border_width", 3))
+        if checked:
+            mark = self.color("CTkCheckBox", "checkmark_color", "#DCE4EE")
+            points = [(x + 6, y + 12), (x + 10, y + 17), (x + 18, y + 7)]
+            self.draw.line([(self._s(px), self._s(py)) for px, py in points], fill=mark, width=max(1, self._s(3)))
+        key = "text_color_disabled" if disabled else "text_color"
+        self.text(x + size + 8, y + size / 2, text, self.color("CTkCheckBox", key, "#DCE4EE", background))
+    
+    def radio(self, x: float, y: float, text: str, checked: bool, background: str,
+              disabled: bool = False) -> None:
+        size = 22
+        key = "border_width_checked" if checked else "border_width_unchecked"
+        color = (self.color("CTkRadioButton", "fg_color", "#1F6AA5") if checked
+                 else self.color("CTkRadioButton", "border_color", "#3E454A"))
+        self.box(x, y, x + size, y + size, size / 2, background, color, self.value("CTkRadioButton", key, 3))
+        key = "text_color_disabled" if disabled else "text_color"
+        self.text(x + size + 8, y + size / 2, text, self.color("CTkRadioButton", key, "#DCE4EE", background))
+    
+    def switch(self, x: float, y: float, text: str, on: bool, background: str, disabled: bool = False) -> None:
+        w, h = 36, 18
+        radius = self.value("CTkSwitch", "corner_radius", 1000)
+        self.box(x, y, x + w, y + h, radius, self.color("CTkSwitch", "fg_color", "#4A4D50"))
+        if on:
+            self.box(x, y, x + w, y + h, radius, self.color("CTkSwitch", "progress_color", "#1F6AA5"))
+        knob = x + w - h if on else x
+        self.box(knob + 2, y + 2, knob + h - 2, y + h - 2, radius, self.color("CTkSwitch", "button_color", "#D5D9DE"))
+        key = "text_color_disabled" if disabled else "text_color"
+        self.text(x + w + 10, y + h / 2, text, self.color("CTkSwitch", key, "#DCE4EE", background))
+    
+    def progress(self, x: float, y: float, w: float, value: float) -> None:
+        h = 8
+        radius = self.value("CTkProgressBar", "corner_radius", 1000)
+        self.box(x, y, x + w, y + h, radius, self.color("CTkProgressBar", "fg_color", "#4A4D50"))
+        self.box(x, y, x + w * value, y + h, radius, self.color("CTkProgressBar", "progress_color", "#1F6AA5"))
+    
+    def slider(self, x: float, y: float, w: float, value: float) -> None:
+        h = 16
+        radius = self.value("CTkSlider", "corner_radius", 1000)
+        self.box(x, y + 4, x + w, y + h - 4, radius, self.color("CTkSlider", "fg_color", "#4A4D50"))
+        self.box(x, y + 4, x + w * value, y + h - 4, radius, self.color("CTkSlider", "progress_color", "#AAB0B5"))
+        knob = x + w * value
+        self.box(knob - h / 2, y, knob + h / 2, y + h, self.value("CTkSlider", "button_corner_radius", 1000),
+                 self.color("CTkSlider", "button_color", "#1F6AA5"))
+    
+    def segmented(self, x: float, y: float, w: float, h: float, values: List[str], selected: int) -> None:
+        radius = self.value("CTkSegmentedButton", "corner_radius", 6)
+        self.box(x, y, x + w, y + h, radius, self.color("CTkSegmentedButton", "fg_color", "#4A4D50"))
+        part = w / len(values)
+        for index, text in enumerate(values):
+            key = "selected_color" if index == selected else "unselected_color"
+            self.box(x + index * part + 2, y + 2, x + (index + 1) * part - 2, y + h - 2, radius,
+                     self.color("CTkSegmentedButton", key, "#1F6AA5"))
+            self.text(x + (index + 0.5) * part, y + h / 2, text,
+                      self.color("CTkSegmentedButton", "text_color", "#DCE4EE"), anchor="mm")
+    
+    def textbox(self, x: float, y: float, w: float, h: float, lines: List[str]) -> None:
+        self.box(x, y, x + w, y + h, self.value("CTkTextbox", "corner_radius", 6),
+                 self.color("CTkTextbox", "fg_color", "#1D1E1E"),
+                 self.color("CTkTextbox", "border_color", "#565B5E"), self.value("CTkTextbox", "border_width", 0))
+        for index, line in enumerate(lines):
+            if 16 + index * 20 > h - 8:
+                break
+            self.text(x + 10, y + 16 + index * 20, line, self.color("CTkTextbox", "text_color", "#DCE4EE"))
+    
+    # Specs
+    
+    def measure(self, spec: WidgetSpec) -> Tuple[float, float]:
+        """Tamanho pedido por uma spec, como o Tk calcularia (aproximado)"""
+        options = spec.options or {}
+        width, height = DEFAULT_WIDGET_SIZES.get(spec.widget_type, (0, 0))
+        width, height = options.get("width", width), options.get("height", height)
+        font = options.get("font") or _spec_font()
+        text = str(options.get("text", ""))
+        text_width = max(len(line) for line in text.split("\n")) * font["size"] * 0.6
+        if spec.widget_type == "CTkLabel":
+            width = max(width, text_width + 8)
+            height = max(height, (text.count("\n") + 1) * font["size"] * 1.3)
+        elif spec.widget_type in ("CTkCheckBox", "CTkRadioButton", "CTkSwitch"):
+            width = max(width, 50 + text_width)
+        if spec.children:
+            # Com filhos, o frame assume o pedido deles (pack_propagate); as
+            # dimensões explícitas ficam como mínimo, já que o showcase
+            # desliga a propagação em alguns frames (ex: bordered_frame)
+            children_width, children_height = self._requested(spec.children)
+            width = max(options.get("width", 0), children_width)
+            height = max(options.get("height", 0), children_height)
+        return width, height
+    
+    def _requested(self, specs: Tuple[WidgetSpec, ...]) -> Tuple[float, float]:
+        grid = [spec for spec in specs if spec.layout[0] == "grid"]
+        if grid:
+            columns, rows = self._grid_tracks(grid)
+            return sum(columns.values()), sum(rows.values())
+        stacked_width = stacked_height = side_width = side_height = 0.0
+        for spec in specs:
+            width, height = self.measure(spec)
+            kwargs = spec.layout[1]
+            width += sum(_pad(kwargs.get("padx")))
+            height += sum(_pad(kwargs.get("pady")))
+            if kwargs.get("side", "top") in ("left", "right"):
+                side_width += width
+                side_height = max(side_height, height)
+            else:
+                stacked_width = max(stacked_width, width)
+                stacked_height += height
+        return side_width + stacked_width, max(side_height, stacked_height)
+    
+    def _grid_tracks(self, specs: List[WidgetSpec]) -> Tuple[Dict[int, float], Dict[int, float]]:
+        """Largura de cada coluna e altura de cada linha de um grid"""
+        columns: Dict[int, float] = {}
+        rows: Dict[int, float] = {}
+        for spec in specs:
+            kwargs = spec.layout[1]
+            width, height = self.measure(spec)
+            column, row = kwargs.get("column", 0), kwargs.get("row", 0)
+            columns[column] = max(columns.get(column, 0.0), width + sum(_pad(kwargs.get("padx"))))
+            rows[row] = max(rows.get(row, 0.0), height + sum(_pad(kwargs.get("pady"))))
+        return dict(sorted(columns.items())), dict(sorted(rows.items()))
+    
+    def place(self, specs: Tuple[WidgetSpec, ...], x0: float, y0: float, x1: float, y1: float,
+              background: str, frame_key: str) -> None:
+        """
+        Dispõe as specs dentro da caixa de um frame e as desenha
+        
+        Args:
+            background: Cor visível do frame (fundo de textos e transparências)
+            frame_key: Chave de cor do frame ("fg_color", "top_fg_color",
+                "transparent" ou "custom"), que decide a cor dos frames filhos
+        """
+        grid = [spec for spec in specs if spec.layout[0] == "grid"]
+        if grid:
+            columns, rows = self._grid_tracks(grid)
+            column_x = dict(zip(columns, [x0 + sum(list(columns.values())[:i]) for i in range(len(columns))]))
+            row_y = dict(zip(rows, [y0 + sum(list(rows.values())[:i]) for i in range(len(rows))]))
+            for spec in grid:
+                kwargs = spec.layout[1]
+                column, row = kwargs.get("column", 0), kwargs.get("row", 0)
+                left, right = _pad(kwargs.get("padx"))
+                top, bottom = _pad(kwargs.get("pady"))
+                cell = (column_x[column] + left, row_y[row] + top,
+                        column_x[column] + columns[column] - right, row_y[row] + rows[row] - bottom)
+                self._align(spec, cell, kwargs.get("sticky", ""), background, frame_key)
+            return
+        
+        # Cavidade do packer do Tk: cada spec ocupa uma faixa do espaço restante
+        sizes = [self.measure(spec) for spec in specs]
+        for index, (spec, (width, height)) in enumerate(zip(specs, sizes)):
+            kwargs = spec.layout[1]
+            side = kwargs.get("side", "top")
+            horizontal = side in ("left", "right")
+            left, right = _pad(kwargs.get("padx"))
+            top, bottom = _pad(kwargs.get("pady"))
+            parcel = (width + left + right) if horizontal else (height + top + bottom)
+            if kwargs.get("expand"):
+                parcel += self._expansion(specs[index:], sizes[index:], (x1 - x0) if horizontal else (y1 - y0),
+                                          horizontal)
+            if side == "left":
+                box, x0 = (x0, y0, x0 + parcel, y1), x0 + parcel
+            elif side == "right":
+                box, x1 = (x1 - parcel, y0, x1, y1), x1 - parcel
+            elif side == "bottom":
+                box, y1 = (x0, y1 - parcel, x1, y1), y1 - parcel
+            else:
+                box, y0 = (x0, y0, x1, y0 + parcel), y0 + parcel
+            cell = (box[0] + left, box[1] + top, box[2] - right, box[3] - bottom)
+            fill = kwargs.get("fill", "none")
+            sticky = {"x": "ew", "y": "ns", "both": "nsew"}.get(fill, "")
+            anchor = kwargs.get("anchor", "center")
+            if anchor != "center":
+                sticky += "".join(side for side in anchor if side not in sticky)
+            self._align(spec, cell, sticky, background, frame_key)
+    
+    @staticmethod
+    def _expansion(specs: Tuple[WidgetSpec, ...], sizes: List[Tuple[float, float]], cavity: float,
+                   horizontal: bool) -> float:
+        """
+        Espaço extra de uma spec com expand=True, como XExpansion/YExpansion do Tk
+        
+        O espaço livre é dividido entre as specs expansíveis restantes na
+        mesma direção, sem invadir o que as da outra direção ainda pedem.
+        """
+        axis, pad = (0, "padx") if horizontal else (1, "pady")
+        minimum = cavity
+        expanders = 0
+        for spec, size in zip(specs, sizes):
+            kwargs = spec.layout[1]
+            child = size[axis] + sum(_pad(kwargs.get(pad)))
+            if (kwargs.get("side", "top") in ("left", "right")) != horizontal:
+                if expanders:
+                    minimum = min(minimum, (cavity - child) / expanders)
+            else:
+                cavity -= child
+                if kwargs.get("expand"):
+                    expanders += 1
+        if expanders:
+            minimum = min(minimum, cavity / expanders)
+        return max(0.0, minimum)
+    
+    def _align(self, spec: WidgetSpec, cell: Tuple[float, float, float, float], sticky: str,
+               background: str, frame_key: str) -> None:
+        """Posiciona a spec na célula como o sticky do grid (centralizada por padrão)"""
+        x0, y0, x1, y1 = cell
+        width, height = self.measure(spec)
+        width, height = min(width, x1 - x0), min(height, y1 - y0)
+        if "w" in sticky and "e" in sticky:
+            x, width = x0, x1 - x0
+        elif "w" in sticky:
+            x = x0
+        elif "e" in sticky:
+            x = x1 - width
+        else:
+            x = (x0 + x1 - width) / 2
+        if "n" in sticky and "s" in sticky:
+            y, height = y0, y1 - y0
+        elif "n" in sticky:
+            y = y0
+        elif "s" in sticky:
+            y = y1 - height
+        else:
+            y = (y0 + y1 - height) / 2
+        self.draw_spec(spec, x, y, width, height, background, frame_key)
+    
+    def draw_spec(self, spec: WidgetSpec, x: float, y: float, w: float, h: float,
+                  background: str, frame_key: str) -> None:
+        """Desenha uma spec (e os filhos) na caixa dada"""
+        options = spec.options or {}
+        widget_type = spec.widget_type
+        value = spec.value
+        disabled = options.get("state") == "disabled"
+        font = options.get("font") or _spec_font()
+        
+        if widget_type == "CTkFrame":
+            # Mesma regra do CTkFrame: aninhado em um frame com fg_color, usa top_fg_color
+            fg_color = options.get("fg_color")
+            if fg_color == "transparent":
+                fill, key = background, "transparent"
+            elif fg_color is not None:
+                fill, key = self.frame(x, y, x + w, y + h, options=options), "custom"
+            else:
+                key = "top_fg_color" if frame_key == "fg_color" else "fg_color"
+                fill = self.frame(x, y, x + w, y + h, key, options)
+            self.place(spec.children, x, y, x + w, y + h, fill, key)
+        elif widget_type == "CTkLabel":
+            self.label(x + w / 2, y + h / 2, str(options.get("text", "")), background, font["size"], font["bold"],
+                       anchor="mm")
+        elif widget_type == "CTkButton":
+            self.button(x, y, w, h, str(options.get("text", "")), disabled, options, font["size"])
+        elif widget_type in ("CTkEntry", "CTkComboBox"):
+            if value is None and widget_type == "CTkEntry":
+                self.entry(widget_type, x, y, w, h, options.get("placeholder_text", ""), placeholder=True)
+            else:
+                text = "*" * len(value) if options.get("show") else value
+                self.entry(widget_type, x, y, w, h, text)
+        elif widget_type == "CTkOptionMenu":
+            self.option_menu(x, y, w, h, value if value is not None else (options.get("values") or [""])[0])
+        elif widget_type == "CTkCheckBox":
+            self.checkbox(x, y + (h - 24) / 2, options.get("text", ""), bool(value), background, disabled)
+        elif widget_type == "CTkRadioButton":
+            self.radio(x, y + (h - 22) / 2, options.get("text", ""), options.get("value") == SELECTED_RADIO,
+                       background, disabled)
+        elif widget_type == "CTkSwitch":
+            self.switch(x, y + (h - 18) / 2, options.get("text", ""), bool(value), background, disabled)
+        elif widget_type == "CTkProgressBar":
+            self.progress(x, y + (h - 8) / 2, w, 0.5 if value is None else value)
+        elif widget_type == "CTkSlider":
+            low, high = options.get("from_", 0), options.get("to", 1)
+            position = 0.5 if value is None else (value - low) / (high - low)
+            self.slider(x, y + (h - 16) / 2, w, position)
+        elif widget_type == "CTkSegmentedButton":
+            values = options.get("values") or [""]
+            self.segmented(x, y, w, h, values, values.index(value) if value in values else -1)
+        elif widget_type == "CTkTextbox":
+            self.textbox(x, y, w, h, (value or "").split("\n"))
+    
+    # Layout do showcase
+    
+    def render(self) -> Any:
+        width, height = DEFAULT_SIZE
+        # Container principal (pack com padx/pady 20 na janela)
+        self.frame(20, 20, width - 20, height - 20)
+        
+        # Header, aninhado no container
+        header = self.frame(20, 20, width - 20, 80, key="top_fg_color")
+        self.label(40, 50, "🎨 NEON TRON CTK - Full HD", header, size=32, bold=True)
+        self.label(width - 220, 50, "Modo Claro" if self.mode == "light" else "Modo Escuro", header, size=16)
+        self.switch(width - 110, 41, "", self.mode == "dark", header)
+        
+        # Grid 3x3 com as seções, como em ThemeShowcaseFullHD.create_sections()
+        grid_x0, grid_y0, grid_x1, grid_y1 = 20, 100, width - 20, height - 30
+        grid = self.frame(grid_x0, grid_y0, grid_x1, grid_y1, key="top_fg_color")
+        cell_w = (grid_x1 - grid_x0) / 3
+        cell_h = (grid_y1 - grid_y0) / 3
+        
+        for name, (row, col, colspan) in SECTION_LAYOUT.items():
+            title, icon = SECTION_TITLES[name]
+            # Todas as seções abertas, com o botão de recolher, como no backend xvfb
+            spec = section_frame_spec(title, icon, _spec_font, ("grid", dict(padx=10, pady=10, sticky="nsew")),
+                                      content=tuple(section_specs(name, _spec_font)), collapse=_no_command)
+            cell = (grid_x0 + col * cell_w + 10, grid_y0 + row * cell_h + 10,
+                    grid_x0 + (col + colspan) * cell_w - 10, grid_y0 + (row + 1) * cell_h - 10)
+            self.draw_spec(spec, *cell[:2], cell[2] - cell[0], cell[3] - cell[1], grid, "top_fg_color")
+        return self.image
+
+
+def render_pillow(job: RenderJob) -> Any:
+    return PillowRenderer(job.compiled, job.mode, job.size).render()
+
+
+def render_xvfb(job: RenderJob) -> Any:
+    """Renderiza o showcase real no display do worker e captura a janela"""
+    from PIL import ImageGrab
+    from benchmarks._harness import load_showcase, settle
+    
+    showcase = load_showcase()
+    # O modo do CTk é global ao processo; cada job parte do modo inicial do ThemeManager
+    showcase.ctk.set_appearance_mode("dark")
+    app = showcase.ThemeShowcaseFullHD(theme_path=Path(job.theme_path))
+    try:
+        width, height = job.size
+        app.geometry(f"{width}x{height}+0+0")
+        app.set_mode(job.mode)
+        app.build_all_sections()
+        settle(app)
+        app.update()
+        x, y = app.winfo_rootx(), app.winfo_rooty()
+        return ImageGrab.grab(bbox=(x, y, x + width, y + height), xdisplay=os.environ.get("DISPLAY"))
+    finally:
+        app.destroy()
+
+
+def render_job(job: RenderJob) -> str:
+    """Executado no worker: renderiza e grava o PNG"""
+    render = render_xvfb if job.backend == "xvfb" else render_pillow
+    image = render(job)
+    output = Path(job.output)
+    tmp = output.with_suffix(".tmp.png")
+    image.save(tmp, optimize=True)
+    os.replace(tmp, output)
+    return job.output
+
+
+def _init_worker(counter: Any, backend: str) -> None:
+    """Cada worker do backend xvfb ganha o próprio Xvfb, sem janelas sobrepostas"""
+    if backend != "xvfb":
+        return
+    from benchmarks._harness import ensure_display
+    with counter.get_lock():
+        counter.value += 1
+        number = counter.value
+    if sys.platform.startswith("linux"):
+        os.environ.pop("DISPLAY", None)
+    ensure_display(f":{XVFB_DISPLAY_BASE + number}")
+
+
+def load_manifest(output_dir: Path) -> Dict[str, Any]:
+    try:
+        manifest = json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest.get("outputs", {}) if manifest.get("renderer") == RENDERER_VERSION else {}
+
+
+def write_gallery(output_dir: Path, themes: List[Tuple[str, str]], outputs: Dict[str, Any]) -> None:
+    """Grava index.html com uma linha por tema e uma coluna por modo"""
+    rows = []
+    for name, digest in themes:
+        cells = []
+        for mode in MODES:
+            file_name = f"{name}-{mode}.png"
+            if file_name in outputs:
+                cells.append(f'<td><a href="{html.escape(file_name)}"><img src="{html.escape(file_name)}" '
+                             f'alt="{html.escape(name)} {mode}" loading="lazy"></a></td>')
+            else:
+                cells.append("<td>(falhou)</td>")
+        rows.append(f"<tr><th>{html.escape(name)}<br><code>{digest[:12]}</code></th>{''.join(cells)}</tr>")
+    
+    page = (
+        "<!DOCTYPE html>\n<html lang=\"pt-BR\">\n<head>\n<meta charset=\"utf-8\">\n"
+        "<title>NEON TRON CTK - Previews</title>\n"
+        "<style>body{font-family:sans-serif;background:#111;color:#ddd}"
+        "table{border-collapse:collapse}td,th{padding:8px;border:1px solid #333;vertical-align:top}"
+        "img{width:480px}</style>\n</head>\n<body>\n<h1>Previews dos temas</h1>\n"
+        "<table>\n<tr><th>Tema</th>" + "".join(f"<th>{mode}</th>" for mode in MODES) + "</tr>\n"
+        + "\n".join(rows) + "\n</table>\n</body>\n</html>\n"
+    )
+    (output_dir / "index.html").write_text(page, encoding="utf-8")
+
+
+def parse_size(value: str) -> Tuple[int, int]:
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"tamanho inválido: {value!r} (use LARGURAxALTURA)") from error
+    return width, height
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("themes", nargs="+", type=Path, help="arquivos JSON de tema")
+    parser.add_argument("--output", type=Path, default=Path("previews"), help="pasta de saída")
+    parser.add_argument("--backend", choices=("pillow", "xvfb"), default="pillow", help="forma de renderização")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processos em paralelo")
+    parser.add_argument("--size", type=parse_size, default=DEFAULT_SIZE, help="LARGURAxALTURA (padrão 1920x1080)")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="cache do theme_compiler")
+    parser.add_argument("--force", action="store_true", help="renderiza mesmo o que não mudou")
+    args = parser.parse_args()
+    
+    if Image is None:
+        print("ERRO o render_previews requer o Pillow (pip install pillow)", file=sys.stderr)
+        return 2
+    
+    args.output.mkdir(parents=True, exist_ok=True)
+    previous = {} if args.force else load_manifest(args.output)
+    outputs: Dict[str, Any] = {}
+    themes: List[Tuple[str, str]] = []
+    jobs: List[RenderJob] = []
+    failed = False
+    
+    for path in args.themes:
+        name = path.stem
+        if any(name == seen for seen, _ in themes):
+            print(f"ERRO {path}: outro tema já usa o nome {name!r}", file=sys.stderr)
+            failed = True
+            continue
+        try:
+            compiled = load_compiled_theme(path, args.cache_dir)
+        except (OSError, ThemeError) as error:
+            print(f"ERRO {error}", file=sys.stderr)
+            failed = True
+            continue
+        themes.append((name, compiled["hash"]))
+        
+        for mode in MODES:
+            file_name = f"{name}-{mode}.png"
+            entry = {"theme": str(path), "hash": compiled["hash"], "backend": args.backend,
+                     "size": list(args.size)}
+            if previous.get(file_name) == entry and (args.output / file_name).exists():
+                outputs[file_name] = entry
+                continue
+            jobs.append(RenderJob(name, str(path), compiled, mode, str(args.output / file_name),
+                                  args.backend, args.size))
+    
+    skipped = len(outputs)
+    if jobs:
+        counter = multiprocessing.Value("i", 0)
+        workers = max(1, min(args.workers or 1, len(jobs)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(counter, args.backend)) as pool:
+            futures = {pool.submit(render_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                file_name = Path(job.output).name
+                try:
+                    future.result()
+                except Exception as error:
+                    print(f"ERRO {file_name}: {error}", file=sys.stderr)
+                    failed = True
+                    continue
+                outputs[file_name] = {"theme": job.theme_path, "hash": job.compiled["hash"],
+                                      "backend": job.backend, "size": list(job.size)}
+                print(f"{file_name}: ok", file=sys.stderr)
+    
+    manifest = {"renderer": RENDERER_VERSION, "outputs": outputs}
+    (args.output / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_gallery(args.output, themes, outputs)
+    print(f"{len(outputs) - skipped} renderizados, {skipped} sem mudança, galeria em {args.output / 'index.html'}")
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
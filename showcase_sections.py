@@ -0,0 +1,274 @@
+"""
+Seções do showcase NeonTron CTK como dados
+
+Descreve o frame e o conteúdo das sete seções do ThemeShowcaseFullHD como
+árvores de WidgetSpec, sem depender do Tk: o showcase as instancia com o
+WidgetFactory, e o render_previews desenha os previews a partir delas.
+
+As fontes vêm de uma função font(size=..., weight=...) passada por quem
+usa as specs (ex: FontPool.get no showcase).
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class WidgetSpec(NamedTuple):
+    """
+    Descrição declarativa de um widget, instanciada pelo WidgetFactory
+    
+    Exemplo:
+        WidgetSpec("CTkButton", {"text": "OK", "width": 140},
+                   ("grid", {"row": 0, "column": 0, "padx": 5}))
+    """
+    
+    widget_type: str
+    # Opções do construtor/configure(); valores None ficam no padrão do tipo
+    options: Optional[Dict[str, Any]] = None
+    # Gerenciador de geometria ("pack", "grid" ou "place") e seus argumentos
+    layout: Tuple[str, Dict[str, Any]] = ("pack", {})
+    children: Tuple["WidgetSpec", ...] = ()
+    # Estado do widget (texto de entry/textbox, marcado, seleção de set()...)
+    value: Any = None
+    # Nome do widget no dicionário refs de WidgetFactory.build()
+    name: Optional[str] = None
+
+
+# Título e ícone de cada seção, no frame da seção e no cabeçalho recolhido
+SECTION_TITLES: Dict[str, Tuple[str, str]] = {
+    "buttons": ("Botões", "🔘"),
+    "input": ("Entrada", "✏️"),
+    "selection": ("Seleção", "☑️"),
+    "sliders": ("Controles", "🎚️"),
+    "switches": ("Switches", "🔀"),
+    "display": ("Display", "🖼️"),
+    "advanced": ("Showcase Avançado", "⚡"),
+}
+
+# Célula de cada seção no grid 3x3: (linha, coluna, colunas ocupadas)
+SECTION_LAYOUT: Dict[str, Tuple[int, int, int]] = {
+    "buttons": (0, 0, 1),
+    "input": (0, 1, 1),
+    "selection": (0, 2, 1),
+    "sliders": (1, 0, 1),
+    "switches": (1, 1, 1),
+    "display": (1, 2, 1),
+    "advanced": (2, 0, 3),
+}
+
+# Valor inicial da variável dos radio buttons da seção de seleção
+SELECTED_RADIO = 1
+
+FontFactory = Callable[..., Any]
+
+
+def section_frame_spec(title: str, icon: str, font: FontFactory, layout: Tuple[str, Dict[str, Any]],
+                       content: Tuple[WidgetSpec, ...] = (), collapse: Callable[[], None] = None) -> WidgetSpec:
+    """
+    Frame padronizado de uma seção
+    
+    Args:
+        title, icon: Título da seção (ver SECTION_TITLES)
+        font: Cria as fontes das opções
+        layout: Posição do frame no grid do showcase
+        content: Specs do conteúdo, dentro do frame de conteúdo (name="content")
+        collapse: Comando do botão de recolher; sem ele, o título fica sozinho
+    """
+    title_specs = [
+        WidgetSpec("CTkLabel", {"text": f"{icon} {title}", "font": font(size=18, weight="bold")},
+                   ("pack", {"side": "left"})),
+    ]
+    if collapse is not None:
+        title_specs.append(
+            WidgetSpec("CTkButton", {"text": "▾", "width": 32, "height": 28, "command": collapse},
+                       ("pack", {"side": "right"}))
+        )
+    
+    return WidgetSpec("CTkFrame", None, layout, (
+        # Título da seção
+        WidgetSpec("CTkFrame", {"height": 40}, ("pack", dict(fill="x", padx=15, pady=(10, 5))),
+                   tuple(title_specs)),
+        # Content frame
+        WidgetSpec("CTkFrame", {"fg_color": "transparent"},
+                   ("pack", dict(fill="both", expand=True, padx=15, pady=10)), tuple(content), name="content"),
+    ))
+
+
+def section_specs(name: str, font: FontFactory, radio_var: Any = None) -> List[WidgetSpec]:
+    """
+    Conteúdo de uma seção, a instanciar no frame de conteúdo
+    
+    Args:
+        name: Seção de SECTION_TITLES
+        font: Cria as fontes das opções
+        radio_var: Variável dos radio buttons de "selection" (valor inicial
+            SELECTED_RADIO); sem ela, a opção fica no padrão
+    """
+    return _SECTIONS[name](font, radio_var)
+
+
+def _buttons(font: FontFactory, radio_var: Any) -> List[WidgetSpec]:
+    buttons = [
+        ("Normal", None, "normal", 0, 0),
+        ("Hover Me", None, "normal", 0, 1),
+        ("Desabilitado", None, "disabled", 1, 0),
+        ("🚀 Ícone", None, "normal", 1, 1),
+        ("Grande", font(size=16), "normal", 2, 0),
+        ("Pequeno", font(size=11), "normal", 2, 1)
+    ]
+    return [
+        WidgetSpec("CTkButton", dict(text=text, font=button_font, state=state, width=140, height=35),
+                   ("grid", dict(row=r, column=c, padx=5, pady=5, sticky="ew")))
+        for text, button_font, state, r, c in buttons
+    ]
+
+
+def _input(font: FontFactory, radio_var: Any) -> List[WidgetSpec]:
+    packed = ("pack", {"pady": 5})
+    return [
+        # Entry
+        WidgetSpec("CTkEntry", {"placeholder_text": "Digite algo...", "width": 280}, packed),
+        # Entry preenchido
+        WidgetSpec("CTkEntry", {"width": 280}, packed, value="Texto preenchido"),
+        # ComboBox
+        WidgetSpec("CTkComboBox", {"values": ["Opção 1", "Opção 2", "Opção 3"], "width": 280}, packed,
+                   value="Opção 1"),
+        # TextBox menor
+        WidgetSpec("CTkTextbox", {"width": 280, "height": 120}, packed,
+                   value="Área de texto multilinha\ncom tema customizado\naplicado!"),
+    ]
+
+
+def _selection(font: FontFactory, radio_var: Any) -> List[WidgetSpec]:
+    checks = [
+        ("Marcado", True, "normal"),
+        ("Desmarcado", False, "normal"),
+        ("Desabilitado", True, "disabled")
+    ]
+    return [
+        # Checkboxes
+        WidgetSpec("CTkFrame", {"fg_color": "transparent"},
+                   ("pack", dict(side="left", fill="both", expand=True)), tuple(
+            WidgetSpec("CTkCheckBox", {"text": text, "state": state}, ("pack", dict(pady=5, anchor="w")),
+                       value=checked)
+            for text, checked, state in checks
+        )),
+        # Radio buttons
+        WidgetSpec("CTkFrame", {"fg_color": "transparent"},
+                   ("pack", dict(side="right", fill="both", expand=True)), tuple(
+            WidgetSpec("CTkRadioButton", {"text": text, "variable": radio_var, "value": i},
+                       ("pack", dict(pady=5, anchor="w")))
+            for i, text in enumerate(["Opção 1", "Opção 2", "Opção 3"], 1)
+        )),
+        # Option Menu
+        WidgetSpec("CTkOptionMenu", {"values": ["Menu 1", "Menu 2", "Menu 3"], "width": 280},
+                   ("pack", {"pady": 10}), value="Menu 1"),
+    ]
+
+
+def _sliders(font: FontFactory, radio_var: Any) -> List[WidgetSpec]:
+    return [
+        # Progress bars com diferentes valores
+        *(WidgetSpec("CTkProgressBar", {"width": 280}, ("pack", {"pady": 8}), value=value)
+          for value in [0.3, 0.6, 0.9]),
+        # Sliders, com o valor ao lado (o showcase liga o comando pelo name)
+        *(WidgetSpec("CTkFrame", {"fg_color": "transparent"}, ("pack", dict(pady=8, fill="x")), (
+            WidgetSpec("CTkSlider", {"from_": 0, "to": 100, "width": 230}, ("pack", {"side": "left"}),
+                       value=25 + i * 50, name=f"slider_{i}"),
+            WidgetSpec("CTkLabel", {"text": f"{25 + i * 50}"}, ("pack", dict(side="left", padx=10)),
+                       name=f"slider_{i}_value"),
+        )) for i in range(2)),
+    ]
+
+
+def _switches(font: FontFactory, radio_var: Any) -> List[WidgetSpec]:
+    switches_config = [
+        ("Notificações", True, "normal"),
+        ("Som do Sistema", False, "normal"),
+        ("Modo Noturno Auto", True, "normal"),
+        ("Sincronização", False, "normal"),
+        ("Desabilitado", False, "disabled")
+    ]
+    return [
+        WidgetSpec("CTkSwitch", {"text": text, "state": state}, ("pack", dict(pady=8, anchor="w")),
+                   value=selected)
+        for text, selected, state in switches_config
+    ]
+
+
+def _display(font: FontFactory, radio_var: Any) -> List[WidgetSpec]:
+    return [
+        # Segmented button
+        WidgetSpec("CTkSegmentedButton", {"values": ["Tab 1", "Tab 2", "Tab 3"], "width": 280},
+                   ("pack", {"pady": 10}), value="Tab 2"),
+        # Frame com borda (altura fixa: o showcase desliga o pack_propagate)
+        WidgetSpec("CTkFrame", {"border_width": 2, "border_color": ["#B0B0B0", "#007080"], "height": 100},
+                   ("pack", dict(fill="x", pady=10)), (
+            WidgetSpec("CTkLabel", {"text": "Frame com Borda\nCustomizada", "font": font(size=14)},
+                       ("pack", {"expand": True})),
+        ), name="bordered_frame"),
+        # Labels com diferentes estilos
+        *(WidgetSpec("CTkLabel", {"text": text, "font": font(size=size)}, ("pack", {"pady": 5}))
+          for text, size in [("Label Normal", 14), ("Label Grande", 18), ("Label Pequeno", 11)]),
+    ]
+
+
+def _advanced(font: FontFactory, radio_var: Any) -> List[WidgetSpec]:
+    column = ("pack", dict(side="left", fill="both", expand=True, padx=10))
+    packed = ("pack", {"pady": 5})
+    bold = font(size=14, weight="bold")
+    
+    # Botões em diferentes estados
+    btn_states = [
+        ("✓ Sucesso", "#2ECC71"),
+        ("⚠ Aviso", "#F39C12"),
+        ("✗ Erro", "#E74C3C")
+    ]
+    
+    # Três colunas
+    return [
+        # Coluna 1: Combinações de widgets
+        WidgetSpec("CTkFrame", {"fg_color": "transparent"}, column, (
+            WidgetSpec("CTkLabel", {"text": "Formulário Demo", "font": bold}, packed),
+            # Mini formulário
+            WidgetSpec("CTkFrame", None, ("pack", dict(fill="x", pady=5)), tuple(
+                spec
+                for idx, field in enumerate(["Nome:", "Email:", "Senha:"])
+                for spec in (
+                    WidgetSpec("CTkLabel", {"text": field, "width": 80},
+                               ("grid", dict(row=idx, column=0, padx=5, pady=5, sticky="e"))),
+                    WidgetSpec("CTkEntry", {"width": 180, "show": "*" if field == "Senha:" else None},
+                               ("grid", dict(row=idx, column=1, padx=5, pady=5))),
+                )
+            )),
+        )),
+        # Coluna 2: Estados e variações
+        WidgetSpec("CTkFrame", {"fg_color": "transparent"}, column, (
+            WidgetSpec("CTkLabel", {"text": "Estados dos Widgets", "font": bold}, packed),
+            *(WidgetSpec("CTkButton", {"text": text, "fg_color": color, "hover_color": color, "width": 200}, packed)
+              for text, color in btn_states),
+        )),
+        # Coluna 3: Informações do tema
+        WidgetSpec("CTkFrame", {"fg_color": "transparent"}, column, (
+            WidgetSpec("CTkLabel", {"text": "Informações do Tema", "font": bold}, packed),
+            WidgetSpec("CTkTextbox", {"width": 250, "height": 150, "state": "disabled"}, packed, value=(
+                "🎨 Tema Customizado Aplicado\n\n"
+                "✓ Cores principais: #00D1D1\n"
+                "✓ Modo Light/Dark dinâmico\n"
+                "✓ Bordas arredondadas: 6px\n"
+                "✓ Hover effects customizados\n"
+                "✓ Estados disabled incluídos\n\n"
+                "Todos os widgets CTk suportados!"
+            )),
+        )),
+    ]
+
+
+_SECTIONS: Dict[str, Callable[[FontFactory, Any], List[WidgetSpec]]] = {
+    "buttons": _buttons,
+    "input": _input,
+    "selection": _selection,
+    "sliders": _sliders,
+    "switches": _switches,
+    "display": _display,
+    "advanced": _advanced,
+}
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Compilador de temas NeonTron CTK
+
+Transforma um tema JSON (no formato do NEON_TRON.json) em um artefato
+compilado: validado, com cores hexadecimais normalizadas e com as tabelas
+de kwargs já resolvidas por modo, prontas para o ThemeManager.
+
+O artefato é guardado em cache, indexado pelo hash do conteúdo do JSON.
+Enquanto o arquivo não muda, carregar o tema é só ler o artefato; qualquer
+alteração no conteúdo gera um novo hash e o tema é recompilado.
+
+Uso:
+    python theme_compiler.py NEON_TRON.json temas/*.json [--strict]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Versão do formato do artefato; mudar invalida todos os caches
+COMPILER_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(__file__).with_name(".theme_cache")
+
+HEX_COLOR_PATTERN = re.compile(r"#(?:[0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})")
+
+# Chaves lidas pelo CustomTkinter 5.x a partir do tema (ver assets/themes/blue.json).
+# Usadas quando o customtkinter não está instalado; com ele instalado, os
+# parâmetros dos construtores de cada widget também são aceitos.
+CTK_THEME_KEYS: Dict[str, Tuple[str, ...]] = {
+    "CTk": ("fg_color",),
+    "CTkToplevel": ("fg_color",),
+    "CTkFrame": ("corner_radius", "border_width", "fg_color", "top_fg_color", "border_color"),
+    "CTkButton": ("corner_radius", "border_width", "fg_color", "hover_color", "border_color",
+                  "text_color", "text_color_disabled"),
+    "CTkLabel": ("corner_radius", "fg_color", "text_color"),
+    "CTkEntry": ("corner_radius", "border_width", "fg_color", "border_color", "text_color",
+                 "placeholder_text_color"),
+    "CTkCheckBox": ("corner_radius", "border_width", "fg_color", "border_color", "hover_color",
+                    "checkmark_color", "text_color", "text_color_disabled"),
+    "CTkSwitch": ("corner_radius", "border_width", "button_length", "fg_color", "progress_color",
+                  "button_color", "button_hover_color", "text_color", "text_color_disabled"),
+    "CTkRadioButton": ("corner_radius", "border_width_checked", "border_width_unchecked", "fg_color",
+                       "border_color", "hover_color", "text_color", "text_color_disabled"),
+    "CTkProgressBar": ("corner_radius", "border_width", "fg_color", "progress_color", "border_color"),
+    "CTkSlider": ("corner_radius", "button_corner_radius", "border_width", "button_length", "fg_color",
+                  "progress_color", "button_color", "button_hover_color"),
+    "CTkOptionMenu": ("corner_radius", "fg_color", "button_color", "button_hover_color", "text_color",
+                      "text_color_disabled"),
+    "CTkComboBox": ("corner_radius", "border_width", "fg_color", "border_color", "button_color",
+                    "button_hover_color", "text_color", "text_color_disabled"),
+    "CTkScrollbar": ("corner_radius", "border_spacing", "fg_color", "button_color", "button_hover_color"),
+    "CTkSegmentedButton": ("corner_radius", "border_width", "fg_color", "selected_color",
+                           "selected_hover_color", "unselected_color", "unselected_hover_color",
+                           "text_color", "text_color_disabled"),
+    "CTkTextbox": ("corner_radius", "border_width", "fg_color", "border_color", "text_color",
+                   "scrollbar_button_color", "scrollbar_button_hover_color"),
+    "CTkScrollableFrame": ("label_fg_color",),
+    "DropdownMenu": ("fg_color", "hover_color", "text_color"),
+    "CTkFont": ("family", "size", "weight"),
+}
+
+# Nomes antigos aceitos pelo CustomTkinter
+RENAMED_TYPES = {"CTkCheckbox": "CTkCheckBox", "CTkRadiobutton": "CTkRadioButton"}
+
+PLATFORM_KEY = "macOS" if sys.platform == "darwin" else "Windows" if sys.platform.startswith("win") else "Linux"
+
+_schema: Optional[Dict[str, frozenset]] = None
+
+
+class ThemeError(ValueError):
+    """Tema com estrutura inválida"""
+
+
+def theme_schema() -> Dict[str, frozenset]:
+    """
+    Retorna as chaves conhecidas por tipo de widget
+    
+    Combina as chaves de tema do CustomTkinter com os parâmetros dos
+    construtores dos widgets, quando o customtkinter está disponível.
+    """
+    global _schema
+    if _schema is None:
+        schema = {widget_type: set(keys) for widget_type, keys in CTK_THEME_KEYS.items()}
+        try:
+            import inspect
+            import customtkinter as ctk
+        except ImportError:
+            ctk = None
+        if ctk is not None:
+            for widget_type, keys in schema.items():
+                widget_class = getattr(ctk, widget_type, None)
+                if widget_class is None:
+                    continue
+                for name, parameter in inspect.signature(widget_class.__init__).parameters.items():
+                    if name not in ("self", "master") and parameter.kind not in (
+                            parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+                        keys.add(name)
+        _schema = {widget_type: frozenset(keys) for widget_type, keys in schema.items()}
+    return _schema
+
+
+def normalize_color(value: Any) -> Any:
+    """Normaliza cores hexadecimais para #RRGGBB maiúsculo; outros valores passam direto"""
+    if isinstance(value, str) and value.startswith("#") and HEX_COLOR_PATTERN.fullmatch(value):
+        if len(value) == 4:
+            value = "#" + "".join(char * 2 for char in value[1:])
+        return value.upper()
+    return value
+
+
+def parse_theme(theme_data: Any, source: str = "<tema>") -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Valida e normaliza um tema já decodificado do JSON
+    
+    Args:
+        theme_data: Conteúdo do JSON
+        source: Nome do arquivo, usado nas mensagens
+    
+    Returns:
+        (tema normalizado, avisos sobre tipos e chaves desconhecidos)
+    
+    Raises:
+        ThemeError: Se o tema não tiver a estrutura esperada
+    """
+    if not isinstance(theme_data, dict):
+        raise ThemeError(f"{source}: o tema deve ser um objeto JSON")
+    
+    schema = theme_schema()
+    normalized: Dict[str, Any] = {}
+    errors: List[str] = []
+    warnings: List[str] = []
+    
+    for widget_type, config in theme_data.items():
+        widget_type = RENAMED_TYPES.get(widget_type, widget_type)
+        if isinstance(config, dict) and PLATFORM_KEY in config:
+            # Valores por plataforma, como o CTkFont dos temas embutidos
+            config = config[PLATFORM_KEY]
+        if not isinstance(config, dict):
+            errors.append(f"{widget_type}: esperado um objeto com as configurações")
+            continue
+        
+        known_keys = schema.get(widget_type)
+        if known_keys is None:
+            warnings.append(f"{widget_type}: tipo de widget desconhecido")
+        
+        entries: Dict[str, Any] = {}
+        for key, value in config.items():
+            if isinstance(value, list) and len(value) != 2:
+                errors.append(f"{widget_type}.{key}: listas devem ter 2 valores [light, dark]")
+                continue
+            for item in value if isinstance(value, list) else [value]:
+                if not isinstance(item, (str, int, float)):
+                    errors.append(f"{widget_type}.{key}: valor inválido {item!r}")
+                elif isinstance(item, str) and item.startswith("#") and not HEX_COLOR_PATTERN.fullmatch(item):
+                    errors.append(f"{widget_type}.{key}: cor hexadecimal inválida {item!r}")
+            if known_keys is not None and key not in known_keys:
+                warnings.append(f"{widget_type}.{key}: chave desconhecida")
+            if isinstance(value, list):
+                entries[key] = [normalize_color(item) for item in value]
+            else:
+                entries[key] = normalize_color(value)
+        normalized[widget_type] = entries
+    
+    if errors:
+        raise ThemeError(f"{source}: tema inválido\n" + "\n".join(errors))
+    
+    return normalized, warnings
+
+
+def resolve_mode_tables(theme_data: Dict[str, Any]) -> Tuple[List[Dict[str, Dict[str, Any]]],
+                                                             List[Dict[str, Dict[str, Any]]]]:
+    """
+    Resolve os valores por modo de um tema válido
+    
+    Returns:
+        (tabelas, deltas): para cada modo (0 = light, 1 = dark), os kwargs
+        por tipo de widget e, nos deltas, apenas as chaves que mudam entre
+        os modos. Tipos sem nenhuma diferença ficam fora dos deltas.
+    """
+    tables: List[Dict[str, Dict[str, Any]]] = [{}, {}]
+    for widget_type, config in theme_data.items():
+        for mode, table in enumerate(tables):
+            table[widget_type] = {
+                key: value[mode] if isinstance(value, list) and len(value) == 2 else value
+                for key, value in config.items()
+            }
+    
+    deltas: List[Dict[str, Dict[str, Any]]] = [{}, {}]
+    for widget_type in theme_data:
+        light, dark = tables[0][widget_type], tables[1][widget_type]
+        changed = [key for key in light if light[key] != dark[key]]
+        if changed:
+            deltas[0][widget_type] = {key: light[key] for key in changed}
+            deltas[1][widget_type] = {key: dark[key] for key in changed}
+    
+    return tables, deltas
+
+
+def diff_themes(old: Dict[str, Any], new: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Compara dois temas normalizados chave a chave
+    
+    Returns:
+        Pares (tipo de widget, chave) adicionados, removidos ou alterados,
+        em ordem
+    """
+    changed = []
+    for widget_type in sorted(set(old) | set(new)):
+        old_config, new_config = old.get(widget_type, {}), new.get(widget_type, {})
+        for key in sorted(set(old_config) | set(new_config)):
+            if key not in old_config or key not in new_config or old_config[key] != new_config[key]:
+                changed.append((widget_type, key))
+    return changed
+
+
+def content_hash(raw: bytes) -> str:
+    """Hash do conteúdo do tema, incluindo a versão do compilador e do esquema"""
+    try:
+        import customtkinter
+        ctk_version = customtkinter.__version__
+    except ImportError:
+        ctk_version = "none"
+    digest = hashlib.sha256(raw)
+    digest.update(f"|compiler={COMPILER_VERSION}|ctk={ctk_version}".encode())
+    return digest.hexdigest()
+
+
+def compile_theme(raw: bytes, source: str = "<tema>") -> Dict[str, Any]:
+    """
+    Compila o conteúdo bruto de um tema JSON
+    
+    Returns:
+        Artefato compilado com as chaves version, hash, source, theme,
+        modes, deltas e warnings
+    
+    Raises:
+        ThemeError: Se o JSON for inválido ou o tema tiver estrutura inválida
+    """
+    try:
+        theme_data = json.loads(raw)
+    except ValueError as error:
+        raise ThemeError(f"{source}: JSON inválido: {error}") from error
+    
+    theme, warnings = parse_theme(theme_data, source)
+    modes, deltas = resolve_mode_tables(theme)
+    return {
+        "version": COMPILER_VERSION,
+        "hash": content_hash(raw),
+        "source": source,
+        "theme": theme,
+        "modes": modes,
+        "deltas": deltas,
+        "warnings": warnings,
+    }
+
+
+def load_compiled_theme(path: Path, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> Dict[str, Any]:
+    """
+    Carrega um tema, usando o artefato em cache quando o conteúdo não mudou
+    
+    Args:
+        path: Arquivo JSON do tema
+        cache_dir: Diretório do cache (None desativa o cache)
+    
+    Raises:
+        ThemeError: Se o tema for inválido
+    """
+    path = Path(path)
+    raw = path.read_bytes()
+    if cache_dir is None:
+        return compile_theme(raw, str(path))
+    
+    key = content_hash(raw)
+    cache_file = Path(cache_dir) / f"{key}.json"
+    try:
+        with open(cache_file, "r", encoding="utf-8") as file:
+            compiled = json.load(file)
+        # JSON válido que não é um artefato (ex: lista) conta como cache ausente
+        if (isinstance(compiled, dict) and compiled.get("version") == COMPILER_VERSION
+                and compiled.get("hash") == key):
+            return compiled
+    except (OSError, ValueError):
+        pass
+    
+    compiled = compile_theme(raw, str(path))
+    _write_atomic(cache_file, compiled)
+    return compiled
+
+
+def _write_atomic(cache_file: Path, compiled: Dict[str, Any]) -> None:
+    """Grava o artefato via arquivo temporário + rename; falhas de escrita só desativam o cache"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(compiled, file, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        pass
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("themes", nargs="+", type=Path, help="arquivos JSON de tema")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="diretório do cache")
+    parser.add_argument("--strict", action="store_true", help="trata avisos como erros")
+    args = parser.parse_args()
+    
+    failed = False
+    for path in args.themes:
+        try:
+            compiled = load_compiled_theme(path, args.cache_dir)
+        except (OSError, ThemeError) as error:
+            print(f"ERRO {error}", file=sys.stderr)
+            failed = True
+            continue
+        for warning in compiled["warnings"]:
+            print(f"AVISO {path}: {warning}", file=sys.stderr)
+        failed = failed or (args.strict and bool(compiled["warnings"]))
+        print(f"{path}: {compiled['hash'][:12]}")
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())